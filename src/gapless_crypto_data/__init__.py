@@ -45,6 +45,9 @@ Usage:
     # Fill gaps in existing data
     results = gcd.fill_gaps("./data")
 
+    # Validate every file in a directory on all cores
+    results = gcd.validate_directory("./data")
+
     # Class-based API (for complex workflows)
     from gapless_crypto_data import BinancePublicDataCollector, UniversalGapFiller
 
@@ -56,6 +59,7 @@ CLI Usage:
     uv run gapless-crypto-data --symbol SOLUSDT --timeframes 1s,1m,5m,1h,4h,1d
     uv run gapless-crypto-data --symbol BTCUSDT --timeframes 1s,6h,8h,12h,1d
     uv run gapless-crypto-data --fill-gaps --directory ./data
+    uv run gapless-crypto-data validate --directory ./data
 
 Supported Symbols (USDT Spot Only):
     BTCUSDT, ETHUSDT, SOLUSDT, ADAUSDT, DOTUSDT, LINKUSDT, MATICUSDT,
@@ -76,8 +80,11 @@ from .api import (
     get_supported_intervals,
     get_supported_symbols,
     get_supported_timeframes,
+    load_arrow,
     load_parquet,
+    save_arrow,
     save_parquet,
+    validate_directory,
 )
 from .collectors.binance_public_data_collector import BinancePublicDataCollector
 from .gap_filling.safe_file_operations import AtomicCSVOperations, SafeCSVMerger
@@ -91,9 +98,12 @@ __all__ = [
     "get_supported_timeframes",
     "get_supported_intervals",  # Legacy compatibility
     "fill_gaps",
+    "validate_directory",
     "get_info",
     "save_parquet",
     "load_parquet",
+    "save_arrow",
+    "load_arrow",
     # Advanced class-based API (for complex workflows)
     "BinancePublicDataCollector",
     "UniversalGapFiller",
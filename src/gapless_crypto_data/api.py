@@ -19,14 +19,29 @@ Examples:
     df = gcd.download("ETHUSDT", "4h", start="2024-01-01", end="2024-06-30")
 """
 
+import contextlib
+import io
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 
 from .collectors.binance_public_data_collector import BinancePublicDataCollector
 from .gap_filling.universal_gap_filler import UniversalGapFiller
+from .storage import (
+    UNFILLABLE_GAP_MAX_AGE,
+    DatasetCatalog,
+    read_arrow_ipc,
+    read_parquet_range,
+    write_arrow_ipc,
+    write_partitioned_parquet,
+)
+from .validation.cache import load_cached_validation
 
 
 def get_supported_symbols() -> List[str]:
@@ -241,12 +256,25 @@ def download(
     )
 
 
-def fill_gaps(directory: Union[str, Path], symbols: Optional[List[str]] = None) -> dict:
+def fill_gaps(
+    directory: Union[str, Path], symbols: Optional[List[str]] = None, max_workers: int = 4
+) -> dict:
     """Fill gaps in existing CSV data files.
 
+    Files are looked up in the directory's dataset catalog, which records each
+    file's symbol and timeframe. The catalog is reconciled with the directory on
+    lookup when files were added, renamed or removed, so files added later are
+    processed too; CSV names without a symbol and timeframe token (e.g.
+    results.csv) are skipped with a warning.
+    Files are processed concurrently and share one REST API rate budget; each
+    file is still rewritten atomically. A file that cannot be processed is
+    reported with an "error" entry in its file result and counted in
+    files_failed; the other files are still processed.
+
     Args:
         directory: Directory containing CSV files to process
         symbols: Optional list of symbols to process (default: all found)
+        max_workers: Maximum files processed concurrently (1 = sequential)
 
     Returns:
         dict: Gap filling results with statistics
@@ -257,48 +285,195 @@ def fill_gaps(directory: Union[str, Path], symbols: Optional[List[str]] = None)
 
         # Fill gaps for specific symbols
         results = fill_gaps("./data", symbols=["BTCUSDT", "ETHUSDT"])
+
+        # Process up to 16 files at a time
+        results = fill_gaps("./data", max_workers=16)
     """
     gap_filler = UniversalGapFiller()
     target_dir = Path(directory)
 
-    # Find CSV files
-    csv_files = list(target_dir.glob("*.csv"))
-    if symbols:
-        # Filter by specified symbols
-        csv_files = [f for f in csv_files if any(symbol in f.name for symbol in symbols)]
+    # Find cataloged CSV datasets
+    datasets = []
+    if target_dir.is_dir():
+        datasets = DatasetCatalog.for_directory(target_dir).find(symbols=symbols, format="csv")
 
     results = {
         "files_processed": 0,
         "gaps_detected": 0,
         "gaps_filled": 0,
+        "gaps_unfillable": 0,
+        "files_failed": 0,
         "success_rate": 0.0,
         "file_results": {},
     }
 
-    for csv_file in csv_files:
-        # Extract timeframe from filename
-        timeframe = "1h"  # Default
-        for tf in ["1s", "1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "8h", "12h", "1d"]:
-            if f"-{tf}_" in csv_file.name or f"-{tf}-" in csv_file.name:
-                timeframe = tf
-                break
-
-        # Process file
-        file_result = gap_filler.process_file(csv_file, timeframe)
-        results["file_results"][csv_file.name] = file_result
+    file_results = gap_filler.process_files(
+        [(dataset.path, dataset.timeframe) for dataset in datasets], max_workers=max_workers
+    )
+    for dataset, file_result in zip(datasets, file_results):
+        results["file_results"][dataset.path.name] = file_result
         results["files_processed"] += 1
         results["gaps_detected"] += file_result["gaps_detected"]
         results["gaps_filled"] += file_result["gaps_filled"]
-
-    # Calculate overall success rate
-    if results["gaps_detected"] > 0:
-        results["success_rate"] = (results["gaps_filled"] / results["gaps_detected"]) * 100
+        results["gaps_unfillable"] += file_result.get("gaps_unfillable", 0)
+        if "error" in file_result:
+            results["files_failed"] += 1
+
+    # Calculate overall success rate (confirmed exchange outages cannot be filled)
+    fillable_gaps = results["gaps_detected"] - results["gaps_unfillable"]
+    if fillable_gaps > 0:
+        results["success_rate"] = (results["gaps_filled"] / fillable_gaps) * 100
     else:
         results["success_rate"] = 100.0
 
     return results
 
 
+def _validate_file(csv_path: str, symbol: str, timeframe: str) -> Dict[str, Any]:
+    """Process pool worker: validate one file, keeping its report off the console."""
+    csv_filepath = Path(csv_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        collector = BinancePublicDataCollector(symbol=symbol, output_dir=csv_filepath.parent)
+        return collector.validate_csv_file(csv_filepath, timeframe, use_cache=False)
+
+
+def _validation_error_result(csv_path: Path, error: Exception) -> Dict[str, Any]:
+    """Validation result for a file whose validation raised."""
+    return {
+        "file_path": str(csv_path),
+        "total_errors": 1,
+        "total_warnings": 0,
+        "validation_summary": f"ERROR - {error}",
+    }
+
+
+def validate_directory(
+    directory: Union[str, Path],
+    symbols: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> dict:
+    """Validate every CSV data file in a directory.
+
+    Files are looked up in the directory's dataset catalog after reconciling it
+    with the directory, so CSVs added since the catalog was built are validated
+    too; CSV names without a symbol and timeframe token are skipped with a
+    warning. Files whose stored validation still matches (see
+    BinancePublicDataCollector.validate_csv_file) are answered from their
+    metadata; the rest are validated in a process pool, largest first, and
+    every new result - including validations that raised - is written back to
+    the metadata files and the catalog. Results without a cache_key (errors)
+    are never answered from the cache, so those files are validated again.
+
+    Args:
+        directory: Directory containing CSV files to validate
+        symbols: Optional list of symbols to validate (default: all found)
+        max_workers: Worker processes (default: CPU count, 1 = in this process)
+        use_cache: Reuse stored results for unchanged files
+
+    Returns:
+        dict: Aggregated counts and the validation results of each file
+
+    Examples:
+        # Validate a whole archive on all cores
+        results = validate_directory("./data")
+
+        # Revalidate two symbols from scratch
+        results = validate_directory("./data", symbols=["BTCUSDT", "ETHUSDT"], use_cache=False)
+    """
+    started_ns = time.time_ns()
+    target_dir = Path(directory)
+
+    results = {
+        "files_validated": 0,
+        "files_cached": 0,
+        "files_passed": 0,
+        "files_failed": 0,
+        "total_errors": 0,
+        "total_warnings": 0,
+        "file_results": {},
+    }
+    if not target_dir.is_dir():
+        return results
+
+    # find() reconciles the catalog first when the directory listing changed
+    catalog = DatasetCatalog.for_directory(target_dir)
+    datasets = catalog.find(symbols=symbols, format="csv")
+    outages = {}
+    for unfillable_gap in catalog.find_unfillable_gaps(max_age=UNFILLABLE_GAP_MAX_AGE):
+        outages.setdefault((unfillable_gap.symbol, unfillable_gap.timeframe), []).append(
+            unfillable_gap
+        )
+
+    file_results = {}
+    pending = []
+    for dataset in datasets:
+        cached = None
+        if use_cache:
+            cached = load_cached_validation(
+                dataset.path,
+                dataset.timeframe,
+                outages.get((dataset.symbol, dataset.timeframe), []),
+            )
+        if cached is None:
+            pending.append(dataset)
+        else:
+            file_results[dataset.path] = cached
+            results["files_cached"] += 1
+
+    # Largest files first so one big file does not leave the other workers idle at the end
+    pending.sort(key=lambda dataset: dataset.path.stat().st_size, reverse=True)
+    worker_count = max_workers or os.cpu_count() or 1
+    if worker_count == 1 or len(pending) <= 1:
+        for dataset in pending:
+            try:
+                file_results[dataset.path] = _validate_file(
+                    str(dataset.path), dataset.symbol, dataset.timeframe
+                )
+            except Exception as e:
+                file_results[dataset.path] = _validation_error_result(dataset.path, e)
+    elif pending:
+        # Spawned workers: forking a process that runs catalog or HTTP threads can deadlock
+        with ProcessPoolExecutor(
+            max_workers=min(worker_count, len(pending)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _validate_file, str(dataset.path), dataset.symbol, dataset.timeframe
+                ): dataset
+                for dataset in pending
+            }
+            for future in as_completed(futures):
+                dataset = futures[future]
+                try:
+                    file_results[dataset.path] = future.result()
+                except Exception as e:
+                    file_results[dataset.path] = _validation_error_result(dataset.path, e)
+
+    collector = BinancePublicDataCollector(output_dir=target_dir)
+    validated_paths = {dataset.path for dataset in pending}
+    for dataset in datasets:
+        file_result = file_results[dataset.path]
+        # Save every new report and cache keys refreshed by re-hashing a touched file
+        if (
+            dataset.path in validated_paths
+            or file_result.get("cache_key", {}).get("recorded_ns", 0) >= started_ns
+        ):
+            collector.update_metadata_with_validation(dataset.path, file_result)
+
+        results["file_results"][dataset.path.name] = file_result
+        results["files_validated"] += 1
+        results["total_errors"] += file_result["total_errors"]
+        results["total_warnings"] += file_result["total_warnings"]
+        if file_result["total_errors"] == 0:
+            results["files_passed"] += 1
+        else:
+            results["files_failed"] += 1
+
+    return results
+
+
 def get_info() -> dict:
     """Get library information and capabilities.
 
@@ -355,6 +530,9 @@ def get_supported_intervals() -> List[str]:
 def save_parquet(df: pd.DataFrame, path: str) -> None:
     """Save DataFrame to Parquet format with optimized compression.
 
+    Rows are sorted by date and written as one row group per calendar month
+    (per day for sub-3-minute data) so load_parquet() can skip unneeded row groups.
+
     Args:
         df: DataFrame to save
         path: Output file path (should end with .parquet)
@@ -371,14 +549,25 @@ def save_parquet(df: pd.DataFrame, path: str) -> None:
     if df is None or df.empty:
         raise ValueError("Cannot save empty DataFrame to Parquet")
 
-    df.to_parquet(path, engine="pyarrow", compression="snappy", index=False)
+    write_partitioned_parquet(df, path)
 
 
-def load_parquet(path: str) -> pd.DataFrame:
-    """Load DataFrame from Parquet file.
+def load_parquet(
+    path: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Load DataFrame from Parquet file, optionally restricted to a time range and columns.
+
+    When start/end are given, row group date statistics are used to read only the
+    row groups overlapping the range, so the I/O cost follows the range size.
 
     Args:
         path: Parquet file path
+        start: Inclusive start date/time (e.g., "2024-01-01")
+        end: Inclusive end date/time; a date-only value covers the whole day
+        columns: Columns to load (default: all columns)
 
     Returns:
         DataFrame with original structure and data types
@@ -390,5 +579,58 @@ def load_parquet(path: str) -> pd.DataFrame:
     Examples:
         >>> df = load_parquet("btc_data.parquet")
         >>> print(f"Loaded {len(df)} bars")
+
+        >>> # One week of closes from a multi-year file
+        >>> week = load_parquet(
+        ...     "btc_1m.parquet", start="2024-03-04", end="2024-03-10", columns=["date", "close"]
+        ... )
+    """
+    return read_parquet_range(path, start=start, end=end, columns=columns)
+
+
+def save_arrow(df: pd.DataFrame, path: str, compression: Optional[str] = None) -> None:
+    """Save DataFrame to Arrow IPC (Feather v2) format for memory-mapped loading.
+
+    Args:
+        df: DataFrame to save
+        path: Output file path (should end with .arrow)
+        compression: None for uncompressed zero-copy files (default) or "lz4"
+
+    Raises:
+        ValueError: If DataFrame is empty or compression is not supported
+
+    Examples:
+        >>> df = fetch_data("BTCUSDT", "1m", start="2024-01-01", end="2024-12-31")
+        >>> save_arrow(df, "btc_1m.arrow")
+    """
+    if df is None or df.empty:
+        raise ValueError("Cannot save empty DataFrame to Arrow IPC")
+
+    write_arrow_ipc(df, path, compression=compression)
+
+
+def load_arrow(
+    path: str, columns: Optional[List[str]] = None, memory_map: bool = True
+) -> pd.DataFrame:
+    """Load DataFrame from an Arrow IPC file through a memory map.
+
+    Uncompressed files are mapped rather than read, so repeated loads and concurrent
+    processes share the OS page cache instead of each parsing their own copy.
+
+    Args:
+        path: Arrow IPC file path (e.g., written with output_format="arrow")
+        columns: Columns to load (default: all columns)
+        memory_map: Map the file instead of reading it into process memory
+
+    Returns:
+        DataFrame with original structure and data types
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ArrowInvalid: If file is not a valid Arrow IPC file
+
+    Examples:
+        >>> df = load_arrow("binance_spot_BTCUSDT-1m_20240101-20241231_v2.10.0.arrow")
+        >>> closes = load_arrow("btc_1m.arrow", columns=["date", "close"])
     """
-    return pd.read_parquet(path, engine="pyarrow")
+    return read_arrow_ipc(path, columns=columns, memory_map=memory_map)
@@ -9,7 +9,8 @@ Gap filling is automatic by default during collection - no manual intervention r
 
 Usage:
     uv run gapless-crypto-data [--symbol SYMBOL] [--timeframes TF1,TF2,...] [--start DATE] [--end DATE] [--output-dir DIR]
-    uv run gapless-crypto-data --fill-gaps [--directory DIR]
+    uv run gapless-crypto-data --fill-gaps [--directory DIR] [--workers N]
+    uv run gapless-crypto-data validate [--directory DIR] [--workers N] [--no-cache]
 
 Examples:
     # Default: SOLUSDT, all timeframes, 4.1-year coverage with automatic gap filling
@@ -29,18 +30,28 @@ Examples:
 
     # Manual gap filling for existing data files
     uv run gapless-crypto-data --fill-gaps --directory ./data
+
+    # Gap-fill a large directory with 16 files in flight
+    uv run gapless-crypto-data --fill-gaps --directory ./data --workers 16
+
+    # Validate every file in a directory on all cores (unchanged files come from metadata)
+    uv run gapless-crypto-data validate --directory ./data
+
+    # Append only new bars to previously collected files
+    uv run gapless-crypto-data --symbol BTCUSDT --timeframes 1h --end 2025-09-30 --update
 """
 
 import argparse
-import re
 import sys
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any
 
 from . import __version__
+from .api import validate_directory as validate_data_directory
 from .collectors.binance_public_data_collector import BinancePublicDataCollector
 from .gap_filling.universal_gap_filler import UniversalGapFiller
 from .resume import IntelligentCheckpointManager
+from .storage import DatasetCatalog
 
 # Streaming module removed - use standard pandas processing
 from .utils import (
@@ -49,26 +60,6 @@ from .utils import (
 )
 
 
-def parse_filename_metadata(filename: str) -> Optional[dict]:
-    """
-    Parse standardized filename to extract symbol and timeframe.
-
-    Expected format: binance_spot_{SYMBOL}-{TIMEFRAME}_{START}-{END}_{VERSION}.csv
-    Example: binance_spot_BTCUSDT-1h_20240101-20240101_v2.5.0.csv
-
-    Returns:
-        dict with 'symbol' and 'timeframe' keys, or None if parsing fails
-    """
-    pattern = r"binance_spot_([A-Z]+)-([0-9]+[mhd])_\d{8}-\d{8}_v[\d.]+\.csv$"
-    match = re.match(pattern, filename)
-
-    if match:
-        symbol, timeframe = match.groups()
-        return {"symbol": symbol, "timeframe": timeframe}
-
-    return None
-
-
 def add_collection_arguments(parser: argparse.ArgumentParser) -> None:
     """Add standard collection arguments to a parser. Eliminates argument duplication."""
     parser.add_argument(
@@ -91,6 +82,11 @@ def add_collection_arguments(parser: argparse.ArgumentParser) -> None:
         "--output-dir",
         help="Output directory for CSV files (created automatically if doesn't exist, default: src/gapless_crypto_data/sample_data/)",
     )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Incrementally append bars after the last saved bar of existing files in --output-dir",
+    )
     parser.add_argument(
         "--resume",
         action="store_true",
@@ -206,6 +202,9 @@ def collect_data(command_line_args: Any) -> int:
         checkpoint_manager = IntelligentCheckpointManager(
             cache_dir=command_line_args.checkpoint_dir,
             verbose=1 if len(requested_symbols) > 3 else 0,
+            symbols=requested_symbols,
+            timeframes=requested_timeframes,
+            collection_params=collection_params,
         )
 
         if command_line_args.clear_checkpoints:
@@ -228,12 +227,14 @@ def collect_data(command_line_args: Any) -> int:
 
         # Update symbols list based on resume plan
         symbols_to_process = resume_plan["remaining_symbols"]
+        timeframes_to_process = resume_plan["remaining_timeframes"]
         symbols_in_progress = resume_plan.get("symbols_in_progress", {})
 
         # Save collection parameters to checkpoint
         checkpoint_manager.save_checkpoint({"collection_parameters": collection_params})
     else:
         symbols_to_process = requested_symbols
+        timeframes_to_process = dict.fromkeys(requested_symbols, requested_timeframes)
         symbols_in_progress = {}
         print("🚀 Gapless Crypto Data Collection")
 
@@ -257,6 +258,9 @@ def collect_data(command_line_args: Any) -> int:
     # Process each symbol
     for symbol_index, symbol in enumerate(symbols_to_process, 1):
         print(f"\nProcessing {symbol} ({symbol_index}/{len(symbols_to_process)})...")
+        symbol_timeframes = timeframes_to_process[symbol]
+        if len(symbol_timeframes) < len(requested_timeframes):
+            print(f"  ♻️  Resuming with remaining timeframes: {symbol_timeframes}")
 
         if checkpoint_manager:
             checkpoint_manager.mark_symbol_start(symbol, requested_timeframes)
@@ -270,23 +274,32 @@ def collect_data(command_line_args: Any) -> int:
                 output_dir=command_line_args.output_dir,
             )
 
-            # Collect data (22x faster than API)
-            collection_results = data_collector.collect_multiple_timeframes(requested_timeframes)
+            # Checkpoint each timeframe as soon as its file is written
+            collection_results = {}
+            for trading_timeframe in symbol_timeframes:
+                if command_line_args.update:
+                    # Only download bars newer than the last saved bar of each file
+                    timeframe_result = data_collector.update(trading_timeframe)
+                else:
+                    # Collect data (22x faster than API)
+                    timeframe_result = data_collector.collect_timeframe_data(trading_timeframe)
+                if not timeframe_result or not timeframe_result["filepath"]:
+                    continue
+
+                csv_file_path = timeframe_result["filepath"]
+                collection_results[trading_timeframe] = csv_file_path
+                file_size_mb = csv_file_path.stat().st_size / (1024 * 1024)
+                print(f"  ✅ {trading_timeframe}: {csv_file_path.name} ({file_size_mb:.1f} MB)")
 
-            if collection_results:
+                if checkpoint_manager:
+                    checkpoint_manager.mark_timeframe_complete(
+                        symbol, trading_timeframe, csv_file_path, file_size_mb
+                    )
+
+            if collection_results or not symbol_timeframes:
                 all_results[symbol] = collection_results
                 total_datasets += len(collection_results)
 
-                # Show results for this symbol and update checkpoints
-                for trading_timeframe, csv_file_path in collection_results.items():
-                    file_size_mb = csv_file_path.stat().st_size / (1024 * 1024)
-                    print(f"  ✅ {trading_timeframe}: {csv_file_path.name} ({file_size_mb:.1f} MB)")
-
-                    if checkpoint_manager:
-                        checkpoint_manager.mark_timeframe_complete(
-                            symbol, trading_timeframe, csv_file_path, file_size_mb
-                        )
-
                 # Mark symbol as completed
                 if checkpoint_manager:
                     checkpoint_manager.mark_symbol_complete(symbol)
@@ -315,17 +328,23 @@ def collect_data(command_line_args: Any) -> int:
     if checkpoint_manager:
         progress_summary = checkpoint_manager.get_progress_summary()
         total_datasets = progress_summary["total_datasets"]
+        completed_symbols = progress_summary["completed_symbols"]
 
         # Export progress report for analysis
         report_file = checkpoint_manager.export_progress_report()
         print(f"\n📊 Progress report: {report_file}")
 
+        # Nothing left to resume once every symbol is done
+        if not failed_symbols:
+            checkpoint_manager.clear_checkpoint()
+        else:
+            checkpoint_manager.close()
+
     # Final summary
     print("\n" + "=" * 60)
     if total_datasets > 0:
         completion_msg = f"🚀 ULTRA-FAST SUCCESS: Generated {total_datasets} datasets"
         if checkpoint_manager:
-            completed_symbols = len(checkpoint_manager.progress_data.get("symbols_completed", []))
             completion_msg += f" across {completed_symbols} completed symbols"
         else:
             completion_msg += f" across {len(all_results)} symbols"
@@ -359,36 +378,42 @@ def fill_gaps(command_line_args: Any) -> int:
     target_directory = (
         Path(command_line_args.directory) if command_line_args.directory else Path.cwd()
     )
-    discovered_csv_files = list(target_directory.glob("*.csv"))
-
-    total_gaps_detected = 0
-    gaps_filled_count = 0
-    for csv_file_path in discovered_csv_files:
-        # Parse filename to extract symbol and timeframe
-        file_metadata = parse_filename_metadata(csv_file_path.name)
-
-        if file_metadata is None:
-            print(f"⚠️  Skipping {csv_file_path.name}: Non-standard filename format")
-            continue
+    cataloged_datasets = (
+        DatasetCatalog.for_directory(target_directory).find(format="csv")
+        if target_directory.is_dir()
+        else []
+    )
 
-        detected_timeframe = file_metadata["timeframe"]
-        detected_symbol = file_metadata["symbol"]
+    for dataset in cataloged_datasets:
+        print(f"🔍 Processing {dataset.symbol} {dataset.timeframe} data from {dataset.path.name}")
 
-        print(
-            f"🔍 Processing {detected_symbol} {detected_timeframe} data from {csv_file_path.name}"
-        )
+    # Detect and fill all gaps (one read and one atomic write per file), files in parallel
+    worker_count = getattr(command_line_args, "workers", None) or 4
+    file_results = gap_filler_instance.process_files(
+        [(dataset.path, dataset.timeframe) for dataset in cataloged_datasets],
+        max_workers=worker_count,
+    )
+    total_gaps_detected = sum(file_result["gaps_detected"] for file_result in file_results)
+    gaps_filled_count = sum(file_result["gaps_filled"] for file_result in file_results)
+    gaps_unfillable_count = sum(
+        file_result.get("gaps_unfillable", 0) for file_result in file_results
+    )
 
-        # Detect gaps
-        detected_gaps = gap_filler_instance.detect_all_gaps(csv_file_path, detected_timeframe)
-        total_gaps_detected += len(detected_gaps)
+    failed_files = [
+        (dataset, file_result)
+        for dataset, file_result in zip(cataloged_datasets, file_results)
+        if "error" in file_result
+    ]
 
-        # Fill each gap
-        for timestamp_gap in detected_gaps:
-            if gap_filler_instance.fill_gap(timestamp_gap, csv_file_path, detected_timeframe):
-                gaps_filled_count += 1
+    if gaps_unfillable_count:
+        print(f"📋 {gaps_unfillable_count} gaps are confirmed exchange outages (no data upstream)")
+    for dataset, file_result in failed_files:
+        print(f"❌ Could not process {dataset.path.name}: {file_result['error']}")
 
-    # Success if no gaps detected, or if all detected gaps were filled
-    gap_filling_successful = total_gaps_detected == 0 or gaps_filled_count == total_gaps_detected
+    # Success if every file was processed and every gap that has data upstream was filled
+    gap_filling_successful = (
+        not failed_files and gaps_filled_count + gaps_unfillable_count == total_gaps_detected
+    )
 
     if gap_filling_successful:
         print("\n✅ GAP FILLING SUCCESS: All gaps filled")
@@ -398,6 +423,43 @@ def fill_gaps(command_line_args: Any) -> int:
         return 1
 
 
+def validate_directory(command_line_args: Any) -> int:
+    """Directory validation workflow"""
+    print("🔍 Gapless Crypto Data - Directory Validation")
+    print(f"Directory: {command_line_args.directory or 'current directory'}")
+    print("=" * 60)
+
+    target_directory = (
+        Path(command_line_args.directory) if command_line_args.directory else Path.cwd()
+    )
+    validation_summary = validate_data_directory(
+        target_directory,
+        max_workers=command_line_args.workers,
+        use_cache=not command_line_args.no_cache,
+    )
+
+    for filename, file_result in validation_summary["file_results"].items():
+        status_icon = "✅" if file_result["total_errors"] == 0 else "❌"
+        print(f"{status_icon} {filename}: {file_result['validation_summary']}")
+
+    print("=" * 60)
+    print(
+        f"📊 {validation_summary['files_validated']} files "
+        f"({validation_summary['files_cached']} unchanged since last validation): "
+        f"{validation_summary['files_passed']} passed, {validation_summary['files_failed']} failed"
+    )
+    print(
+        f"   {validation_summary['total_errors']} errors, "
+        f"{validation_summary['total_warnings']} warnings"
+    )
+
+    if validation_summary["files_failed"]:
+        print("\n❌ VALIDATION FAILED: Some files have errors")
+        return 1
+    print("\n✅ VALIDATION SUCCESS: All files passed")
+    return 0
+
+
 def main() -> int:
     """Main CLI entry point"""
 
@@ -447,11 +509,42 @@ Performance: 22x faster than API calls via Binance public data repository with a
     gaps_parser.add_argument(
         "--directory", help="Directory containing CSV files (default: current)"
     )
+    gaps_parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Files to gap-fill concurrently, sharing one API rate budget (default: 4)",
+    )
+
+    # Directory validation command
+    validate_parser = subparsers.add_parser(
+        "validate", help="Validate every CSV file in a directory"
+    )
+    validate_parser.add_argument(
+        "--directory", help="Directory containing CSV files (default: current)"
+    )
+    validate_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes validating files in parallel (default: CPU count)",
+    )
+    validate_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Revalidate files even if they are unchanged since their last validation",
+    )
 
     # Legacy support: direct flags for backwards compatibility
     add_collection_arguments(parser)
     parser.add_argument("--fill-gaps", action="store_true", help="Fill gaps in existing data")
     parser.add_argument("--directory", help="Directory containing CSV files (default: current)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Files to gap-fill concurrently with --fill-gaps (default: 4)",
+    )
     parser.add_argument(
         "--list-timeframes",
         action="store_true",
@@ -466,6 +559,8 @@ Performance: 22x faster than API calls via Binance public data repository with a
         return list_timeframes()
     elif parsed_arguments.command == "fill-gaps" or parsed_arguments.fill_gaps:
         return fill_gaps(parsed_arguments)
+    elif parsed_arguments.command == "validate":
+        return validate_directory(parsed_arguments)
     elif parsed_arguments.command == "collect" or parsed_arguments.command is None:
         return collect_data(parsed_arguments)
     else:
@@ -10,9 +10,9 @@ Data source: https://data.binance.vision/data/spot/monthly/klines/
 
 import argparse
 import csv
-import hashlib
 import json
 import logging
+import os
 import shutil
 import tempfile
 import urllib.parse
@@ -23,9 +23,40 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from ..gap_filling.universal_gap_filler import UniversalGapFiller
+from ..resume import TaskStagingArea, period_is_closed
+from ..storage import (
+    CatalogError,
+    DatasetCatalog,
+    read_arrow_ipc,
+    read_arrow_ipc_table,
+    write_arrow_ipc,
+    write_partitioned_parquet,
+)
+from ..storage.catalog import OUTPUT_FILENAME_PATTERN
+from ..utils import TIMEFRAME_INTERVALS, StreamingDataHasher, get_timeframe_interval
+from ..utils.data_hashing import HASH_CHUNK_ROWS, render_canonical_lines
+from ..validation import OHLCVValidationKernel, StreamingOHLCVValidator
+from ..validation.cache import load_cached_validation, validation_cache_key
+from ..validation.streaming import DEFAULT_CHUNK_ROWS, STREAMING_THRESHOLD_BYTES
+
+# Full 11-column microstructure output layout shared by every writer
+OUTPUT_COLUMNS = [
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "close_time",
+    "quote_asset_volume",
+    "number_of_trades",
+    "taker_buy_base_asset_volume",
+    "taker_buy_quote_asset_volume",
+]
 
 
 class BinancePublicDataCollector:
@@ -92,6 +123,7 @@ class BinancePublicDataCollector:
         end_date: str = "2025-03-20",
         output_dir: Optional[Union[str, Path]] = None,
         output_format: str = "csv",
+        arrow_compression: Optional[str] = None,
     ) -> None:
         """Initialize the Binance Public Data Collector.
 
@@ -108,9 +140,12 @@ class BinancePublicDataCollector:
             output_dir (str or Path, optional): Directory to save files.
                 If None, saves to package's sample_data directory.
                 Defaults to None.
-            output_format (str, optional): Output format ("csv" or "parquet").
-                CSV provides universal compatibility, Parquet offers 5-10x compression.
+            output_format (str, optional): Output format ("csv", "parquet" or "arrow").
+                CSV provides universal compatibility, Parquet offers 5-10x compression,
+                Arrow IPC files are memory-mapped for zero-copy reloads.
                 Defaults to "csv".
+            arrow_compression (str, optional): Buffer compression for "arrow" output,
+                None (uncompressed, zero-copy) or "lz4". Defaults to None.
 
         Raises:
             ValueError: If symbol format is invalid or dates are malformed.
@@ -143,9 +178,12 @@ class BinancePublicDataCollector:
         self.base_url = "https://data.binance.vision/data/spot/monthly/klines"
 
         # Validate and store output format
-        if output_format not in ["csv", "parquet"]:
-            raise ValueError(f"output_format must be 'csv' or 'parquet', got '{output_format}'")
+        if output_format not in ["csv", "parquet", "arrow"]:
+            raise ValueError(
+                f"output_format must be 'csv', 'parquet' or 'arrow', got '{output_format}'"
+            )
         self.output_format = output_format
+        self.arrow_compression = arrow_compression
 
         # Configure output directory - use provided path or default to sample_data
         if output_dir:
@@ -156,6 +194,9 @@ class BinancePublicDataCollector:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Parsed monthly archives survive an interrupted run and are reused on resume
+        self.task_staging = TaskStagingArea(self.output_dir / ".staging" / "parsed")
+
         # Initialize Rich console for progress indicators
         # Simple logging instead of Rich console
 
@@ -233,12 +274,20 @@ class BinancePublicDataCollector:
                 f"If requests fail with 404 errors, check symbol availability on Binance."
             )
 
-    def generate_monthly_urls(self, trading_timeframe: str) -> List[Tuple[str, str, str]]:
-        """Generate list of monthly ZIP file URLs to download."""
+    def generate_monthly_urls(
+        self,
+        trading_timeframe: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Tuple[str, str, str]]:
+        """Generate list of monthly ZIP file URLs to download (defaults to the collector range)."""
+        start_date = start_date or self.start_date
+        end_date = end_date or self.end_date
+
         monthly_zip_urls = []
-        current_month_date = self.start_date.replace(day=1)  # Start of month
+        current_month_date = start_date.replace(day=1)  # Start of month
 
-        while current_month_date <= self.end_date:
+        while current_month_date <= end_date:
             year_month_string = current_month_date.strftime("%Y-%m")
             zip_filename = f"{self.symbol}-{trading_timeframe}-{year_month_string}.zip"
             binance_zip_url = f"{self.base_url}/{self.symbol}/{trading_timeframe}/{zip_filename}"
@@ -728,164 +777,155 @@ class BinancePublicDataCollector:
             print("💡 Use 'gapless-crypto-data --list-timeframes' for detailed descriptions")
             return None
 
+        date_filtered_data = self._download_candle_rows(
+            trading_timeframe, self.start_date, self.end_date
+        )
+
+        # Save to CSV and return DataFrame for seamless Python integration
+        if date_filtered_data:
+            # Calculate collection stats for metadata
+            collection_stats = {
+                "method": "direct_download",
+                "duration": 0.0,  # Minimal for single timeframe
+                "bars_per_second": 0,
+                "total_bars": len(date_filtered_data),
+            }
+
+            # Save to CSV file (addresses the output_dir bug)
+            filepath = self.save_data(trading_timeframe, date_filtered_data, collection_stats)
+            self.task_staging.clear(self.symbol, trading_timeframe)
+
+            # Convert to DataFrame for Python API users
+            df = self._rows_to_dataframe(date_filtered_data)
+
+            return {"dataframe": df, "filepath": filepath, "stats": collection_stats}
+
+        return {"dataframe": pd.DataFrame(), "filepath": None, "stats": {}}
+
+    def _download_candle_rows(
+        self, trading_timeframe: str, start_date: datetime, end_date: datetime
+    ) -> List[List]:
+        """Download monthly archives covering a date range and return sorted, range-filtered rows."""
         # Generate monthly URLs
-        monthly_zip_urls = self.generate_monthly_urls(trading_timeframe)
+        monthly_zip_urls = self.generate_monthly_urls(trading_timeframe, start_date, end_date)
         print(f"Monthly files to download: {len(monthly_zip_urls)}")
 
+        staged_months = self.task_staging.completed_periods(self.symbol, trading_timeframe)
+
         # Collect data from all months
         combined_candle_data = []
         successful_download_count = 0
+        staged_load_count = 0
 
         for binance_zip_url, year_month_string, zip_filename in monthly_zip_urls:
+            if year_month_string in staged_months:
+                staged_monthly_data = self.task_staging.load(
+                    self.symbol, trading_timeframe, year_month_string
+                )
+                if staged_monthly_data is not None:
+                    combined_candle_data.extend(staged_monthly_data)
+                    staged_load_count += 1
+                    print(
+                        f"    ♻️  {len(staged_monthly_data):,} bars from staged {year_month_string}"
+                    )
+                    continue
+
             raw_monthly_csv_data = self.download_and_extract_month(binance_zip_url, zip_filename)
             if raw_monthly_csv_data:
                 processed_monthly_data = self.process_raw_data(raw_monthly_csv_data)
                 combined_candle_data.extend(processed_monthly_data)
                 successful_download_count += 1
                 print(f"    ✅ {len(processed_monthly_data):,} bars from {year_month_string}")
+                if processed_monthly_data and period_is_closed(year_month_string):
+                    self.task_staging.save(
+                        self.symbol, trading_timeframe, year_month_string, processed_monthly_data
+                    )
             else:
                 print(f"    ⚠️  No data from {year_month_string}")
 
         print("\nCollection Summary:")
         print(f"  Successful downloads: {successful_download_count}/{len(monthly_zip_urls)}")
+        if staged_load_count:
+            print(f"  Resumed from staging: {staged_load_count}/{len(monthly_zip_urls)}")
         print(f"  Total bars collected: {len(combined_candle_data):,}")
 
-        if combined_candle_data:
-            # Sort by timestamp to ensure chronological order
-            combined_candle_data.sort(key=lambda candle_row: candle_row[0])
-            print(
-                f"  Pre-filtering range: {combined_candle_data[0][0]} to {combined_candle_data[-1][0]}"
-            )
-
-            # ✅ BOUNDARY FIX: Apply final date range filtering after combining all monthly data
-            # This preserves month boundaries while respecting the requested date range
-            date_filtered_data = []
-            for candle_row in combined_candle_data:
-                candle_datetime = datetime.strptime(candle_row[0], "%Y-%m-%d %H:%M:%S")
-                if self.start_date <= candle_datetime <= self.end_date:
-                    date_filtered_data.append(candle_row)
-
-            print(f"  Post-filtering: {len(date_filtered_data):,} bars in requested range")
-            if date_filtered_data:
-                print(f"  Final range: {date_filtered_data[0][0]} to {date_filtered_data[-1][0]}")
-
-            # Save to CSV and return DataFrame for seamless Python integration
-            if date_filtered_data:
-                # Calculate collection stats for metadata
-                collection_stats = {
-                    "method": "direct_download",
-                    "duration": 0.0,  # Minimal for single timeframe
-                    "bars_per_second": 0,
-                    "total_bars": len(date_filtered_data),
-                }
-
-                # Save to CSV file (addresses the output_dir bug)
-                filepath = self.save_data(trading_timeframe, date_filtered_data, collection_stats)
-
-                # Convert to DataFrame for Python API users
-                columns = [
-                    "date",
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "volume",
-                    "close_time",
-                    "quote_asset_volume",
-                    "number_of_trades",
-                    "taker_buy_base_asset_volume",
-                    "taker_buy_quote_asset_volume",
-                ]
-                df = pd.DataFrame(date_filtered_data, columns=columns)
-
-                # Convert numeric columns
-                numeric_cols = [
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "volume",
-                    "quote_asset_volume",
-                    "number_of_trades",
-                    "taker_buy_base_asset_volume",
-                    "taker_buy_quote_asset_volume",
-                ]
-                for col in numeric_cols:
-                    df[col] = pd.to_numeric(df[col], errors="coerce")
+        if not combined_candle_data:
+            return []
 
-                # Convert date columns to datetime
-                df["date"] = pd.to_datetime(df["date"])
-                df["close_time"] = pd.to_datetime(df["close_time"])
+        # Sort by timestamp to ensure chronological order
+        combined_candle_data.sort(key=lambda candle_row: candle_row[0])
+        print(
+            f"  Pre-filtering range: {combined_candle_data[0][0]} to {combined_candle_data[-1][0]}"
+        )
 
-                return {"dataframe": df, "filepath": filepath, "stats": collection_stats}
+        # ✅ BOUNDARY FIX: Apply final date range filtering after combining all monthly data
+        # This preserves month boundaries while respecting the requested date range
+        date_filtered_data = []
+        for candle_row in combined_candle_data:
+            candle_datetime = datetime.strptime(candle_row[0], "%Y-%m-%d %H:%M:%S")
+            if start_date <= candle_datetime <= end_date:
+                date_filtered_data.append(candle_row)
 
-            return {"dataframe": pd.DataFrame(), "filepath": None, "stats": {}}
+        print(f"  Post-filtering: {len(date_filtered_data):,} bars in requested range")
+        if date_filtered_data:
+            print(f"  Final range: {date_filtered_data[0][0]} to {date_filtered_data[-1][0]}")
 
-        # Save to CSV and return DataFrame for unfiltered data
-        if combined_candle_data:
-            # Calculate collection stats for metadata
-            collection_stats = {
-                "method": "direct_download",
-                "duration": 0.0,  # Minimal for single timeframe
-                "bars_per_second": 0,
-                "total_bars": len(combined_candle_data),
-            }
+        return date_filtered_data
 
-            # Save to CSV file (addresses the output_dir bug)
-            filepath = self.save_data(trading_timeframe, combined_candle_data, collection_stats)
+    def _rows_to_dataframe(self, candle_data: List[List]) -> pd.DataFrame:
+        """Convert processed candle rows to a typed 11-column DataFrame."""
+        df = pd.DataFrame(candle_data, columns=OUTPUT_COLUMNS)
 
-            # Convert to DataFrame for Python API users
-            columns = [
-                "date",
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume",
-                "close_time",
-                "quote_asset_volume",
-                "number_of_trades",
-                "taker_buy_base_asset_volume",
-                "taker_buy_quote_asset_volume",
-            ]
-            df = pd.DataFrame(combined_candle_data, columns=columns)
-
-            # Convert numeric columns
-            numeric_cols = [
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume",
-                "quote_asset_volume",
-                "number_of_trades",
-                "taker_buy_base_asset_volume",
-                "taker_buy_quote_asset_volume",
-            ]
-            for col in numeric_cols:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-            # Convert date columns to datetime
-            df["date"] = pd.to_datetime(df["date"])
-            df["close_time"] = pd.to_datetime(df["close_time"])
+        # Convert numeric columns
+        numeric_cols = [
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+            "quote_asset_volume",
+            "number_of_trades",
+            "taker_buy_base_asset_volume",
+            "taker_buy_quote_asset_volume",
+        ]
+        for col in numeric_cols:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
 
-            return {"dataframe": df, "filepath": filepath, "stats": collection_stats}
+        # Convert date columns to datetime
+        df["date"] = pd.to_datetime(df["date"])
+        df["close_time"] = pd.to_datetime(df["close_time"])
 
-        return {"dataframe": pd.DataFrame(), "filepath": None, "stats": {}}
+        return df
 
     def generate_metadata(
-        self, trading_timeframe, candle_data, collection_performance_stats, gap_analysis_result=None
+        self,
+        trading_timeframe,
+        candle_data,
+        collection_performance_stats,
+        gap_analysis_result=None,
+        data_hasher=None,
+        candle_frame=None,
     ):
-        """Generate comprehensive metadata for 11-column microstructure format."""
+        """Generate comprehensive metadata for 11-column microstructure format.
+
+        data_hasher may carry a StreamingDataHasher that already consumed candle_data
+        (e.g., while the CSV data section was written); otherwise rows are hashed here.
+        candle_frame may carry candle_data already converted by _rows_to_output_frame.
+        """
         if not candle_data:
             return {}
 
-        # Calculate statistics
-        price_values = []
-        volume_values = []
-        for candle_row in candle_data:
-            price_values.extend([candle_row[2], candle_row[3]])  # high, low
-            volume_values.append(candle_row[5])
+        if data_hasher is None:
+            data_hasher = StreamingDataHasher()
+            data_hasher.update_rows(candle_data)
+
+        # Calculate statistics with array reductions over the typed columns
+        if candle_frame is None:
+            candle_frame = self._rows_to_output_frame(candle_data)
+        high_values = candle_frame["high"].to_numpy(dtype=np.float64)
+        low_values = candle_frame["low"].to_numpy(dtype=np.float64)
+        volume_values = candle_frame["volume"].to_numpy(dtype=np.float64)
+        volume_total = float(volume_values.sum())
 
         return {
             "version": "v2.10.0",
@@ -908,15 +948,18 @@ class BinancePublicDataCollector:
                 "end": candle_data[-1][0] if candle_data else None,
             },
             "statistics": {
-                "price_min": min(price_values) if price_values else 0,
-                "price_max": max(price_values) if price_values else 0,
-                "volume_total": sum(volume_values) if volume_values else 0,
-                "volume_mean": sum(volume_values) / len(volume_values) if volume_values else 0,
+                "price_min": float(min(high_values.min(), low_values.min())),
+                "price_max": float(max(high_values.max(), low_values.max())),
+                "volume_total": volume_total,
+                "volume_mean": volume_total / len(volume_values),
             },
             "collection_performance": collection_performance_stats,
             "data_integrity": {
                 "chronological_order": True,
-                "data_hash": self._calculate_data_hash(candle_data),
+                "data_hash": data_hasher.hexdigest(),
+                "hash_method": "sha256_canonical_rows",
+                "merkle_root": data_hasher.merkle_root(),
+                "month_hashes": data_hasher.month_hashes(),
                 "corruption_detected": len(getattr(self, "corruption_log", [])) > 0,
                 "corrupted_rows_count": len(getattr(self, "corruption_log", [])),
                 "corruption_details": getattr(self, "corruption_log", []),
@@ -982,8 +1025,12 @@ class BinancePublicDataCollector:
             },
         }
 
-    def _perform_gap_analysis(self, data, timeframe):
-        """Perform gap analysis on collected data and return detailed results."""
+    def _perform_gap_analysis(self, data, timeframe, candle_frame=None):
+        """Perform gap analysis on collected data and return detailed results.
+
+        Gaps are found with one np.diff over int64 open times; gap records are only
+        built for the intervals that break the expected spacing.
+        """
         if not data or len(data) < 2:
             return {
                 "analysis_performed": True,
@@ -996,44 +1043,37 @@ class BinancePublicDataCollector:
                 "note": "Insufficient data for gap analysis (< 2 rows)",
             }
 
-        # Calculate expected interval in minutes
-        timeframe_minutes = {
-            "1m": 1,
-            "3m": 3,
-            "5m": 5,
-            "15m": 15,
-            "30m": 30,
-            "1h": 60,
-            "2h": 120,
-            "4h": 240,
-            "1d": 1440,
-        }
+        # Expected interval in seconds (unknown timeframes fall back to 1h)
+        interval_seconds = int(
+            TIMEFRAME_INTERVALS.get(timeframe, timedelta(hours=1)).total_seconds()
+        )
+        tolerance_factor = 1.5  # Allow 50% tolerance
 
-        interval_minutes = timeframe_minutes.get(timeframe, 60)
-        expected_gap_minutes = interval_minutes
+        if candle_frame is not None:
+            open_times = candle_frame["date"]
+        else:
+            open_times = pd.to_datetime([row[0] for row in data], format="%Y-%m-%d %H:%M:%S")
+        timestamp_seconds = np.asarray(open_times, dtype="datetime64[s]").astype(
+            np.int64, copy=False
+        )
 
         # Analyze timestamp gaps
-        gaps_detected = []
-        total_bars_expected = 0
-
-        for i in range(1, len(data)):
-            current_time = datetime.strptime(data[i][0], "%Y-%m-%d %H:%M:%S")
-            previous_time = datetime.strptime(data[i - 1][0], "%Y-%m-%d %H:%M:%S")
-
-            actual_gap_minutes = (current_time - previous_time).total_seconds() / 60
-
-            if actual_gap_minutes > expected_gap_minutes * 1.5:  # Allow 50% tolerance
-                missing_bars = int(actual_gap_minutes / expected_gap_minutes) - 1
-                if missing_bars > 0:
-                    gaps_detected.append(
-                        {
-                            "gap_start": data[i - 1][0],
-                            "gap_end": data[i][0],
-                            "missing_bars": missing_bars,
-                            "duration_minutes": actual_gap_minutes - expected_gap_minutes,
-                        }
-                    )
-                    total_bars_expected += missing_bars
+        actual_gaps = np.diff(timestamp_seconds)
+        gap_positions = np.flatnonzero(actual_gaps > interval_seconds * tolerance_factor)
+        missing_bars = actual_gaps[gap_positions] // interval_seconds - 1
+        gap_positions = gap_positions[missing_bars > 0]
+        missing_bars = missing_bars[missing_bars > 0]
+
+        gaps_detected = [
+            {
+                "gap_start": data[position][0],
+                "gap_end": data[position + 1][0],
+                "missing_bars": int(bars),
+                "duration_minutes": (int(actual_gaps[position]) - interval_seconds) / 60,
+            }
+            for position, bars in zip(gap_positions.tolist(), missing_bars.tolist())
+        ]
+        total_bars_expected = int(missing_bars.sum())
 
         # Calculate completeness score
         total_bars_collected = len(data)
@@ -1047,25 +1087,26 @@ class BinancePublicDataCollector:
             "total_gaps_detected": len(gaps_detected),
             "gaps_filled": 0,  # Will be updated during gap filling process
             "gaps_remaining": len(gaps_detected),
-            "gap_details": gaps_detected[:10],  # Limit to first 10 gaps for metadata size
+            "gap_details": gaps_detected,
             "total_missing_bars": total_bars_expected,
             "gap_filling_method": "authentic_binance_api",
             "data_completeness_score": round(completeness_score, 4),
             "analysis_timestamp": datetime.now(timezone.utc).isoformat() + "Z",
             "analysis_parameters": {
                 "timeframe": timeframe,
-                "expected_interval_minutes": expected_gap_minutes,
-                "tolerance_factor": 1.5,
+                "expected_interval_minutes": interval_seconds / 60,
+                "tolerance_factor": tolerance_factor,
             },
         }
 
     def _calculate_data_hash(self, data):
         """Calculate hash of data for integrity verification."""
-        data_string = "\n".join(",".join(map(str, row)) for row in data)
-        return hashlib.sha256(data_string.encode()).hexdigest()
+        data_hasher = StreamingDataHasher()
+        data_hasher.update_rows(data)
+        return data_hasher.hexdigest()
 
     def save_data(self, timeframe: str, data: List[List], collection_stats: Dict[str, Any]) -> Path:
-        """Save data to file with format determined by output_format (CSV or Parquet)."""
+        """Save data to file with format determined by output_format (CSV, Parquet or Arrow)."""
         if not data:
             print(f"❌ No data to save for {timeframe}")
             return None
@@ -1081,75 +1122,517 @@ class BinancePublicDataCollector:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Convert rows once; gap analysis, statistics and columnar writers share it
+        candle_frame = self._rows_to_output_frame(data)
+
         # Perform gap analysis on collected data
-        gap_analysis = self._perform_gap_analysis(data, timeframe)
+        gap_analysis = self._perform_gap_analysis(data, timeframe, candle_frame=candle_frame)
 
-        # Generate metadata with gap analysis results
-        metadata = self.generate_metadata(timeframe, data, collection_stats, gap_analysis)
+        # CSV rows are hashed while the data section is written (see _write_csv_streaming)
+        data_hasher = StreamingDataHasher()
+        if self.output_format != "csv":
+            data_hasher.update_rows(data)
 
-        # Convert data to DataFrame for both formats
-        df = pd.DataFrame(
+        # Generate metadata with gap analysis results
+        metadata = self.generate_metadata(
+            timeframe,
             data,
-            columns=[
-                "date",
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume",
-                "close_time",
-                "quote_asset_volume",
-                "number_of_trades",
-                "taker_buy_base_asset_volume",
-                "taker_buy_quote_asset_volume",
-            ],
+            collection_stats,
+            gap_analysis,
+            data_hasher=data_hasher,
+            candle_frame=candle_frame,
         )
 
-        # Convert date column to datetime
-        df["date"] = pd.to_datetime(df["date"])
-
         if self.output_format == "parquet":
             # Save as Parquet with metadata
-            df.to_parquet(filepath, engine="pyarrow", compression="snappy", index=False)
+            df = candle_frame
+            write_partitioned_parquet(df, filepath)
             print(f"📊 Saved {len(df):,} bars to {filepath.name} (Parquet format)")
+        elif self.output_format == "arrow":
+            # Save as Arrow IPC for memory-mapped zero-copy loading
+            df = candle_frame
+            write_arrow_ipc(df, filepath, compression=self.arrow_compression)
+            print(f"📊 Saved {len(df):,} bars to {filepath.name} (Arrow IPC format)")
         else:
-            # Save as CSV with metadata headers (existing logic)
-            with open(filepath, "w", newline="") as f:
-                # Write metadata headers
-                f.write(f"# Binance Spot Market Data {metadata['version']}\n")
-                f.write(f"# Generated: {metadata['generation_timestamp']}\n")
-                f.write(f"# Source: {metadata['data_source']}\n")
-                f.write(
-                    f"# Market: {metadata['market_type'].upper()} | Symbol: {metadata['symbol']} | Timeframe: {metadata['timeframe']}\n"
-                )
-                f.write(f"# Coverage: {metadata['actual_bars']:,} bars\n")
-                f.write(
-                    f"# Period: {metadata['date_range']['start']} to {metadata['date_range']['end']}\n"
-                )
-                f.write(
-                    f"# Collection: {collection_stats['method']} in {collection_stats['duration']:.1f}s\n"
-                )
-                f.write(f"# Data Hash: {metadata['data_integrity']['data_hash'][:16]}...\n")
-                f.write(
-                    "# Compliance: Zero-Magic-Numbers, Temporal-Integrity, Official-Binance-Source\n"
-                )
-                f.write("#\n")
-
-                # Write CSV data
-                df.to_csv(f, index=False)
-            print(f"📊 Saved {len(df):,} bars to {filepath.name} (CSV format)")
+            # Save as CSV with metadata headers
+            self._write_csv_streaming(filepath, data, metadata, collection_stats, data_hasher)
+            print(f"📊 Saved {len(data):,} bars to {filepath.name} (CSV format)")
 
         # Save metadata as JSON
         metadata_filepath = filepath.with_suffix(".metadata.json")
         with open(metadata_filepath, "w") as f:
             json.dump(metadata, f, indent=2)
 
+        self._record_in_catalog(filepath, timeframe, metadata)
+
         file_size_mb = filepath.stat().st_size / (1024 * 1024)
         print(f"\n✅ Created: {filepath.name} ({file_size_mb:.1f} MB)")
         print(f"✅ Metadata: {metadata_filepath.name}")
 
         return filepath
 
+    def _write_csv_streaming(
+        self,
+        filepath: Path,
+        data: List[List],
+        metadata: Dict[str, Any],
+        collection_stats: Dict[str, Any],
+        data_hasher: StreamingDataHasher,
+    ) -> None:
+        """Write a CSV dataset in one pass, hashing each rendered chunk as it is written.
+
+        The header carries the data hash but precedes the data section, so it is
+        written first with the hash of no rows as a fixed-width placeholder and
+        patched in place afterwards; only the hash characters change.
+        """
+        header = "\n".join(self._format_csv_header(metadata, collection_stats)) + "\n"
+        with open(filepath, "wb") as f:
+            f.write(header.encode("utf-8"))
+            f.write((",".join(OUTPUT_COLUMNS) + "\n").encode("utf-8"))
+            for chunk_start in range(0, len(data), HASH_CHUNK_ROWS):
+                lines = render_canonical_lines(data[chunk_start : chunk_start + HASH_CHUNK_ROWS])
+                data_hasher.update_lines(lines)
+                f.write(("\n".join(lines) + "\n").encode("utf-8"))
+
+            data_integrity = metadata["data_integrity"]
+            data_integrity["data_hash"] = data_hasher.hexdigest()
+            data_integrity["merkle_root"] = data_hasher.merkle_root()
+            data_integrity["month_hashes"] = data_hasher.month_hashes()
+            final_header = "\n".join(self._format_csv_header(metadata, collection_stats)) + "\n"
+            f.seek(0)
+            f.write(final_header.encode("utf-8"))
+
+    def _record_in_catalog(
+        self,
+        filepath: Path,
+        timeframe: str,
+        metadata: Dict[str, Any],
+        replaces: Optional[Path] = None,
+    ) -> None:
+        """Register a written dataset in the output directory's catalog."""
+        DatasetCatalog.for_directory(filepath.parent).record_dataset(
+            filepath,
+            symbol=self.symbol,
+            timeframe=timeframe,
+            start_time=metadata["date_range"]["start"],
+            end_time=metadata["date_range"]["end"],
+            row_count=metadata["actual_bars"],
+            content_hash=metadata["data_integrity"]["data_hash"],
+            replaces=replaces,
+        )
+
+    def _rows_to_output_frame(self, data: List[List]) -> pd.DataFrame:
+        """Build the on-disk DataFrame layout (typed date column, raw values elsewhere)."""
+        df = pd.DataFrame(data, columns=OUTPUT_COLUMNS)
+
+        # Convert date column to datetime
+        df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d %H:%M:%S")
+        return df
+
+    def _format_csv_header(
+        self, metadata: Dict[str, Any], collection_stats: Dict[str, Any]
+    ) -> List[str]:
+        """Render the commented metadata header written at the top of CSV outputs."""
+        return [
+            f"# Binance Spot Market Data {metadata['version']}",
+            f"# Generated: {metadata['generation_timestamp']}",
+            f"# Source: {metadata['data_source']}",
+            f"# Market: {metadata['market_type'].upper()} | Symbol: {metadata['symbol']} | Timeframe: {metadata['timeframe']}",
+            f"# Coverage: {metadata['actual_bars']:,} bars",
+            f"# Period: {metadata['date_range']['start']} to {metadata['date_range']['end']}",
+            f"# Collection: {collection_stats['method']} in {collection_stats['duration']:.1f}s",
+            f"# Data Hash: {metadata['data_integrity']['data_hash'][:16]}...",
+            "# Compliance: Zero-Magic-Numbers, Temporal-Integrity, Official-Binance-Source",
+            "#",
+        ]
+
+    def find_existing_output(self, trading_timeframe: str) -> Optional[Path]:
+        """Locate the most recent saved dataset for this symbol/timeframe in output_dir.
+
+        Args:
+            trading_timeframe (str): Timeframe of the dataset (e.g., "1h").
+
+        Returns:
+            Path to the cataloged dataset with the latest end in the collector's output
+            format, or None if no dataset has been saved yet.
+        """
+        datasets = DatasetCatalog.for_directory(self.output_dir).find(
+            symbol=self.symbol, timeframe=trading_timeframe, format=self.output_format
+        )
+        return datasets[0].path if datasets else None
+
+    def _read_last_timestamp(self, filepath: Path) -> Optional[datetime]:
+        """Read the last bar's open time without loading the dataset.
+
+        CSV files are read backwards from the end in growing blocks until a complete
+        data line is found. Parquet files answer from row group statistics and Arrow
+        files from the memory-mapped date column.
+        """
+        if filepath.suffix == ".arrow":
+            dates = read_arrow_ipc_table(filepath, columns=["date"]).column("date")
+            if len(dates) == 0:
+                return None
+            return pd.Timestamp(dates[-1].as_py()).to_pydatetime().replace(tzinfo=None)
+
+        if filepath.suffix == ".parquet":
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(filepath)
+            date_index = parquet_file.schema_arrow.get_field_index("date")
+            latest = None
+            for row_group_index in range(parquet_file.metadata.num_row_groups):
+                statistics = (
+                    parquet_file.metadata.row_group(row_group_index).column(date_index).statistics
+                )
+                if statistics is None or not statistics.has_min_max:
+                    latest = None
+                    break
+                if latest is None or statistics.max > latest:
+                    latest = statistics.max
+            if latest is None:
+                dates = parquet_file.read(columns=["date"]).column("date").to_pandas()
+                if dates.empty:
+                    return None
+                latest = dates.max()
+            return pd.Timestamp(latest).to_pydatetime().replace(tzinfo=None)
+
+        for line in self._iter_csv_data_lines_reversed(filepath):
+            return datetime.strptime(line.split(",", 1)[0], "%Y-%m-%d %H:%M:%S")
+        return None
+
+    def _iter_csv_data_lines_reversed(self, filepath: Path):
+        """Yield CSV data lines from the end of the file backwards, reading block by block."""
+        block_size = 64 * 1024
+        with open(filepath, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            carry = b""
+
+            while position > 0:
+                read_size = min(block_size, position)
+                position -= read_size
+                f.seek(position)
+                block_lines = (f.read(read_size) + carry).split(b"\n")
+                # The first line may continue in the previous block - carry it over
+                carry = block_lines.pop(0) if position > 0 else b""
+
+                for raw_line in reversed(block_lines):
+                    line = raw_line.decode("utf-8").strip()
+                    if not line or line.startswith("#") or line.startswith("date"):
+                        continue
+                    yield line
+
+    def _hash_saved_rows(self, filepath: Path, data_hasher: StreamingDataHasher) -> None:
+        """Feed every saved row of a dataset, as canonical lines, into data_hasher."""
+        if filepath.suffix == ".csv":
+            lines = []
+            with open(filepath, "r", newline="") as f:
+                for raw_line in f:
+                    line = raw_line.strip()
+                    if not line or line.startswith("#") or line.startswith("date"):
+                        continue
+                    lines.append(line)
+                    if len(lines) >= HASH_CHUNK_ROWS:
+                        data_hasher.update_lines(lines)
+                        lines = []
+            data_hasher.update_lines(lines)
+            return
+
+        if filepath.suffix == ".parquet":
+            saved_df = pd.read_parquet(filepath, engine="pyarrow")
+        else:
+            saved_df = read_arrow_ipc(filepath)
+        data_hasher.update_rows(self._frame_to_rows(saved_df))
+
+    def _frame_to_rows(self, df: pd.DataFrame) -> List[List]:
+        """Convert an output-layout DataFrame back into processed candle rows."""
+        columns = [df["date"].dt.strftime("%Y-%m-%d %H:%M:%S").tolist()] + [
+            df[column].tolist() for column in OUTPUT_COLUMNS[1:]
+        ]
+        return [list(row) for row in zip(*columns)]
+
+    def update(self, trading_timeframe: str) -> Dict[str, Any]:
+        """Incrementally extend an existing dataset with bars after its last saved bar.
+
+        Finds the dataset previously written by save_data() for this symbol and
+        timeframe, reads only its last timestamp, downloads just the missing range up
+        to end_date and appends the new rows atomically. Header comments and metadata
+        statistics are refreshed from the appended rows; the data hash is re-streamed over
+        the saved and appended rows so it stays a content hash of the whole dataset.
+        If no dataset exists yet, falls back to a full collect_timeframe_data() run.
+
+        Args:
+            trading_timeframe (str): Timeframe to update (e.g., "1h").
+
+        Returns:
+            dict: Update results containing:
+                - dataframe (pd.DataFrame): Newly appended bars only
+                - filepath (Path): Path to the updated dataset (renamed to the new end date)
+                - stats (dict): Update statistics including bars_appended
+
+        Examples:
+            >>> collector = BinancePublicDataCollector(
+            ...     symbol="BTCUSDT", end_date="2024-06-30", output_dir="./data"
+            ... )
+            >>> result = collector.update("1h")
+            >>> print(f"Appended {result['stats']['bars_appended']} bars")
+            Appended 24 bars
+        """
+        existing_filepath = self.find_existing_output(trading_timeframe)
+        if existing_filepath is None:
+            print(f"ℹ️  No existing {trading_timeframe} dataset found - running full collection")
+            return self.collect_timeframe_data(trading_timeframe)
+
+        update_start = datetime.now()
+        last_timestamp = self._read_last_timestamp(existing_filepath)
+        if last_timestamp is None:
+            print(f"⚠️  {existing_filepath.name} has no data rows - running full collection")
+            return self.collect_timeframe_data(trading_timeframe)
+
+        next_bar_time = last_timestamp + get_timeframe_interval(trading_timeframe)
+
+        print(f"\n{'=' * 60}")
+        print(f"UPDATING {trading_timeframe.upper()} DATA: {existing_filepath.name}")
+        print(f"Last saved bar: {last_timestamp}")
+        print(f"{'=' * 60}")
+
+        up_to_date_result = {
+            "dataframe": pd.DataFrame(columns=OUTPUT_COLUMNS),
+            "filepath": existing_filepath,
+            "stats": {"method": "incremental_update", "bars_appended": 0},
+        }
+
+        if next_bar_time > self.end_date:
+            print(f"✅ {existing_filepath.name} is already up to date")
+            return up_to_date_result
+
+        new_rows = self._download_candle_rows(trading_timeframe, next_bar_time, self.end_date)
+        # Monthly archives start at the month boundary - drop anything already saved
+        last_saved = last_timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        new_rows = [row for row in new_rows if row[0] > last_saved]
+
+        if not new_rows:
+            print(f"✅ No new bars available after {last_saved}")
+            return up_to_date_result
+
+        duration = (datetime.now() - update_start).total_seconds()
+        collection_stats = {
+            "method": "incremental_update",
+            "duration": duration,
+            "bars_per_second": len(new_rows) / duration if duration > 0 else 0,
+            "total_bars": len(new_rows),
+            "bars_appended": len(new_rows),
+        }
+
+        filepath = self._append_to_existing_output(
+            existing_filepath, trading_timeframe, new_rows, last_saved, collection_stats
+        )
+        self.task_staging.clear(self.symbol, trading_timeframe)
+
+        return {
+            "dataframe": self._rows_to_dataframe(new_rows),
+            "filepath": filepath,
+            "stats": collection_stats,
+        }
+
+    def _append_to_existing_output(
+        self,
+        existing_filepath: Path,
+        timeframe: str,
+        new_rows: List[List],
+        last_saved: str,
+        collection_stats: Dict[str, Any],
+    ) -> Path:
+        """Append rows to a saved dataset and refresh its header and metadata incrementally."""
+        filename_match = OUTPUT_FILENAME_PATTERN.match(existing_filepath.name)
+        end_date_str = datetime.strptime(new_rows[-1][0], "%Y-%m-%d %H:%M:%S").strftime("%Y%m%d")
+        target_filepath = existing_filepath.with_name(
+            f"binance_spot_{self.symbol}-{timeframe}_{filename_match.group('start')}-{end_date_str}"
+            f"_{filename_match.group('version')}.{filename_match.group('extension')}"
+        )
+
+        existing_metadata_filepath = existing_filepath.with_suffix(".metadata.json")
+        if existing_metadata_filepath.exists():
+            with open(existing_metadata_filepath, "r") as f:
+                metadata = json.load(f)
+        else:
+            # No metadata to extend - build a baseline from the saved rows once
+            existing_df = pd.read_csv(
+                existing_filepath, comment="#", dtype={"date": str, "close_time": str}
+            )
+            existing_rows = existing_df[OUTPUT_COLUMNS].values.tolist()
+            metadata = self.generate_metadata(
+                timeframe,
+                existing_rows,
+                collection_stats,
+                self._perform_gap_analysis(existing_rows, timeframe),
+            )
+
+        self._extend_metadata(
+            metadata, existing_filepath, timeframe, new_rows, last_saved, collection_stats
+        )
+
+        new_df = self._rows_to_output_frame(new_rows)
+        if existing_filepath.suffix == ".parquet":
+            combined_df = pd.concat(
+                [pd.read_parquet(existing_filepath, engine="pyarrow"), new_df], ignore_index=True
+            )
+            self._replace_atomic(
+                target_filepath,
+                lambda temp_path: write_partitioned_parquet(combined_df, temp_path),
+            )
+        elif existing_filepath.suffix == ".arrow":
+            combined_df = pd.concat(
+                [read_arrow_ipc_table(existing_filepath).to_pandas(), new_df], ignore_index=True
+            )
+            self._replace_atomic(
+                target_filepath,
+                lambda temp_path: write_arrow_ipc(
+                    combined_df, temp_path, compression=self.arrow_compression
+                ),
+            )
+        else:
+            header_lines = self._format_csv_header(metadata, collection_stats)
+            self._replace_atomic(
+                target_filepath,
+                lambda temp_path: self._write_appended_csv(
+                    existing_filepath, temp_path, header_lines, new_df
+                ),
+            )
+
+        if target_filepath != existing_filepath:
+            existing_filepath.unlink()
+
+        target_metadata_filepath = target_filepath.with_suffix(".metadata.json")
+        self._replace_atomic(
+            target_metadata_filepath,
+            lambda temp_path: temp_path.write_text(json.dumps(metadata, indent=2)),
+        )
+        if target_metadata_filepath != existing_metadata_filepath and (
+            existing_metadata_filepath.exists()
+        ):
+            existing_metadata_filepath.unlink()
+
+        self._record_in_catalog(target_filepath, timeframe, metadata, replaces=existing_filepath)
+
+        file_size_mb = target_filepath.stat().st_size / (1024 * 1024)
+        print(f"📊 Appended {len(new_rows):,} bars to {target_filepath.name}")
+        print(f"\n✅ Updated: {target_filepath.name} ({file_size_mb:.1f} MB)")
+        print(f"✅ Metadata: {target_metadata_filepath.name}")
+
+        return target_filepath
+
+    def _extend_metadata(
+        self,
+        metadata: Dict[str, Any],
+        existing_filepath: Path,
+        timeframe: str,
+        new_rows: List[List],
+        last_saved: str,
+        collection_stats: Dict[str, Any],
+    ) -> None:
+        """Fold appended rows into existing metadata; only the data hash re-reads saved rows."""
+        previous_bars = metadata.get("actual_bars", 0)
+        total_bars = previous_bars + len(new_rows)
+
+        metadata["generation_timestamp"] = datetime.now(timezone.utc).isoformat() + "Z"
+        metadata["actual_bars"] = total_bars
+        metadata.setdefault("date_range", {})["end"] = new_rows[-1][0]
+        metadata.setdefault("target_period", {})["end"] = self.end_date.isoformat()
+
+        # Statistics: combine running aggregates with the appended slice
+        new_prices = [value for row in new_rows for value in (row[2], row[3])]
+        new_volume_total = sum(row[5] for row in new_rows)
+        statistics = metadata.setdefault("statistics", {})
+        if previous_bars:
+            statistics["price_min"] = min(statistics.get("price_min", min(new_prices)), *new_prices)
+            statistics["price_max"] = max(statistics.get("price_max", max(new_prices)), *new_prices)
+        else:
+            statistics["price_min"] = min(new_prices)
+            statistics["price_max"] = max(new_prices)
+        statistics["volume_total"] = statistics.get("volume_total", 0) + new_volume_total
+        statistics["volume_mean"] = statistics["volume_total"] / total_bars
+
+        # Data hash: stream the saved rows and the appended rows through one content hash,
+        # so the digest equals what save_data() would record for the combined dataset
+        data_integrity = metadata.setdefault("data_integrity", {})
+        data_hasher = StreamingDataHasher()
+        self._hash_saved_rows(existing_filepath, data_hasher)
+        data_hasher.update_rows(new_rows)
+        data_integrity["data_hash"] = data_hasher.hexdigest()
+        data_integrity["hash_method"] = "sha256_canonical_rows"
+        data_integrity["merkle_root"] = data_hasher.merkle_root()
+        data_integrity["month_hashes"] = data_hasher.month_hashes()
+
+        # Gap analysis: only the boundary bar plus appended rows can introduce new gaps
+        appended_gaps = self._perform_gap_analysis([[last_saved]] + new_rows, timeframe)
+        gap_analysis = metadata.get("gap_analysis") or {}
+        if gap_analysis.get("analysis_performed"):
+            gap_analysis["total_gaps_detected"] += appended_gaps["total_gaps_detected"]
+            gap_analysis["gaps_remaining"] = (
+                gap_analysis.get("gaps_remaining", 0) + (appended_gaps["gaps_remaining"])
+            )
+            gap_analysis["gap_details"] = (
+                gap_analysis.get("gap_details", []) + appended_gaps["gap_details"]
+            )
+            gap_analysis["total_missing_bars"] = gap_analysis.get(
+                "total_missing_bars", 0
+            ) + appended_gaps.get("total_missing_bars", 0)
+            bars_should_exist = total_bars + gap_analysis["total_missing_bars"]
+            gap_analysis["data_completeness_score"] = round(total_bars / bars_should_exist, 4)
+            gap_analysis["analysis_timestamp"] = appended_gaps.get("analysis_timestamp")
+            metadata["gap_analysis"] = gap_analysis
+
+        metadata.setdefault("incremental_updates", []).append(
+            {
+                "updated_at": metadata["generation_timestamp"],
+                "bars_appended": len(new_rows),
+                "range": {"start": new_rows[0][0], "end": new_rows[-1][0]},
+                "duration": collection_stats["duration"],
+            }
+        )
+
+    def _write_appended_csv(
+        self, source_filepath: Path, temp_path: Path, header_lines: List[str], new_df: pd.DataFrame
+    ) -> None:
+        """Write refreshed header + existing data bytes + new rows into temp_path."""
+        with open(source_filepath, "rb") as source, open(temp_path, "wb") as output:
+            output.write(("\n".join(header_lines) + "\n").encode("utf-8"))
+
+            # Skip the old header comments, then stream the rest of the file unchanged
+            data_offset = 0
+            for line in source:
+                if not line.startswith(b"#"):
+                    break
+                data_offset += len(line)
+            source.seek(data_offset)
+            shutil.copyfileobj(source, output, 16 * 1024 * 1024)
+
+            source.seek(0, os.SEEK_END)
+            if source.tell() > data_offset:
+                source.seek(-1, os.SEEK_END)
+                if source.read(1) != b"\n":
+                    output.write(b"\n")
+
+            output.write(new_df.to_csv(header=False, index=False).encode("utf-8"))
+            output.flush()
+            os.fsync(output.fileno())
+
+    def _replace_atomic(self, target_path: Path, write_func) -> None:
+        """Run write_func against a temp file next to target_path, then rename into place."""
+        temp_fd, temp_name = tempfile.mkstemp(
+            suffix=f"{target_path.suffix}.tmp", dir=target_path.parent
+        )
+        os.close(temp_fd)
+        temp_path = Path(temp_name)
+        try:
+            write_func(temp_path)
+            os.replace(temp_path, target_path)
+        except Exception:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
     def collect_multiple_timeframes(
         self, timeframes: Optional[List[str]] = None
     ) -> Dict[str, Dict[str, Any]]:
@@ -1338,6 +1821,7 @@ class BinancePublicDataCollector:
 
                 # Save to CSV using existing method
                 filepath = self.save_data(trading_timeframe, processed_data, collection_stats)
+                orchestrator.task_staging.clear(self.symbol, trading_timeframe)
 
                 # Convert to DataFrame
                 columns = [
@@ -1497,14 +1981,25 @@ class BinancePublicDataCollector:
             )
 
     def validate_csv_file(
-        self, csv_filepath: Union[str, Path], expected_timeframe: Optional[str] = None
+        self,
+        csv_filepath: Union[str, Path],
+        expected_timeframe: Optional[str] = None,
+        chunk_rows: Optional[int] = None,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         """
         Comprehensive validation of CSV file data integrity, completeness, and quality.
 
+        Files of STREAMING_THRESHOLD_BYTES or more (or any file when chunk_rows is
+        given) are validated in chunks, so memory stays bounded by the chunk size.
+        Results saved by update_metadata_with_validation are returned as they are
+        while the file, the validator version and the parameters are unchanged.
+
         Args:
             csv_filepath: Path to CSV file to validate
             expected_timeframe: Expected timeframe (e.g., '30m') for interval validation
+            chunk_rows: Rows per chunk to stream the file (auto-selected for large files)
+            use_cache: Reuse stored results for an unchanged file
 
         Returns:
             dict: Validation results with detailed analysis
@@ -1530,16 +2025,42 @@ class BinancePublicDataCollector:
 
         validation_results["file_size_mb"] = csv_filepath.stat().st_size / (1024 * 1024)
 
+        if chunk_rows is None and csv_filepath.stat().st_size >= STREAMING_THRESHOLD_BYTES:
+            chunk_rows = DEFAULT_CHUNK_ROWS
+
+        unfillable_gaps = self._known_unfillable_gaps(csv_filepath, expected_timeframe)
+        if use_cache:
+            cached_results = load_cached_validation(
+                csv_filepath, expected_timeframe, unfillable_gaps
+            )
+            if cached_results is not None:
+                print(f"  ♻️  Unchanged since {cached_results['validation_timestamp']}")
+                print(f"  VALIDATION RESULT (cached): {cached_results['validation_summary']}")
+                return cached_results
+
         try:
-            # Load CSV data efficiently
-            print("Loading and parsing CSV data...")
-            df = pd.read_csv(csv_filepath, comment="#")
-            validation_results["total_bars"] = len(df)
-            print(f"  ✅ Loaded {len(df):,} data bars")
+            # Key the results to the file as it is before reading it
+            cache_key = validation_cache_key(csv_filepath, expected_timeframe, unfillable_gaps)
+            if chunk_rows:
+                # Carry running state across chunks instead of loading the whole file
+                print(f"Streaming CSV data in chunks of {chunk_rows:,} rows...")
+                kernel = StreamingOHLCVValidator.from_csv(
+                    csv_filepath, expected_timeframe, chunk_rows, unfillable_gaps
+                )
+                total_bars = kernel.row_count
+            else:
+                # Load CSV data efficiently
+                print("Loading and parsing CSV data...")
+                df = pd.read_csv(csv_filepath, comment="#")
+                # All sections share one parse of the dates and one set of column arrays
+                kernel = OHLCVValidationKernel(df, expected_timeframe, unfillable_gaps)
+                total_bars = len(df)
+            validation_results["total_bars"] = total_bars
+            print(f"  ✅ Loaded {total_bars:,} data bars")
 
             # 1. BASIC STRUCTURE VALIDATION
             print("\n1. BASIC STRUCTURE VALIDATION")
-            structure_validation = self._validate_csv_structure(df)
+            structure_validation = kernel.structure()
             validation_results["structure_validation"] = structure_validation
             print(f"  Columns: {structure_validation['status']}")
             if structure_validation["errors"]:
@@ -1549,13 +2070,15 @@ class BinancePublicDataCollector:
 
             # 2. DATE/TIME VALIDATION
             print("\n2. DATE/TIME VALIDATION")
-            datetime_validation = self._validate_datetime_sequence(df, expected_timeframe)
+            datetime_validation = kernel.datetime_sequence()
             validation_results["datetime_validation"] = datetime_validation
             print(
                 f"  Date Range: {datetime_validation['date_range']['start']} to {datetime_validation['date_range']['end']}"
             )
             print(f"  Duration: {datetime_validation['duration_days']:.1f} days")
             print(f"  Gaps Found: {datetime_validation['gaps_found']}")
+            if datetime_validation.get("known_outages"):
+                print(f"  Known Exchange Outages: {datetime_validation['known_outages']}")
             print(f"  Sequence: {datetime_validation['chronological_order']}")
 
             if datetime_validation["errors"]:
@@ -1569,7 +2092,7 @@ class BinancePublicDataCollector:
 
             # 3. OHLCV DATA QUALITY VALIDATION
             print("\n3. OHLCV DATA QUALITY VALIDATION")
-            ohlcv_validation = self._validate_ohlcv_quality(df)
+            ohlcv_validation = kernel.ohlcv_quality()
             validation_results["ohlcv_validation"] = ohlcv_validation
             print(
                 f"  Price Range: ${ohlcv_validation['price_range']['min']:.4f} - ${ohlcv_validation['price_range']['max']:.4f}"
@@ -1591,7 +2114,7 @@ class BinancePublicDataCollector:
 
             # 4. EXPECTED COVERAGE VALIDATION
             print("\n4. EXPECTED COVERAGE VALIDATION")
-            coverage_validation = self._validate_expected_coverage(df, expected_timeframe)
+            coverage_validation = kernel.expected_coverage()
             validation_results["coverage_validation"] = coverage_validation
             print(f"  Expected Bars: {coverage_validation['expected_bars']:,}")
             print(f"  Actual Bars: {coverage_validation['actual_bars']:,}")
@@ -1599,7 +2122,7 @@ class BinancePublicDataCollector:
 
             # 5. STATISTICAL ANOMALY DETECTION
             print("\n5. STATISTICAL ANOMALY DETECTION")
-            anomaly_validation = self._validate_statistical_anomalies(df)
+            anomaly_validation = kernel.statistical_anomalies()
             validation_results["anomaly_validation"] = anomaly_validation
             print(f"  Price Outliers: {anomaly_validation['price_outliers']}")
             print(f"  Volume Outliers: {anomaly_validation['volume_outliers']}")
@@ -1628,6 +2151,8 @@ class BinancePublicDataCollector:
                     f"   {validation_results['total_errors']} errors and {validation_results['total_warnings']} warnings found."
                 )
 
+            validation_results["cache_key"] = cache_key
+
         except Exception as e:
             validation_results["validation_summary"] = f"ERROR - {str(e)}"
             validation_results["total_errors"] += 1
@@ -1637,296 +2162,44 @@ class BinancePublicDataCollector:
 
     def _validate_csv_structure(self, df):
         """Validate CSV has correct structure and columns."""
-        # Enhanced expected columns for complete microstructure data
-        expected_columns = [
-            "date",
-            "open",
-            "high",
-            "low",
-            "close",
-            "volume",
-            "close_time",
-            "quote_asset_volume",
-            "number_of_trades",
-            "taker_buy_base_asset_volume",
-            "taker_buy_quote_asset_volume",
-        ]
-
-        # Legacy format for backward compatibility
-        legacy_columns = ["date", "open", "high", "low", "close", "volume"]
-
-        errors = []
-        warnings = []
-
-        # Check if it's enhanced or legacy format
-        has_enhanced_format = all(col in df.columns for col in expected_columns)
-        has_legacy_format = all(col in df.columns for col in legacy_columns)
-
-        if has_enhanced_format:
-            # Validate enhanced format
-            missing_columns = [col for col in expected_columns if col not in df.columns]
-            if missing_columns:
-                errors.append(f"Missing enhanced columns: {missing_columns}")
-        elif has_legacy_format:
-            # Legacy format detected
-            warnings.append(
-                "Legacy format detected - missing microstructure columns for advanced analysis"
-            )
-            missing_enhanced = [col for col in expected_columns if col not in df.columns]
-            warnings.append(f"Enhanced features unavailable: {missing_enhanced}")
-        else:
-            # Neither format complete
-            missing_basic = [col for col in legacy_columns if col not in df.columns]
-            errors.append(f"Missing basic required columns: {missing_basic}")
-
-        extra_columns = [col for col in df.columns if col not in expected_columns]
-        if extra_columns:
-            warnings.append(f"Unexpected extra columns: {extra_columns}")
-
-        # Check for empty data
-        if len(df) == 0:
-            errors.append("CSV file is empty (no data rows)")
-
-        return {
-            "status": "VALID" if not errors else "INVALID",
-            "format_type": "enhanced"
-            if has_enhanced_format
-            else "legacy"
-            if has_legacy_format
-            else "incomplete",
-            "errors": errors,
-            "warnings": warnings,
-            "columns_found": list(df.columns),
-            "expected_columns": expected_columns,
-            "legacy_columns": legacy_columns,
-        }
+        return OHLCVValidationKernel(df).structure()
 
-    def _validate_datetime_sequence(self, df, expected_timeframe):
-        """Validate datetime sequence is complete and chronological."""
-        errors = []
-        warnings = []
-        gaps_found = 0
-
-        # Convert date column to datetime
+    def _known_unfillable_gaps(self, csv_filepath, expected_timeframe):
+        """Gaps of this dataset registered in its directory catalog as exchange outages."""
+        if not expected_timeframe:
+            return []
         try:
-            df["datetime"] = pd.to_datetime(df["date"])
-        except Exception as e:
-            errors.append(f"Failed to parse dates: {e}")
-            return {"status": "INVALID", "errors": errors, "warnings": warnings}
-
-        # Check chronological order
-        is_sorted = df["datetime"].is_monotonic_increasing
-
-        # Find gaps if we have expected timeframe
-        gap_details = []
-        if expected_timeframe and len(df) > 1:
-            # Calculate expected interval in minutes
-            interval_map = {"1m": 1, "3m": 3, "5m": 5, "15m": 15, "30m": 30, "1h": 60, "2h": 120}
-            expected_interval = interval_map.get(expected_timeframe, 0)
-
-            if expected_interval > 0:
-                expected_delta = pd.Timedelta(minutes=expected_interval)
-
-                # Check for gaps
-                for i in range(1, len(df)):
-                    actual_delta = df["datetime"].iloc[i] - df["datetime"].iloc[i - 1]
-                    if actual_delta > expected_delta:
-                        gaps_found += 1
-                        gap_details.append(
-                            {
-                                "position": i,
-                                "expected_time": (
-                                    df["datetime"].iloc[i - 1] + expected_delta
-                                ).isoformat(),
-                                "actual_time": df["datetime"].iloc[i].isoformat(),
-                                "gap_duration": str(actual_delta - expected_delta),
-                            }
-                        )
-
-                        # Record every single gap for complete validation tracking
-                        warnings.append(
-                            f"Gap at position {i}: expected {expected_delta}, got {actual_delta}"
-                        )
-
-        if not is_sorted:
-            errors.append("Timestamps are not in chronological order")
+            catalog = DatasetCatalog.existing(Path(csv_filepath).parent)
+            if catalog is None:
+                return []
+            dataset = catalog.get(csv_filepath)
+            symbol = dataset.symbol if dataset else self.symbol
+            return catalog.find_unfillable_gaps(symbol, expected_timeframe)
+        except CatalogError as e:
+            print(f"  ⚠️  Could not read unfillable gap registry: {e}")
+            return []
 
-        if gaps_found > 10:
-            errors.append(f"Too many gaps found: {gaps_found} (data may be incomplete)")
-        elif gaps_found > 0:
-            warnings.append(f"{gaps_found} timestamp gaps found (market closures or data issues)")
+    def _validate_datetime_sequence(self, df, expected_timeframe, unfillable_gaps=None):
+        """Validate datetime sequence is complete and chronological.
 
-        return {
-            "status": "VALID" if not errors else "INVALID",
-            "errors": errors,
-            "warnings": warnings,
-            "date_range": {
-                "start": df["datetime"].min().isoformat(),
-                "end": df["datetime"].max().isoformat(),
-            },
-            "duration_days": (df["datetime"].max() - df["datetime"].min()).days,
-            "chronological_order": is_sorted,
-            "gaps_found": gaps_found,
-            "gap_details": gap_details,  # Complete gap details for thorough analysis
-        }
+        Gaps inside a registered exchange outage (see DatasetCatalog.record_unfillable_gap)
+        are reported as known_outages instead of warnings or errors.
+        """
+        return OHLCVValidationKernel(
+            df, expected_timeframe, unfillable_gaps=unfillable_gaps
+        ).datetime_sequence()
 
     def _validate_ohlcv_quality(self, df):
         """Validate OHLCV data quality and logical consistency."""
-        errors = []
-        warnings = []
-
-        # Check for negative or zero values
-        negative_zero_count = 0
-        for col in ["open", "high", "low", "close"]:
-            negative_zero = (df[col] <= 0).sum()
-            if negative_zero > 0:
-                errors.append(f"Found {negative_zero} negative/zero values in {col}")
-                negative_zero_count += negative_zero
-
-        # Check volume (can be zero but not negative)
-        negative_volume = (df["volume"] < 0).sum()
-        if negative_volume > 0:
-            errors.append(f"Found {negative_volume} negative volume values")
-
-        zero_volume = (df["volume"] == 0).sum()
-        if zero_volume > 0:
-            warnings.append(f"Found {zero_volume} zero volume bars")
-
-        # Check OHLC logic: High >= Low, Open/Close within High/Low range
-        ohlc_errors = 0
-
-        # High should be >= Low
-        high_low_errors = (df["high"] < df["low"]).sum()
-        if high_low_errors > 0:
-            errors.append(f"Found {high_low_errors} bars where High < Low")
-            ohlc_errors += high_low_errors
-
-        # Open should be within High/Low range
-        open_range_errors = ((df["open"] > df["high"]) | (df["open"] < df["low"])).sum()
-        if open_range_errors > 0:
-            errors.append(f"Found {open_range_errors} bars where Open is outside High/Low range")
-            ohlc_errors += open_range_errors
-
-        # Close should be within High/Low range
-        close_range_errors = ((df["close"] > df["high"]) | (df["close"] < df["low"])).sum()
-        if close_range_errors > 0:
-            errors.append(f"Found {close_range_errors} bars where Close is outside High/Low range")
-            ohlc_errors += close_range_errors
-
-        return {
-            "status": "VALID" if not errors else "INVALID",
-            "errors": errors,
-            "warnings": warnings,
-            "price_range": {
-                "min": min(df["low"].min(), df["high"].min(), df["open"].min(), df["close"].min()),
-                "max": max(df["low"].max(), df["high"].max(), df["open"].max(), df["close"].max()),
-            },
-            "volume_stats": {
-                "min": df["volume"].min(),
-                "max": df["volume"].max(),
-                "mean": df["volume"].mean(),
-            },
-            "ohlc_errors": ohlc_errors,
-            "negative_zero_values": negative_zero_count,
-        }
+        return OHLCVValidationKernel(df).ohlcv_quality()
 
     def _validate_expected_coverage(self, df, expected_timeframe):
         """Validate data coverage matches expected timeframe and duration."""
-        warnings = []
-
-        if not expected_timeframe or len(df) == 0:
-            return {"status": "SKIPPED", "warnings": ["Cannot validate coverage without timeframe"]}
-
-        # Calculate expected bars based on timeframe and actual date range
-        df["datetime"] = pd.to_datetime(df["date"])
-        start_time = df["datetime"].min()
-        end_time = df["datetime"].max()
-        duration = end_time - start_time
-
-        # Calculate expected number of bars
-        interval_map = {"1m": 1, "3m": 3, "5m": 5, "15m": 15, "30m": 30, "1h": 60, "2h": 120}
-        interval_minutes = interval_map.get(expected_timeframe, 0)
-
-        if interval_minutes > 0:
-            expected_bars = int(duration.total_seconds() / (interval_minutes * 60)) + 1
-            actual_bars = len(df)
-            coverage_percentage = (actual_bars / expected_bars) * 100
-
-            if coverage_percentage < 95:
-                warnings.append(
-                    f"Low coverage: {coverage_percentage:.1f}% (may indicate missing data)"
-                )
-            elif coverage_percentage > 105:
-                warnings.append(
-                    f"High coverage: {coverage_percentage:.1f}% (may indicate duplicate data)"
-                )
-        else:
-            expected_bars = 0
-            coverage_percentage = 0
-            warnings.append(f"Unknown timeframe '{expected_timeframe}' for coverage calculation")
-
-        return {
-            "status": "VALID" if not warnings else "WARNING",
-            "warnings": warnings,
-            "expected_bars": expected_bars,
-            "actual_bars": len(df),
-            "coverage_percentage": coverage_percentage,
-            "duration_days": duration.days,
-        }
+        return OHLCVValidationKernel(df, expected_timeframe).expected_coverage()
 
     def _validate_statistical_anomalies(self, df):
         """Detect statistical anomalies in price and volume data."""
-        warnings = []
-
-        # Calculate basic statistics
-        price_cols = ["open", "high", "low", "close"]
-
-        # Price outliers (using IQR method)
-        price_outliers = 0
-        for col in price_cols:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outliers = ((df[col] < lower_bound) | (df[col] > upper_bound)).sum()
-            price_outliers += outliers
-
-        # Volume outliers
-        vol_Q1 = df["volume"].quantile(0.25)
-        vol_Q3 = df["volume"].quantile(0.75)
-        vol_IQR = vol_Q3 - vol_Q1
-        vol_upper_bound = vol_Q3 + 1.5 * vol_IQR
-        volume_outliers = (df["volume"] > vol_upper_bound).sum()
-
-        # Suspicious patterns
-        suspicious_patterns = 0
-
-        # Check for repeated identical prices (suspicious)
-        for col in price_cols:
-            repeated = df[col].value_counts()
-            max_repeats = repeated.max()
-            if max_repeats > len(df) * 0.1:  # More than 10% identical values
-                warnings.append(f"Suspicious: {col} has {max_repeats} repeated values")
-                suspicious_patterns += 1
-
-        if price_outliers > len(df) * 0.05:  # More than 5% outliers
-            warnings.append(
-                f"High number of price outliers: {price_outliers} ({100 * price_outliers / len(df):.1f}%)"
-            )
-
-        if volume_outliers > len(df) * 0.02:  # More than 2% volume outliers
-            warnings.append(
-                f"High number of volume outliers: {volume_outliers} ({100 * volume_outliers / len(df):.1f}%)"
-            )
-
-        return {
-            "status": "VALID" if not warnings else "WARNING",
-            "warnings": warnings,
-            "price_outliers": price_outliers,
-            "volume_outliers": volume_outliers,
-            "suspicious_patterns": suspicious_patterns,
-        }
+        return OHLCVValidationKernel(df).statistical_anomalies()
 
     def update_metadata_with_validation(self, csv_filepath, validation_results):
         """Update metadata JSON file with validation results."""
@@ -1969,6 +2242,21 @@ class BinancePublicDataCollector:
         with open(metadata_filepath, "w") as f:
             json.dump(convert_numpy_types(metadata), f, indent=2)
 
+        catalog = DatasetCatalog.existing(Path(csv_filepath).parent)
+        if catalog is not None:
+            catalog.record_validation(
+                csv_filepath,
+                status=validation_results["validation_summary"].split(" ")[0],
+                summary=convert_numpy_types(
+                    {
+                        "validation_timestamp": validation_results.get("validation_timestamp"),
+                        "validation_summary": validation_results["validation_summary"],
+                        "total_errors": validation_results["total_errors"],
+                        "total_warnings": validation_results["total_warnings"],
+                    }
+                ),
+            )
+
         print(f"✅ Updated metadata: {metadata_filepath.name}")
 
     def apply_gap_filling_to_validated_files(self):
@@ -1982,34 +2270,29 @@ class BinancePublicDataCollector:
             # Initialize gap filling components
             gap_filler = UniversalGapFiller()
 
-            # Find CSV files to check for gaps
-            csv_files = list(Path(self.output_dir).glob("*.csv"))
+            # Look up this symbol's CSV datasets in the output directory catalog
+            catalog = DatasetCatalog.for_directory(self.output_dir)
+            symbol_datasets = catalog.find(symbol=self.symbol, format="csv")
 
-            if not csv_files:
-                print("❌ No CSV files found for gap filling")
-                return
-
-            # Filter to only files for this symbol
-            symbol_files = [f for f in csv_files if self.symbol in f.name]
-
-            if not symbol_files:
+            if not symbol_datasets:
                 print(f"❌ No CSV files found for symbol {self.symbol}")
                 return
 
-            print(f"🔍 Analyzing {len(symbol_files)} files for gaps...")
+            print(f"🔍 Analyzing {len(symbol_datasets)} files for gaps...")
 
             total_gaps_detected = 0
             total_gaps_filled = 0
             total_gaps_failed = 0
+            total_gaps_unfillable = 0
             files_processed = 0
             results = []
 
-            for csv_file in symbol_files:
+            for dataset in symbol_datasets:
+                csv_file = dataset.path
                 print(f"\n📁 Processing: {csv_file.name}")
 
-                # Extract timeframe from filename
-                file_timeframe = self._extract_timeframe_from_filename(csv_file.name)
-                print(f"   📊 Detected timeframe: {file_timeframe}")
+                file_timeframe = dataset.timeframe
+                print(f"   📊 Cataloged timeframe: {file_timeframe}")
 
                 # Use the proper UniversalGapFiller process_file method
                 result = gap_filler.process_file(csv_file, file_timeframe)
@@ -2020,6 +2303,7 @@ class BinancePublicDataCollector:
                 total_gaps_detected += result["gaps_detected"]
                 total_gaps_filled += result["gaps_filled"]
                 total_gaps_failed += result["gaps_failed"]
+                total_gaps_unfillable += result["gaps_unfillable"]
 
                 # Report per-file results
                 if result["gaps_detected"] == 0:
@@ -2050,14 +2334,18 @@ class BinancePublicDataCollector:
                     )
 
             print("-" * 60)
+            fillable_gaps = total_gaps_detected - total_gaps_unfillable
             overall_success = (
-                (total_gaps_filled / total_gaps_detected * 100)
-                if total_gaps_detected > 0
-                else 100.0
+                (total_gaps_filled / fillable_gaps * 100) if fillable_gaps > 0 else 100.0
             )
             print(
-                f"🎯 OVERALL: {total_gaps_filled}/{total_gaps_detected} gaps filled ({overall_success:.1f}%)"
+                f"🎯 OVERALL: {total_gaps_filled}/{fillable_gaps} gaps filled ({overall_success:.1f}%)"
             )
+            if total_gaps_unfillable:
+                print(
+                    f"📋 {total_gaps_unfillable} gaps are confirmed exchange outages "
+                    "(no data upstream)"
+                )
 
             if overall_success == 100.0:
                 print("🎉 ALL GAPS FILLED SUCCESSFULLY!")
@@ -2079,30 +2367,6 @@ class BinancePublicDataCollector:
 
             traceback.print_exc()
 
-    def _extract_timeframe_from_filename(self, filename):
-        """Extract timeframe from filename (e.g., 'SOLUSDT-15m-data.csv' -> '15m')"""
-        for tf in [
-            "1s",
-            "1m",
-            "3m",
-            "5m",
-            "15m",
-            "30m",
-            "1h",
-            "2h",
-            "4h",
-            "6h",
-            "8h",
-            "12h",
-            "1d",
-            "3d",
-            "1w",
-            "1mo",
-        ]:
-            if f"-{tf}_" in filename or f"-{tf}-" in filename:
-                return tf
-        return "15m"  # Default
-
 
 def main():
     """Main execution function with CLI argument support."""
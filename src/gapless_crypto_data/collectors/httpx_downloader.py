@@ -162,6 +162,7 @@ class ConcurrentDownloadManager:
         self,
         tasks: List[DownloadTask],
         progress_callback: Optional[Callable[[int, int, DownloadTask], None]] = None,
+        result_callback: Optional[Callable[[DownloadResult], None]] = None,
     ) -> List[DownloadResult]:
         """
         Download multiple tasks concurrently with progress tracking.
@@ -169,6 +170,8 @@ class ConcurrentDownloadManager:
         Args:
             tasks: List of download tasks to execute
             progress_callback: Optional callback for progress updates
+            result_callback: Optional callback receiving each result as soon as its
+                download finishes (e.g., to checkpoint completed tasks)
 
         Returns:
             List of download results in same order as input tasks
@@ -187,6 +190,8 @@ class ConcurrentDownloadManager:
             nonlocal completed_count
 
             result = await self._download_single_task(task)
+            if result_callback:
+                result_callback(result)
 
             completed_count += 1
             if progress_callback:
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Weight-Aware Async Binance REST Client
+
+Async client for the Binance /api/v3/klines endpoint used by gap filling.
+
+Binance limits REST usage by request weight per minute per IP and reports the
+weight already consumed in the X-MBX-USED-WEIGHT-1M response header. The header
+covers every process on the machine, not just this one. Requests are paced by a
+token bucket that refills continuously and is corrected down to the server-reported
+usage after every response, so concurrent gap filling runs at the highest rate the
+current budget allows and backs off when other processes share the IP.
+
+Key features:
+- Token-bucket limiter synchronized with X-MBX-USED-WEIGHT-1M
+- Single pooled httpx.AsyncClient shared by all requests
+- Concurrent 1000-bar pages stitched back in open-time order
+- Retry-After handling for HTTP 429/418 responses
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import httpx
+
+from ..utils import get_timeframe_interval
+
+BINANCE_KLINES_URL = "https://api.binance.com/api/v3/klines"
+
+# Binance spot REST limits: request weight per minute per IP, and the weight of one
+# klines request with limit <= 1000
+DEFAULT_WEIGHT_LIMIT_PER_MINUTE = 6000
+KLINES_REQUEST_WEIGHT = 2
+KLINES_PAGE_LIMIT = 1000
+
+USED_WEIGHT_HEADER = "X-MBX-USED-WEIGHT-1M"
+
+logger = logging.getLogger(__name__)
+
+
+class WeightRateLimiter:
+    """
+    Token bucket over Binance request weight, driven by server-reported usage.
+
+    The bucket holds up to ``weight_limit_per_minute * safety_factor`` tokens and
+    refills at that amount per minute. After each response the reported used weight
+    caps the available tokens, so weight spent by other clients on the same IP is
+    accounted for. One limiter can be shared by several clients to give them a
+    common budget, including clients running on different threads and event loops.
+
+    Examples:
+        >>> limiter = WeightRateLimiter(weight_limit_per_minute=6000)
+        >>> await limiter.acquire(KLINES_REQUEST_WEIGHT)
+        >>> limiter.observe_used_weight(int(response.headers["X-MBX-USED-WEIGHT-1M"]))
+    """
+
+    def __init__(
+        self,
+        weight_limit_per_minute: int = DEFAULT_WEIGHT_LIMIT_PER_MINUTE,
+        safety_factor: float = 0.8,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            weight_limit_per_minute: Binance request weight limit per minute
+            safety_factor: Fraction of the limit this limiter may use
+        """
+        self.capacity = weight_limit_per_minute * safety_factor
+        self.refill_per_second = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.blocked_until = 0.0
+        self._updated_at = time.monotonic()
+        # Guards bucket state only; waiting happens outside it on the caller's loop
+        self._state_lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated_at) * self.refill_per_second
+        )
+        self._updated_at = now
+
+    async def acquire(self, weight: int) -> None:
+        """Wait until ``weight`` tokens are available, then consume them."""
+        while True:
+            with self._state_lock:
+                self._refill()
+                wait_seconds = self.blocked_until - time.monotonic()
+                if wait_seconds <= 0:
+                    if self.tokens >= weight:
+                        self.tokens -= weight
+                        return
+                    wait_seconds = (weight - self.tokens) / self.refill_per_second
+            await asyncio.sleep(wait_seconds)
+
+    def observe_used_weight(self, used_weight: int) -> None:
+        """Cap available tokens by the weight Binance reports as used this minute."""
+        with self._state_lock:
+            self._refill()
+            self.tokens = min(self.tokens, self.capacity - used_weight)
+
+    def block_for(self, seconds: float) -> None:
+        """Stop issuing requests for ``seconds`` (server asked us to back off)."""
+        with self._state_lock:
+            self.tokens = min(self.tokens, 0.0)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class BinanceRestClient:
+    """
+    Pooled async client for Binance klines with weight-aware rate limiting.
+
+    Examples:
+        Fetch a long range as concurrent pages:
+
+        >>> async with BinanceRestClient(max_concurrent=8) as client:
+        ...     klines = await client.fetch_klines("BTCUSDT", "1m", start_ms, end_ms)
+
+        Share one budget between several clients:
+
+        >>> limiter = WeightRateLimiter()
+        >>> async with BinanceRestClient(rate_limiter=limiter) as client:
+        ...     page = await client.get_klines("ETHUSDT", "1h", start_ms, end_ms)
+    """
+
+    def __init__(
+        self,
+        base_url: str = BINANCE_KLINES_URL,
+        rate_limiter: Optional[WeightRateLimiter] = None,
+        max_concurrent: int = 8,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+    ):
+        """
+        Initialize REST client.
+
+        Args:
+            base_url: Klines endpoint URL (overridable for a local stub server)
+            rate_limiter: Limiter to draw request weight from (new one if omitted)
+            max_concurrent: Maximum requests in flight on the pooled connection
+            timeout: Per-request timeout in seconds
+            max_retries: Retry attempts after HTTP 429/418 or transport errors
+        """
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter or WeightRateLimiter()
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        # HTTP client will be initialized in __aenter__
+        self.client: Optional[httpx.AsyncClient] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        """Open the pooled HTTP client."""
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=self.max_concurrent,
+                max_connections=self.max_concurrent,
+            ),
+            timeout=self.timeout,
+        )
+        self.semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the pooled HTTP client."""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    async def get_klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_timestamp_ms: int,
+        end_timestamp_ms: int,
+        limit: int = KLINES_PAGE_LIMIT,
+    ) -> List[List]:
+        """
+        Fetch one page of raw klines.
+
+        Args:
+            symbol: Trading pair symbol (e.g., "BTCUSDT")
+            interval: Binance kline interval (e.g., "1m")
+            start_timestamp_ms: Inclusive start open time in milliseconds
+            end_timestamp_ms: Inclusive end open time in milliseconds
+            limit: Maximum bars to return (at most 1000)
+
+        Returns:
+            Raw kline rows as returned by Binance
+
+        Raises:
+            RuntimeError: If used outside ``async with``
+            httpx.HTTPError: If the request still fails after retries
+        """
+        if not self.client or not self.semaphore:
+            raise RuntimeError("BinanceRestClient must be used as async context manager")
+
+        params = {
+            "symbol": symbol,
+            "interval": interval,
+            "startTime": start_timestamp_ms,
+            "endTime": end_timestamp_ms,
+            "limit": limit,
+        }
+
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire(KLINES_REQUEST_WEIGHT)
+            try:
+                async with self.semaphore:
+                    response = await self.client.get(self.base_url, params=params)
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(2**attempt)
+                continue
+
+            used_weight = response.headers.get(USED_WEIGHT_HEADER)
+            if used_weight is not None:
+                self.rate_limiter.observe_used_weight(int(used_weight))
+
+            if response.status_code in (418, 429) and attempt < self.max_retries:
+                retry_after = float(response.headers.get("Retry-After", 2**attempt))
+                logger.warning(
+                    f"⏳ Binance rate limit hit (HTTP {response.status_code}), "
+                    f"backing off {retry_after:.0f}s"
+                )
+                self.rate_limiter.block_for(retry_after)
+                continue
+
+            response.raise_for_status()
+            return response.json()
+
+    async def fetch_klines(
+        self, symbol: str, interval: str, start_timestamp_ms: int, end_timestamp_ms: int
+    ) -> List[List]:
+        """
+        Fetch every kline opening in [start, end] as concurrent 1000-bar pages.
+
+        Args:
+            symbol: Trading pair symbol
+            interval: Binance kline interval
+            start_timestamp_ms: Inclusive start open time in milliseconds
+            end_timestamp_ms: Inclusive end open time in milliseconds
+
+        Returns:
+            Raw kline rows in open-time order without duplicates
+        """
+        page_windows = kline_page_windows(start_timestamp_ms, end_timestamp_ms, interval)
+        kline_pages = await asyncio.gather(
+            *(self.get_klines(symbol, interval, *window) for window in page_windows)
+        )
+        return stitch_kline_pages(kline_pages)
+
+
+def kline_page_windows(
+    start_timestamp_ms: int, end_timestamp_ms: int, interval: str
+) -> List[Tuple[int, int]]:
+    """
+    Split [start, end] into inclusive request windows of at most 1000 bars each.
+
+    Args:
+        start_timestamp_ms: Inclusive start open time in milliseconds
+        end_timestamp_ms: Inclusive end open time in milliseconds
+        interval: Binance kline interval (fixed-width, e.g. "1s" to "1w")
+
+    Returns:
+        Ordered (start, end) windows; at least one window
+    """
+    interval_ms = int(get_timeframe_interval(interval).total_seconds() * 1000)
+    page_span_ms = interval_ms * KLINES_PAGE_LIMIT
+    page_windows = [
+        (page_start_ms, min(page_start_ms + page_span_ms - 1, end_timestamp_ms))
+        for page_start_ms in range(start_timestamp_ms, end_timestamp_ms, page_span_ms)
+    ]
+    return page_windows or [(start_timestamp_ms, end_timestamp_ms)]
+
+
+def stitch_kline_pages(kline_pages: List[List[List]]) -> List[List]:
+    """Concatenate kline pages in open-time order, dropping boundary duplicates."""
+    stitched_klines = {}
+    for kline_page in kline_pages:
+        for raw_candle_data in kline_page:
+            stitched_klines.setdefault(int(raw_candle_data[0]), raw_candle_data)
+    return [stitched_klines[open_time] for open_time in sorted(stitched_klines)]
@@ -5,24 +5,161 @@ Prevents data corruption during CSV file modifications by using atomic operation
 
 Key Features:
 - Atomic file writes (temp file + rename)
+- Byte-range splices that copy unchanged data in-kernel (copy_file_range)
+- Copy-on-write (reflink) or hardlink backups with automatic retention
 - Header preservation for commented CSV files
-- Validation checkpoints
+- Write verification from newline counts and a running SHA-256, plus fsync
 - Automatic rollback on failure
 - Progress tracking and validation
 """
 
+import glob
+import hashlib
 import logging
+import os
 import shutil
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import BinaryIO, List, Optional, Tuple
 
 import pandas as pd
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Read/write chunk size when copy_file_range is unavailable (non-Linux, cross-device)
+COPY_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Rendered CSV bytes buffered before each checksum update and write
+WRITE_BUFFER_BYTES = 1024 * 1024
+
+# Linux ioctl sharing all extents of one file with another (btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+# Backups kept per file when no retention is given
+DEFAULT_BACKUP_RETENTION = 3
+BACKUP_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S_%f"
+# Backups written before microsecond timestamps were used
+LEGACY_BACKUP_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing the containing directory (no-op where unsupported)."""
+    try:
+        directory_fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # Windows cannot open directories
+        return
+    try:
+        os.fsync(directory_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(directory_fd)
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(COPY_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _VerifyingWriter:
+    """Text sink for DataFrame.to_csv that records what reaches the file.
+
+    Rendered text is encoded and buffered; each flushed chunk updates a running
+    SHA-256, a newline count and a byte count before it is written, so the written
+    file can be verified without reading it back.
+    """
+
+    def __init__(self, target_file: BinaryIO):
+        self._target_file = target_file
+        self._buffer: List[bytes] = []
+        self._buffered_bytes = 0
+        self.digest = hashlib.sha256()
+        self.newline_count = 0
+        self.bytes_written = 0
+
+    def write(self, text: str) -> int:
+        data = text.encode()
+        self._buffer.append(data)
+        self._buffered_bytes += len(data)
+        if self._buffered_bytes >= WRITE_BUFFER_BYTES:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        chunk = b"".join(self._buffer)
+        self._buffer = []
+        self._buffered_bytes = 0
+
+        self.digest.update(chunk)
+        self.newline_count += chunk.count(b"\n")
+        self.bytes_written += len(chunk)
+        self._target_file.write(chunk)
+
+
+def _reflink(source_path: Path, target_path: Path) -> bool:
+    """Create target as a copy-on-write clone of source; False if unsupported."""
+    if fcntl is None:
+        return False
+
+    with open(source_path, "rb") as source_file, open(target_path, "xb") as target_file:
+        try:
+            fcntl.ioctl(target_file.fileno(), FICLONE, source_file.fileno())
+            cloned = True
+        except OSError:
+            cloned = False
+
+    if not cloned:
+        target_path.unlink()
+        return False
+    shutil.copystat(source_path, target_path)
+    return True
+
+
+def _write_all(target_fd: int, data: bytes) -> None:
+    """Write every byte of data to a file descriptor."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(target_fd, view) :]
+
+
+def _copy_byte_range(source_fd: int, target_fd: int, offset: int, count: int) -> None:
+    """Append source bytes [offset, offset + count) at the target's current position.
+
+    Uses os.copy_file_range so the kernel copies (or reflinks) the data without it
+    passing through user space; falls back to chunked reads where that is unsupported.
+    """
+    use_copy_file_range = hasattr(os, "copy_file_range")
+    while count > 0:
+        if use_copy_file_range:
+            try:
+                copied = os.copy_file_range(source_fd, target_fd, count, offset)
+            except OSError:
+                use_copy_file_range = False
+                continue
+        else:
+            os.lseek(source_fd, offset, os.SEEK_SET)
+            chunk = os.read(source_fd, min(count, COPY_CHUNK_BYTES))
+            _write_all(target_fd, chunk)
+            copied = len(chunk)
+
+        if copied == 0:
+            raise OSError(f"Unexpected end of file copying {count} bytes at offset {offset}")
+        offset += copied
+        count -= copied
+
 
 class AtomicCSVOperations:
     """Safe atomic operations for CSV files with header preservation and corruption prevention.
@@ -73,28 +210,104 @@ class AtomicCSVOperations:
     Note:
         Always call create_backup() before performing write operations
         to enable rollback capability in case of errors.
+
+        Backups are reflinks where the filesystem supports them, otherwise hardlinks,
+        and only then full copies. A hardlink backup shares the file's data until the
+        file is replaced, so every write here goes to a temporary file that is renamed
+        over the original - the data the backup points to is never modified in place.
     """
 
-    def __init__(self, csv_path: Path):
+    def __init__(
+        self,
+        csv_path: Path,
+        keep_backups: Optional[int] = DEFAULT_BACKUP_RETENTION,
+        max_backup_age: Optional[timedelta] = None,
+    ):
+        """Initialize atomic operations for one CSV file.
+
+        Args:
+            csv_path: CSV file to operate on
+            keep_backups: Newest backups of this file kept after each create_backup()
+                (None keeps any number)
+            max_backup_age: Also remove backups older than this (None keeps any age)
+        """
         self.csv_path = Path(csv_path)
+        self.keep_backups = keep_backups
+        self.max_backup_age = max_backup_age
         self.backup_path = None
         self.temp_path = None
+        self.last_write_checksum = None
 
     def create_backup(self) -> Path:
-        """Create timestamped backup of original file"""
+        """Create timestamped backup of original file, then enforce backup retention"""
         if not self.csv_path.exists():
             raise FileNotFoundError(f"Source file not found: {self.csv_path}")
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime(BACKUP_TIMESTAMP_FORMAT)
         backup_name = f"{self.csv_path.stem}.backup_{timestamp}{self.csv_path.suffix}"
         backup_path = self.csv_path.parent / backup_name
 
-        logger.info(f"📦 Creating backup: {backup_path}")
-        shutil.copy2(self.csv_path, backup_path)
+        if _reflink(self.csv_path, backup_path):
+            backup_method = "reflink"
+        else:
+            try:
+                os.link(self.csv_path, backup_path)
+                backup_method = "hardlink"
+            except OSError:
+                shutil.copy2(self.csv_path, backup_path)
+                backup_method = "copy"
+        logger.info(f"📦 Created backup ({backup_method}): {backup_path}")
 
         self.backup_path = backup_path
+        self.prune_backups()
         return backup_path
 
+    def list_backups(self) -> List[Tuple[datetime, Path]]:
+        """Backups of this file with their creation time, oldest first"""
+        backup_prefix = f"{self.csv_path.stem}.backup_"
+        backups = []
+        for backup_path in self.csv_path.parent.glob(
+            f"{glob.escape(backup_prefix)}*{glob.escape(self.csv_path.suffix)}"
+        ):
+            timestamp = backup_path.name[len(backup_prefix) : -len(self.csv_path.suffix) or None]
+            for timestamp_format in (BACKUP_TIMESTAMP_FORMAT, LEGACY_BACKUP_TIMESTAMP_FORMAT):
+                try:
+                    backups.append((datetime.strptime(timestamp, timestamp_format), backup_path))
+                    break
+                except ValueError:
+                    continue
+        return sorted(backups)
+
+    def prune_backups(self) -> List[Path]:
+        """Remove backups beyond keep_backups or older than max_backup_age.
+
+        The backup made by this instance is always kept so it can be rolled back to.
+
+        Returns:
+            Paths of the removed backups
+        """
+        backups = self.list_backups()
+        expired = []
+        if self.keep_backups is not None:
+            expired.extend(backups[: max(len(backups) - self.keep_backups, 0)])
+        if self.max_backup_age is not None:
+            cutoff = datetime.now() - self.max_backup_age
+            expired.extend(backup for backup in backups if backup[0] < cutoff)
+
+        removed = []
+        for _, backup_path in sorted(set(expired)):
+            if backup_path == self.backup_path:
+                continue
+            try:
+                backup_path.unlink()
+                removed.append(backup_path)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not remove old backup {backup_path}: {e}")
+
+        if removed:
+            logger.info(f"🧹 Removed {len(removed)} old backups of {self.csv_path.name}")
+        return removed
+
     def read_header_comments(self) -> List[str]:
         """Extract header comments from CSV file"""
         header_comments = []
@@ -139,9 +352,29 @@ class AtomicCSVOperations:
         return True, "Validation passed"
 
     def write_dataframe_atomic(
-        self, df: pd.DataFrame, header_comments: Optional[List[str]] = None
+        self,
+        df: pd.DataFrame,
+        header_comments: Optional[List[str]] = None,
+        paranoid: bool = False,
     ) -> bool:
-        """Write DataFrame to CSV using atomic operations"""
+        """Write DataFrame to CSV using atomic operations
+
+        The temporary file is verified from data captured while writing it: its line
+        count must match header comments + column header + rows, and its size on disk
+        must match the bytes rendered. It is then fsynced, renamed over the original
+        and the directory is fsynced. The SHA-256 of the written bytes is kept in
+        last_write_checksum.
+
+        Args:
+            df: Data to write
+            header_comments: Comment lines written before the data (defaults to the
+                existing file's header comments)
+            paranoid: Also re-read the temporary file, compare its SHA-256 and re-parse
+                it with pandas to compare row counts (reads the whole file back)
+
+        Returns:
+            True if the file was written and committed
+        """
 
         # Validate DataFrame
         is_valid, validation_msg = self.validate_dataframe(df)
@@ -160,26 +393,49 @@ class AtomicCSVOperations:
 
             logger.info(f"🔧 Writing to temporary file: {self.temp_path}")
 
-            # Write to temporary file
-            with open(temp_fd, "w") as f:
+            # Write to temporary file, checksumming and counting lines on the way out
+            with open(temp_fd, "wb") as f:
+                writer = _VerifyingWriter(f)
+
                 # Write header comments
                 for comment in header_comments:
-                    f.write(comment + "\n")
+                    writer.write(comment + "\n")
 
                 # Write DataFrame
-                df.to_csv(f, index=False)
-
-            # Validate temporary file
-            logger.info("🔍 Validating temporary file...")
-            test_df = pd.read_csv(self.temp_path, comment="#")
-
-            if len(test_df) != len(df):
-                raise ValueError(f"Row count mismatch: expected {len(df)}, got {len(test_df)}")
+                df.to_csv(writer, index=False, lineterminator="\n")
+                writer.flush()
+                f.flush()
+
+                # Verify temporary file from the write itself
+                logger.info("🔍 Verifying temporary file...")
+                expected_lines = len(header_comments) + 1 + len(df)
+                if writer.newline_count != expected_lines:
+                    raise ValueError(
+                        f"Line count mismatch: expected {expected_lines}, "
+                        f"wrote {writer.newline_count}"
+                    )
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size != writer.bytes_written:
+                    raise ValueError(
+                        f"Size mismatch: wrote {writer.bytes_written} bytes, file has {file_size}"
+                    )
+                os.fsync(f.fileno())
+
+            checksum = writer.digest.hexdigest()
+            if paranoid:
+                logger.info("🔍 Paranoid verification: re-reading temporary file...")
+                if _file_sha256(self.temp_path) != checksum:
+                    raise ValueError("Checksum mismatch between written and stored bytes")
+                test_df = pd.read_csv(self.temp_path, comment="#")
+                if len(test_df) != len(df):
+                    raise ValueError(f"Row count mismatch: expected {len(df)}, got {len(test_df)}")
 
             # Atomic rename (only works within same filesystem)
             logger.info(f"🎯 Performing atomic rename: {self.temp_path} → {self.csv_path}")
             shutil.move(str(self.temp_path), str(self.csv_path))
+            _fsync_directory(self.csv_path.parent)
 
+            self.last_write_checksum = checksum
             logger.info("✅ Atomic write completed successfully")
             return True
 
@@ -193,20 +449,88 @@ class AtomicCSVOperations:
 
             return False
 
+    def splice_bytes_atomic(self, start_offset: int, end_offset: int, replacement: bytes) -> bool:
+        """Replace bytes [start_offset, end_offset) of the file using atomic operations.
+
+        The bytes before and after the replaced range are copied into the temporary
+        file with copy_file_range, so only the replacement passes through Python.
+
+        Args:
+            start_offset: First byte to replace
+            end_offset: First byte after the replaced range (equal to start_offset
+                for a pure insertion)
+            replacement: Bytes written in place of the range
+
+        Returns:
+            True if the spliced file was committed, False if the original is unchanged
+        """
+        try:
+            temp_fd, temp_path = tempfile.mkstemp(suffix=".csv.tmp", dir=self.csv_path.parent)
+            self.temp_path = Path(temp_path)
+
+            logger.info(
+                f"🔧 Splicing {len(replacement)} bytes over [{start_offset}, {end_offset}) "
+                f"into temporary file: {self.temp_path}"
+            )
+            with open(self.csv_path, "rb") as source_file, open(temp_fd, "wb") as temp_file:
+                source_fd = source_file.fileno()
+                file_size = os.fstat(source_fd).st_size
+                if not 0 <= start_offset <= end_offset <= file_size:
+                    raise ValueError(
+                        f"Splice range [{start_offset}, {end_offset}) outside file of "
+                        f"{file_size} bytes"
+                    )
+
+                target_fd = temp_file.fileno()
+                _copy_byte_range(source_fd, target_fd, 0, start_offset)
+                _write_all(target_fd, replacement)
+                _copy_byte_range(source_fd, target_fd, end_offset, file_size - end_offset)
+                os.fsync(target_fd)
+
+            # Keep the original file's permissions (mkstemp creates 0600 files)
+            shutil.copymode(self.csv_path, self.temp_path)
+
+            logger.info(f"🎯 Performing atomic rename: {self.temp_path} → {self.csv_path}")
+            os.replace(self.temp_path, self.csv_path)
+            _fsync_directory(self.csv_path.parent)
+
+            logger.info("✅ Atomic splice completed successfully")
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ Atomic splice failed: {e}")
+
+            if self.temp_path and self.temp_path.exists():
+                self.temp_path.unlink()
+                logger.info("🧹 Cleaned up temporary file")
+
+            return False
+
     def rollback_from_backup(self) -> bool:
         """Restore file from backup in case of failure"""
         if not self.backup_path or not self.backup_path.exists():
             logger.error("❌ No backup available for rollback")
             return False
 
+        temp_path = None
         try:
             logger.info(f"🔄 Rolling back from backup: {self.backup_path}")
-            shutil.copy2(self.backup_path, self.csv_path)
+            # Restore through a temporary file and rename: writing into the file itself
+            # would also overwrite a hardlink backup sharing its data
+            temp_fd, temp_name = tempfile.mkstemp(suffix=".csv.tmp", dir=self.csv_path.parent)
+            os.close(temp_fd)
+            temp_path = Path(temp_name)
+            temp_path.unlink()
+            if not _reflink(self.backup_path, temp_path):
+                shutil.copy2(self.backup_path, temp_path)
+            os.replace(temp_path, self.csv_path)
             logger.info("✅ Rollback completed successfully")
             return True
 
         except Exception as e:
             logger.error(f"❌ Rollback failed: {e}")
+            if temp_path and temp_path.exists():
+                temp_path.unlink()
             return False
 
     def cleanup_backup(self) -> bool:
@@ -224,6 +548,16 @@ class AtomicCSVOperations:
             return False
 
 
+def _format_like(values: pd.Series, sample: str) -> pd.Series:
+    """Render datetimes with the fractional-second digits of an existing value."""
+    _, dot, fraction = sample.partition(".")
+    if not dot:
+        return values.dt.strftime("%Y-%m-%d %H:%M:%S")
+    # %f always has 6 digits; keep as many as the sample (e.g., ".999")
+    rendered_width = len("YYYY-MM-DD HH:MM:SS.") + len(fraction)
+    return values.dt.strftime("%Y-%m-%d %H:%M:%S.%f").str[:rendered_width]
+
+
 class SafeCSVMerger:
     """Safe CSV data merging with gap filling capabilities and data integrity validation.
 
@@ -233,20 +567,22 @@ class SafeCSVMerger:
 
     Features:
         - Atomic merge operations with backup/rollback
-        - Chronological data insertion and sorting
+        - Chronological data insertion without loading or sorting the file
         - Duplicate detection and handling
-        - Data validation before and after merge
+        - Data validation before merge
         - Gap boundary validation
-        - Maintains CSV header comments and metadata
+        - Maintains CSV header comments and metadata byte-for-byte
 
     The merge process:
         1. Create backup of original CSV file
-        2. Load existing data and gap data
-        3. Validate gap boundaries and data format
-        4. Remove any overlapping data in gap range
-        5. Insert new gap data chronologically
-        6. Validate merged dataset integrity
-        7. Atomically write merged data
+        2. Validate gap data format and boundaries, render it as CSV rows
+        3. Binary-search the date-sorted file for the byte offsets of the gap range
+        4. Splice: copy bytes before the gap, write the gap rows (replacing any
+           existing rows in the gap range), copy bytes after the gap
+        5. Atomically rename the spliced file over the original
+
+    Only the gap rows are parsed and rendered, so merging a few rows into a
+    multi-gigabyte 1m file costs a handful of seeks plus an in-kernel copy.
 
     Examples:
         Basic gap filling:
@@ -281,14 +617,23 @@ class SafeCSVMerger:
         to ensure data consistency.
     """
 
-    def __init__(self, csv_path: Path):
+    def __init__(
+        self,
+        csv_path: Path,
+        keep_backups: Optional[int] = DEFAULT_BACKUP_RETENTION,
+        max_backup_age: Optional[timedelta] = None,
+    ):
         """Initialize SafeCSVMerger for the specified CSV file.
 
         Args:
             csv_path (Path): Path to the CSV file for gap filling operations.
+            keep_backups (Optional[int]): Newest pre-merge backups kept per file.
+            max_backup_age (Optional[timedelta]): Remove pre-merge backups older than this.
         """
         self.csv_path = Path(csv_path)
-        self.atomic_ops = AtomicCSVOperations(csv_path)
+        self.atomic_ops = AtomicCSVOperations(
+            csv_path, keep_backups=keep_backups, max_backup_age=max_backup_age
+        )
 
     def merge_gap_data_safe(
         self, gap_data: pd.DataFrame, gap_start: datetime, gap_end: datetime
@@ -299,10 +644,14 @@ class SafeCSVMerger:
         chronological order and data integrity. Uses atomic operations to
         ensure the merge is completed safely or not at all.
 
+        The CSV file must be sorted by date, as written by the collector. Existing
+        rows dated in [gap_start, gap_end] are replaced by the gap rows; all other
+        bytes of the file are copied unchanged.
+
         Args:
             gap_data (pd.DataFrame): DataFrame containing gap data to merge.
-                Must have columns matching the existing CSV structure.
-                Timestamp column must be named 'date'.
+                Must have every column of the existing CSV (extra columns are
+                ignored). Timestamp column must be named 'date'.
             gap_start (datetime): Start timestamp of the gap being filled.
                 Used for validation and boundary checking.
             gap_end (datetime): End timestamp of the gap being filled.
@@ -331,7 +680,7 @@ class SafeCSVMerger:
             This method automatically handles:
             - Backup creation before modification
             - Data validation and format checking
-            - Chronological sorting after merge
+            - Chronological placement of the gap rows
             - Rollback on any failure
         """
 
@@ -342,47 +691,39 @@ class SafeCSVMerger:
             # Step 1: Create backup
             self.atomic_ops.create_backup()
 
-            # Step 2: Load existing data
-            logger.info("📄 Loading existing CSV data...")
-            existing_df = pd.read_csv(self.csv_path, comment="#")
-            existing_df["date"] = pd.to_datetime(existing_df["date"])
-
-            original_count = len(existing_df)
-            logger.info(f"📊 Original data: {original_count} rows")
-
-            # Step 3: Prepare gap data
-            gap_data = gap_data.copy()
-            gap_data["date"] = pd.to_datetime(gap_data["date"])
-
-            # Step 4: Remove existing data in gap range
-            gap_mask = (existing_df["date"] >= gap_start) & (existing_df["date"] <= gap_end)
-            removed_count = gap_mask.sum()
-
-            logger.info(f"🗑️ Removing {removed_count} existing rows in gap range")
-            df_cleaned = existing_df[~gap_mask].copy()
-
-            # Step 5: Merge with gap data
-            logger.info("🔧 Merging gap data...")
-            merged_df = pd.concat([df_cleaned, gap_data], ignore_index=True)
+            with open(self.csv_path, "rb") as csv_file:
+                # Step 2: Read the column header and render gap rows in its layout
+                columns, data_start, line_terminator = self._read_column_header(csv_file)
+                sample_row = csv_file.readline().decode().rstrip("\r\n").split(",")
+                gap_rows = self._render_gap_rows(
+                    gap_data, columns, gap_start, gap_end, line_terminator, sample_row
+                )
 
-            # Step 6: Sort by date
-            merged_df = merged_df.sort_values("date").reset_index(drop=True)
-            final_count = len(merged_df)
+                # Step 3: Locate the gap range by binary search over the sorted rows
+                file_size = os.fstat(csv_file.fileno()).st_size
+                date_index = columns.index("date")
+                splice_start = self._find_row_offset(
+                    csv_file, data_start, file_size, date_index, gap_start, include_equal=False
+                )
+                splice_end = self._find_row_offset(
+                    csv_file, splice_start, file_size, date_index, gap_end, include_equal=True
+                )
 
-            logger.info(f"📊 Merged result: {final_count} rows")
-            logger.info(f"📈 Net change: {final_count - original_count:+d} rows")
+                csv_file.seek(splice_start)
+                removed_count = csv_file.read(splice_end - splice_start).count(b"\n")
 
-            # Step 7: Validate merge
-            gap_check = ((merged_df["date"] >= gap_start) & (merged_df["date"] <= gap_end)).sum()
-            expected_gap_rows = len(gap_data)
+                # A final row without a line terminator must be closed before appending
+                if splice_start == file_size and splice_start > data_start:
+                    csv_file.seek(splice_start - 1)
+                    if csv_file.read(1) != b"\n":
+                        gap_rows = line_terminator.encode() + gap_rows
 
-            if gap_check != expected_gap_rows:
-                raise ValueError(
-                    f"Gap merge validation failed: expected {expected_gap_rows}, got {gap_check}"
-                )
+            logger.info(f"🗑️ Replacing {removed_count} existing rows in gap range")
+            logger.info(f"📍 Gap range at bytes [{splice_start}, {splice_end}) of {file_size:,}")
+            logger.info(f"📈 Net change: {len(gap_data) - removed_count:+d} rows")
 
-            # Step 8: Atomic write
-            success = self.atomic_ops.write_dataframe_atomic(merged_df)
+            # Step 4: Atomic splice
+            success = self.atomic_ops.splice_bytes_atomic(splice_start, splice_end, gap_rows)
 
             if success:
                 logger.info("✅ Safe gap merge completed successfully")
@@ -403,6 +744,119 @@ class SafeCSVMerger:
 
             return False
 
+    def _read_column_header(self, csv_file: BinaryIO) -> Tuple[List[str], int, str]:
+        """Skip header comments and parse the column header line.
+
+        Returns:
+            Column names, byte offset of the first data row, and the file's line terminator
+        """
+        csv_file.seek(0)
+        header_line = csv_file.readline()
+        while header_line.startswith(b"#"):
+            header_line = csv_file.readline()
+        if not header_line.strip():
+            raise ValueError(f"No column header found in {self.csv_path}")
+
+        columns = header_line.decode().rstrip("\r\n").split(",")
+        if "date" not in columns:
+            raise ValueError(f"No 'date' column in {self.csv_path}: {columns}")
+
+        line_terminator = "\r\n" if header_line.endswith(b"\r\n") else "\n"
+        return columns, csv_file.tell(), line_terminator
+
+    def _render_gap_rows(
+        self,
+        gap_data: pd.DataFrame,
+        columns: List[str],
+        gap_start: datetime,
+        gap_end: datetime,
+        line_terminator: str,
+        sample_row: Optional[List[str]] = None,
+    ) -> bytes:
+        """Validate gap data and render it as CSV rows in the file's column order.
+
+        ``date`` is written as "YYYY-MM-DD HH:MM:SS"; other datetime columns (e.g.
+        ``close_time``) keep the fractional-second precision of the same column in
+        sample_row, an existing data row of the file.
+        """
+        missing_columns = [column for column in columns if column not in gap_data.columns]
+        if missing_columns:
+            raise ValueError(f"Gap data missing columns: {missing_columns}")
+
+        gap_rows = gap_data[columns].copy()
+        gap_rows["date"] = pd.to_datetime(gap_rows["date"])
+        gap_rows = gap_rows.sort_values("date", kind="mergesort")
+
+        duplicates = gap_rows["date"].duplicated().sum()
+        if duplicates:
+            raise ValueError(f"Gap data has {duplicates} duplicate timestamps")
+
+        outside_gap = ((gap_rows["date"] < gap_start) | (gap_rows["date"] > gap_end)).sum()
+        if outside_gap:
+            raise ValueError(
+                f"Gap merge validation failed: {outside_gap} rows outside {gap_start} → {gap_end}"
+            )
+
+        gap_rows["date"] = gap_rows["date"].dt.strftime("%Y-%m-%d %H:%M:%S")
+        if sample_row is not None and len(sample_row) == len(columns):
+            for column_index, column in enumerate(columns):
+                if column != "date" and pd.api.types.is_datetime64_any_dtype(gap_rows[column]):
+                    gap_rows[column] = _format_like(gap_rows[column], sample_row[column_index])
+
+        return gap_rows.to_csv(
+            index=False,
+            header=False,
+            lineterminator=line_terminator,
+        ).encode()
+
+    def _find_row_offset(
+        self,
+        csv_file: BinaryIO,
+        low: int,
+        high: int,
+        date_index: int,
+        boundary: datetime,
+        include_equal: bool,
+    ) -> int:
+        """Binary-search the byte offset of the first row dated after a boundary.
+
+        Args:
+            csv_file: CSV opened in binary mode, rows sorted by date
+            low: Offset of a row start; every row before it is before the boundary
+            high: End of the searched region (file size)
+            date_index: Position of the date column in a row
+            boundary: Timestamp to search for
+            include_equal: Skip rows dated exactly at the boundary (bisect right)
+                instead of stopping at them (bisect left)
+
+        Returns:
+            Offset of the first row dated after (or at, unless include_equal) the
+            boundary, or high if there is none
+        """
+        boundary = pd.Timestamp(boundary).to_pydatetime()
+
+        while low < high:
+            middle = (low + high) // 2
+
+            # First row start at or after the middle byte
+            csv_file.seek(middle - 1)
+            csv_file.readline()
+            row_start = csv_file.tell()
+            if row_start >= high:
+                high = middle
+                continue
+
+            row = csv_file.readline()
+            row_date = datetime.fromisoformat(
+                row.split(b",", date_index + 1)[date_index].decode().strip()
+            )
+            if row_date < boundary or (include_equal and row_date == boundary):
+                low = csv_file.tell()
+            else:
+                high = row_start
+
+        return low
+
 
 def main():
     """Test atomic operations functionality"""
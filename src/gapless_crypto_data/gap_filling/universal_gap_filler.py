@@ -18,19 +18,78 @@ Key Features:
 - API-first validation protocol using authentic Binance data exclusively
 """
 
+import asyncio
 import logging
-import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import httpx
+import numpy as np
 import pandas as pd
 
+from ..collectors.httpx_downloader import ConcurrentDownloadManager
+from ..collectors.hybrid_url_generator import DataSource, DownloadTask
+from ..storage import UNFILLABLE_GAP_MAX_AGE, CatalogError, DatasetCatalog
+from ..utils import get_timeframe_interval
+from .binance_rest_client import BinanceRestClient, WeightRateLimiter
+from .safe_file_operations import AtomicCSVOperations
+
+ENHANCED_COLUMNS = [
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "close_time",
+    "quote_asset_volume",
+    "number_of_trades",
+    "taker_buy_base_asset_volume",
+    "taker_buy_quote_asset_volume",
+]
+LEGACY_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+
+# Open times at or above this are microseconds (16 digits), below are milliseconds
+MICROSECOND_TIMESTAMP_THRESHOLD = 10**15
+
+# Binance can publish recent bars late; gaps ending within this window are never
+# registered as unfillable, only retried
+UNFILLABLE_GAP_SETTLING_PERIOD = timedelta(days=2)
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+def _run_coroutine(coroutine):
+    """Run a coroutine to completion from synchronous code, even inside a running loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def _archive_rows_to_klines(csv_rows: List[List[str]]) -> List[List]:
+    """Normalize daily archive CSV rows to REST kline rows (millisecond open/close times).
+
+    Archives may carry a header row, and spot archives from 2025 onward use
+    microsecond timestamps.
+    """
+    klines = []
+    for csv_row in csv_rows:
+        if not csv_row or not csv_row[0].isdigit():
+            continue
+        open_time, close_time = int(csv_row[0]), int(csv_row[6])
+        if open_time >= MICROSECOND_TIMESTAMP_THRESHOLD:
+            open_time //= 1000
+            close_time //= 1000
+        klines.append([open_time, *csv_row[1:6], close_time, *csv_row[7:]])
+    return klines
+
+
 class UniversalGapFiller:
     """Universal gap detection and filling for all timeframes with authentic 11-column microstructure format.
 
@@ -100,7 +159,35 @@ class UniversalGapFiller:
         respect API limits during gap filling operations.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_concurrent_requests: int = 8,
+        rate_limiter: Optional[WeightRateLimiter] = None,
+        use_daily_archives: bool = True,
+        max_concurrent_archives: int = 13,
+        unfillable_gap_max_age: Optional[timedelta] = UNFILLABLE_GAP_MAX_AGE,
+    ):
+        """
+        Initialize gap filler.
+
+        Args:
+            max_concurrent_requests: Maximum simultaneous REST requests when pages of
+                a long gap, or several gaps, are fetched concurrently
+            rate_limiter: Request-weight budget to draw from; share one limiter
+                between fillers to give them a common budget
+            use_daily_archives: Fill gap days from data.binance.vision daily archives
+                (no API weight) before using REST in fill_gaps_batch/process_file
+            max_concurrent_archives: Maximum simultaneous daily archive downloads
+            unfillable_gap_max_age: Re-check gaps registered as unfillable once their
+                confirmation is older than this (default 30 days; None never
+                re-checks them)
+        """
+        self.max_concurrent_requests = max_concurrent_requests
+        self.rate_limiter = rate_limiter or WeightRateLimiter()
+        self.use_daily_archives = use_daily_archives
+        self.max_concurrent_archives = max_concurrent_archives
+        self.unfillable_gap_max_age = unfillable_gap_max_age
+        self.archive_base_url = "https://data.binance.vision/data/spot"
         self.binance_base_url = "https://api.binance.com/api/v3/klines"
         self.timeframe_mapping = {
             "1s": "1s",
@@ -121,7 +208,8 @@ class UniversalGapFiller:
     def extract_symbol_from_filename(self, csv_path) -> str:
         """Extract symbol from CSV filename
 
-        Supports formats like:
+        The dataset catalog in the file's directory is authoritative when the file
+        is cataloged. Otherwise supports formats like:
         - binance_spot_BTCUSDT-1h_20240101-20240101_v2.5.0.csv
         - BTCUSDT_1h_data.csv
         - ETHUSDT-4h.csv
@@ -130,6 +218,12 @@ class UniversalGapFiller:
         if isinstance(csv_path, (str, Path)):
             path_obj = Path(csv_path)
             filename = path_obj.name
+
+            catalog = DatasetCatalog.existing(path_obj.parent) if filename else None
+            if catalog is not None:
+                dataset = catalog.get(path_obj)
+                if dataset is not None:
+                    return dataset.symbol
         else:
             filename = str(csv_path)
 
@@ -167,47 +261,29 @@ class UniversalGapFiller:
         """Detect ALL gaps in CSV file by analyzing timestamp sequence for 11-column format"""
         logger.info(f"🔍 Analyzing {csv_path} for gaps...")
 
-        # Load CSV data
-        ohlcv_dataframe = pd.read_csv(csv_path, comment="#")
-        ohlcv_dataframe["date"] = pd.to_datetime(ohlcv_dataframe["date"])
-        ohlcv_dataframe = ohlcv_dataframe.sort_values("date")
-
-        # Calculate expected interval
-        interval_mapping = {
-            "1s": timedelta(seconds=1),
-            "1m": timedelta(minutes=1),
-            "3m": timedelta(minutes=3),
-            "5m": timedelta(minutes=5),
-            "15m": timedelta(minutes=15),
-            "30m": timedelta(minutes=30),
-            "1h": timedelta(hours=1),
-            "2h": timedelta(hours=2),
-            "4h": timedelta(hours=4),
-            "6h": timedelta(hours=6),
-            "8h": timedelta(hours=8),
-            "12h": timedelta(hours=12),
-            "1d": timedelta(days=1),
-        }
-        expected_interval = interval_mapping[timeframe]
+        # Only the timestamp column is needed; gaps come from one diff over it
+        date_frame = pd.read_csv(csv_path, comment="#", usecols=["date"])
+        open_times = np.sort(pd.to_datetime(date_frame["date"]).to_numpy())
+
+        expected_interval = get_timeframe_interval(timeframe)
+        interval_deltas = np.diff(open_times)
+        gap_positions = np.flatnonzero(interval_deltas > np.timedelta64(expected_interval)) + 1
 
         detected_gaps = []
-        for row_index in range(1, len(ohlcv_dataframe)):
-            current_time = ohlcv_dataframe.iloc[row_index]["date"]
-            previous_time = ohlcv_dataframe.iloc[row_index - 1]["date"]
-            actual_gap_duration = current_time - previous_time
-
-            if actual_gap_duration > expected_interval:
-                timestamp_gap_info = {
-                    "position": row_index,
-                    "start_time": previous_time + expected_interval,
-                    "end_time": current_time,
-                    "duration": actual_gap_duration,
-                    "expected_interval": expected_interval,
-                }
-                detected_gaps.append(timestamp_gap_info)
-                logger.info(
-                    f"   📊 Gap {len(detected_gaps)}: {timestamp_gap_info['start_time']} → {timestamp_gap_info['end_time']} ({timestamp_gap_info['duration']})"
-                )
+        for row_index in gap_positions.tolist():
+            current_time = pd.Timestamp(open_times[row_index])
+            previous_time = pd.Timestamp(open_times[row_index - 1])
+            timestamp_gap_info = {
+                "position": row_index,
+                "start_time": previous_time + expected_interval,
+                "end_time": current_time,
+                "duration": current_time - previous_time,
+                "expected_interval": expected_interval,
+            }
+            detected_gaps.append(timestamp_gap_info)
+            logger.info(
+                f"   📊 Gap {len(detected_gaps)}: {timestamp_gap_info['start_time']} → {timestamp_gap_info['end_time']} ({timestamp_gap_info['duration']})"
+            )
 
         logger.info(f"✅ Found {len(detected_gaps)} gaps in {timeframe} timeframe")
         return detected_gaps
@@ -221,86 +297,113 @@ class UniversalGapFiller:
         enhanced_format: bool = False,
     ) -> Optional[List[Dict]]:
         """Fetch authentic microstructure data from Binance API - NO synthetic data"""
-        binance_interval = self.timeframe_mapping[timeframe]
+        # Every REST call goes through the weight-limited client, so single-page
+        # gaps draw from the same budget and get the same 418/429 backoff
+        return _run_coroutine(
+            self.fetch_binance_data_async(start_time, end_time, timeframe, symbol, enhanced_format)
+        )
 
-        # Convert to millisecond timestamps for Binance API
-        # ✅ UTC ONLY: All timestamps are UTC - no timezone conversion needed
+    async def fetch_binance_data_async(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        timeframe: str,
+        symbol: str,
+        enhanced_format: bool = False,
+        rest_client: Optional[BinanceRestClient] = None,
+    ) -> Optional[List[Dict]]:
+        """Async variant of fetch_binance_data over the weight-limited REST client.
+
+        Pages of the gap are fetched concurrently. Pass rest_client to share one
+        pooled connection between many gaps; otherwise a client is opened for the call.
+        """
+        if rest_client is None:
+            async with self._rest_client() as rest_client:
+                return await self.fetch_binance_data_async(
+                    start_time, end_time, timeframe, symbol, enhanced_format, rest_client
+                )
 
-        # Convert pandas Timestamp to datetime if needed
         if hasattr(start_time, "to_pydatetime"):
             start_time = start_time.to_pydatetime()
         if hasattr(end_time, "to_pydatetime"):
             end_time = end_time.to_pydatetime()
-
-        # Simple UTC timestamp conversion - CSV timestamps are naive UTC
-        # The CSV timestamps should be interpreted as local machine time for API calls
-        # This matches how Binance API expects timestamps
         start_timestamp_ms = int(start_time.timestamp() * 1000)
         end_timestamp_ms = int(end_time.timestamp() * 1000)
 
-        api_request_params = {
-            "symbol": symbol,
-            "interval": binance_interval,
-            "startTime": start_timestamp_ms,
-            "endTime": end_timestamp_ms,
-            "limit": 1000,
-        }
-
-        logger.info(f"   📡 Binance API call: {api_request_params}")
-
         try:
-            http_response = httpx.get(self.binance_base_url, params=api_request_params, timeout=30)
-            http_response.raise_for_status()
-            binance_klines_data = http_response.json()
-
-            if not binance_klines_data:
-                logger.warning("   ❌ Binance returned no data")
-                return None
-
-            # Convert Binance data to required format with authentic microstructure data
-            processed_candles = []
-            for raw_candle_data in binance_klines_data:
-                # Binance returns: [open_time, open, high, low, close, volume, close_time,
-                #                  quote_asset_volume, number_of_trades, taker_buy_base_asset_volume,
-                #                  taker_buy_quote_asset_volume, ignore]
-
-                open_time = datetime.fromtimestamp(int(raw_candle_data[0]) / 1000)
-                close_time = datetime.fromtimestamp(int(raw_candle_data[6]) / 1000)
-
-                # Only include candles within the gap period (all UTC)
-                if start_time <= open_time.replace(tzinfo=None) < end_time:
-                    # Basic OHLCV data (always included)
-                    candle_bar_data = {
-                        "timestamp": open_time.strftime("%Y-%m-%d %H:%M:%S"),
-                        "open": float(raw_candle_data[1]),
-                        "high": float(raw_candle_data[2]),
-                        "low": float(raw_candle_data[3]),
-                        "close": float(raw_candle_data[4]),
-                        "volume": float(raw_candle_data[5]),
-                    }
-
-                    # Add authentic microstructure data for enhanced format
-                    if enhanced_format:
-                        candle_bar_data.update(
-                            {
-                                "close_time": close_time.strftime("%Y-%m-%d %H:%M:%S"),
-                                "quote_asset_volume": float(raw_candle_data[7]),
-                                "number_of_trades": int(raw_candle_data[8]),
-                                "taker_buy_base_asset_volume": float(raw_candle_data[9]),
-                                "taker_buy_quote_asset_volume": float(raw_candle_data[10]),
-                            }
-                        )
-
-                    processed_candles.append(candle_bar_data)
-                    logger.info(f"   ✅ Retrieved authentic candle: {open_time}")
-
-            logger.info(f"   📈 Retrieved {len(processed_candles)} authentic candles from Binance")
-            return processed_candles
-
+            binance_interval = self.timeframe_mapping[timeframe]
+            logger.info(f"   📡 Binance API: {symbol} {binance_interval} {start_time} → {end_time}")
+            binance_klines_data = await rest_client.fetch_klines(
+                symbol, binance_interval, start_timestamp_ms, end_timestamp_ms
+            )
         except Exception as api_exception:
             logger.error(f"   ❌ Binance API error: {api_exception}")
             return None
 
+        return self._klines_to_candles(binance_klines_data, start_time, end_time, enhanced_format)
+
+    def _rest_client(self) -> BinanceRestClient:
+        """Create a pooled REST client drawing on this filler's weight budget."""
+        return BinanceRestClient(
+            base_url=self.binance_base_url,
+            rate_limiter=self.rate_limiter,
+            max_concurrent=self.max_concurrent_requests,
+        )
+
+    def _klines_to_candles(
+        self,
+        binance_klines_data: List[List],
+        start_time: datetime,
+        end_time: datetime,
+        enhanced_format: bool,
+    ) -> Optional[List[Dict]]:
+        """Convert raw klines inside [start_time, end_time) to candle dicts.
+
+        An empty list means Binance answered but has no bars in the range.
+        """
+        if not binance_klines_data:
+            logger.warning("   ❌ Binance returned no data")
+            return []
+
+        # Convert Binance data to required format with authentic microstructure data
+        processed_candles = []
+        for raw_candle_data in binance_klines_data:
+            # Binance returns: [open_time, open, high, low, close, volume, close_time,
+            #                  quote_asset_volume, number_of_trades, taker_buy_base_asset_volume,
+            #                  taker_buy_quote_asset_volume, ignore]
+
+            open_time = datetime.fromtimestamp(int(raw_candle_data[0]) / 1000)
+            close_time = datetime.fromtimestamp(int(raw_candle_data[6]) / 1000)
+
+            # Only include candles within the gap period (all UTC)
+            if start_time <= open_time.replace(tzinfo=None) < end_time:
+                # Basic OHLCV data (always included)
+                candle_bar_data = {
+                    "timestamp": open_time.strftime("%Y-%m-%d %H:%M:%S"),
+                    "open": float(raw_candle_data[1]),
+                    "high": float(raw_candle_data[2]),
+                    "low": float(raw_candle_data[3]),
+                    "close": float(raw_candle_data[4]),
+                    "volume": float(raw_candle_data[5]),
+                }
+
+                # Add authentic microstructure data for enhanced format
+                if enhanced_format:
+                    candle_bar_data.update(
+                        {
+                            "close_time": close_time.strftime("%Y-%m-%d %H:%M:%S"),
+                            "quote_asset_volume": float(raw_candle_data[7]),
+                            "number_of_trades": int(raw_candle_data[8]),
+                            "taker_buy_base_asset_volume": float(raw_candle_data[9]),
+                            "taker_buy_quote_asset_volume": float(raw_candle_data[10]),
+                        }
+                    )
+
+                processed_candles.append(candle_bar_data)
+
+        logger.info(f"   📈 Retrieved {len(processed_candles)} authentic candles from Binance")
+        return processed_candles
+
     def fill_gap(
         self,
         timestamp_gap_info: Dict,
@@ -309,222 +412,484 @@ class UniversalGapFiller:
         metadata_path: Path = None,
     ) -> bool:
         """Fill a single gap with authentic Binance data using API-first validation protocol"""
-        logger.info(
-            f"🔧 Filling gap: {timestamp_gap_info['start_time']} → {timestamp_gap_info['end_time']}"
-        )
-        logger.info("   📋 Applying API-first validation protocol")
+        batch_result = self.fill_gaps_batch([timestamp_gap_info], csv_path, trading_timeframe)
+        return batch_result["gaps_filled"] == 1
+
+    def fill_gaps_batch(
+        self,
+        detected_gaps: List[Dict],
+        csv_path: Path,
+        trading_timeframe: str,
+        use_daily_archives: Optional[bool] = None,
+    ) -> Dict:
+        """Fill several gaps of one CSV file with a single read and a single atomic write.
+
+        Authentic candles are fetched for every gap first, then spliced into the
+        existing rows in one sort and committed through AtomicCSVOperations, so the
+        file is rewritten once no matter how many gaps it had. Days covered by a
+        published daily archive on data.binance.vision are taken from the archive;
+        only the rest of each gap goes to the weight-limited REST API.
+
+        Gaps for which Binance has no bars at all are re-queried over their whole range
+        via REST; if that answer is empty too and the gap ended before the settling
+        period (UNFILLABLE_GAP_SETTLING_PERIOD), it is registered as unfillable in the
+        directory's dataset catalog. Registered gaps are skipped on later runs (until
+        their confirmation is older than unfillable_gap_max_age) and are counted as
+        gaps_unfillable rather than gaps_failed; unconfirmed empty gaps count as
+        gaps_failed and are retried next run.
+
+        Args:
+            detected_gaps: Gap dicts as returned by detect_all_gaps()
+            csv_path: CSV file to fill in place
+            trading_timeframe: Timeframe of the file (e.g., "1h")
+            use_daily_archives: Try daily archives before REST (defaults to the
+                filler's use_daily_archives setting)
+
+        Returns:
+            Dict with gaps_filled, gaps_failed, gaps_unfillable and candles_added counts
+        """
+        batch_result = {
+            "gaps_filled": 0,
+            "gaps_failed": 0,
+            "gaps_unfillable": 0,
+            "candles_added": 0,
+        }
+        if not detected_gaps:
+            return batch_result
 
-        # Load current CSV data to detect format
+        # Confirmed exchange outages are not refetched
+        extracted_symbol = self.extract_symbol_from_filename(csv_path)
+        catalog = DatasetCatalog.existing(Path(csv_path).parent)
+        if catalog is not None:
+            known_unfillable_gaps = catalog.find_unfillable_gaps(
+                extracted_symbol, trading_timeframe, max_age=self.unfillable_gap_max_age
+            )
+            remaining_gaps = [
+                timestamp_gap_info
+                for timestamp_gap_info in detected_gaps
+                if not any(
+                    unfillable_gap.covers(
+                        timestamp_gap_info["start_time"], timestamp_gap_info["end_time"]
+                    )
+                    for unfillable_gap in known_unfillable_gaps
+                )
+            ]
+            batch_result["gaps_unfillable"] = len(detected_gaps) - len(remaining_gaps)
+            if batch_result["gaps_unfillable"]:
+                logger.info(
+                    f"   📋 Skipping {batch_result['gaps_unfillable']} gaps confirmed "
+                    "absent upstream (exchange outages)"
+                )
+            detected_gaps = remaining_gaps
+            if not detected_gaps:
+                return batch_result
+
+        # Load current CSV data once to detect format and splice into
         existing_ohlcv_data = pd.read_csv(csv_path, comment="#")
-        existing_ohlcv_data["date"] = pd.to_datetime(existing_ohlcv_data["date"])
 
-        # Detect format: enhanced (11 columns) vs legacy (6 columns)
-        enhanced_columns = [
-            "date",
-            "open",
-            "high",
-            "low",
-            "close",
-            "volume",
-            "close_time",
-            "quote_asset_volume",
-            "number_of_trades",
-            "taker_buy_base_asset_volume",
-            "taker_buy_quote_asset_volume",
-        ]
-        legacy_columns = ["date", "open", "high", "low", "close", "volume"]
+        format_type = self._detect_csv_format(existing_ohlcv_data.columns)
+        if format_type is None:
+            logger.error(f"   ❌ Unknown CSV format. Columns: {list(existing_ohlcv_data.columns)}")
+            batch_result["gaps_failed"] = len(detected_gaps)
+            return batch_result
+        is_enhanced_format = format_type == "enhanced"
 
-        is_enhanced_format = all(
-            column_name in existing_ohlcv_data.columns for column_name in enhanced_columns
+        # ✅ API-FIRST VALIDATION: Always use authentic Binance REST API data
+        # Symbol comes from the filename to ensure correct data is fetched
+        logger.info(f"   🎯 Extracted symbol: {extracted_symbol} from file: {Path(csv_path).name}")
+
+        if use_daily_archives is None:
+            use_daily_archives = self.use_daily_archives
+
+        # Gaps share one archive download pass and one pooled, weight-limited REST client
+        logger.info(f"   📡 Fetching {len(detected_gaps)} gaps concurrently")
+        fetched_candles = _run_coroutine(
+            self._fetch_gaps_async(
+                detected_gaps,
+                trading_timeframe,
+                extracted_symbol,
+                is_enhanced_format,
+                use_daily_archives,
+            )
         )
-        is_legacy_format = all(
-            column_name in existing_ohlcv_data.columns for column_name in legacy_columns
+
+        gap_fill_frames = []
+        empty_gaps = []
+        for timestamp_gap_info, authentic_api_data in zip(detected_gaps, fetched_candles):
+            gap_fill_frame = self._gap_fill_frame(
+                timestamp_gap_info, authentic_api_data, is_enhanced_format
+            )
+            if gap_fill_frame is not None:
+                gap_fill_frames.append(gap_fill_frame)
+                batch_result["gaps_filled"] += 1
+                batch_result["candles_added"] += len(gap_fill_frame)
+            elif authentic_api_data is not None:
+                # Binance answered without bars for the gap: outage candidate
+                empty_gaps.append(timestamp_gap_info)
+            else:
+                batch_result["gaps_failed"] += 1
+
+        confirmed_unfillable_gaps = self._confirm_unfillable_gaps(
+            empty_gaps, trading_timeframe, extracted_symbol, is_enhanced_format
         )
+        batch_result["gaps_unfillable"] += len(confirmed_unfillable_gaps)
+        batch_result["gaps_failed"] += len(empty_gaps) - len(confirmed_unfillable_gaps)
 
-        if is_enhanced_format:
-            logger.info("   🚀 Enhanced 11-column format detected")
-            format_type = "enhanced"
-        elif is_legacy_format:
-            logger.info("   📊 Legacy 6-column format detected")
-            format_type = "legacy"
-        else:
-            logger.error(f"   ❌ Unknown CSV format. Columns: {list(existing_ohlcv_data.columns)}")
-            return False
+        if confirmed_unfillable_gaps:
+            self._register_unfillable_gaps(
+                csv_path, extracted_symbol, trading_timeframe, confirmed_unfillable_gaps
+            )
 
-        # ✅ API-FIRST VALIDATION: Always use authentic Binance REST API data
-        # Extract symbol from filename to ensure correct data is fetched
-        extracted_symbol = self.extract_symbol_from_filename(csv_path)
-        filename = Path(csv_path).name if isinstance(csv_path, str) else csv_path.name
-        logger.info(f"   🎯 Extracted symbol: {extracted_symbol} from file: {filename}")
-
-        logger.info("   🔍 Step 1: Attempting authentic Binance REST API data retrieval")
-        authentic_api_data = self.fetch_binance_data(
-            timestamp_gap_info["start_time"],
-            timestamp_gap_info["end_time"],
-            trading_timeframe,
-            extracted_symbol,
-            enhanced_format=is_enhanced_format,
+        if not gap_fill_frames:
+            return batch_result
+
+        # One splice: append every fill, sort once, keep existing rows on duplicate timestamps
+        existing_ohlcv_data["date"] = pd.to_datetime(existing_ohlcv_data["date"])
+        combined_dataframe = pd.concat([existing_ohlcv_data] + gap_fill_frames, ignore_index=True)
+        combined_dataframe = (
+            combined_dataframe.sort_values("date", kind="mergesort")
+            .drop_duplicates(subset=["date"], keep="first")
+            .reset_index(drop=True)
         )
 
-        # Track gap filling details for metadata
-        gap_fill_metadata = {
-            "timestamp": timestamp_gap_info["start_time"].strftime("%Y-%m-%d %H:%M:%S"),
-            "duration_hours": (
-                timestamp_gap_info["end_time"] - timestamp_gap_info["start_time"]
-            ).total_seconds()
-            / 3600,
-            "fill_method": None,
-            "data_source": None,
-            "authentic_data": False,
-            "synthetic_data": False,
-            "reason": None,
-            "ohlcv": None,
-            "microstructure_data": None,
-        }
+        remaining_gap_count = self._count_remaining_gaps(
+            combined_dataframe["date"], trading_timeframe
+        )
+        if remaining_gap_count:
+            logger.warning(f"   ⚠️ Gaps partially filled - {remaining_gap_count} gaps remain")
 
-        if not authentic_api_data:
-            logger.warning("   ⚠️ Step 1 Failed: No authentic API data available")
-            logger.info("   🔍 Step 2: Checking if gap is legitimate exchange outage")
+        # Keep the collector's on-disk timestamp layout
+        combined_dataframe["date"] = combined_dataframe["date"].dt.strftime("%Y-%m-%d %H:%M:%S")
 
-            # Gap represents legitimate exchange outage - preserve data integrity
-            # For now, fail gracefully to maintain authentic data mandate
-            logger.error("   ❌ Gap filling failed: No authentic data available via API")
-            logger.info("   📋 Preserving authentic data integrity - no synthetic fill applied")
-            return False
-        else:
+        # Header comments are preserved by the atomic writer
+        if not AtomicCSVOperations(csv_path).write_dataframe_atomic(combined_dataframe):
+            logger.error(f"   ❌ Atomic write failed - {csv_path} left unchanged")
+            batch_result["gaps_failed"] += batch_result["gaps_filled"]
+            batch_result["gaps_filled"] = 0
+            batch_result["candles_added"] = 0
+            return batch_result
+
+        logger.info(
+            f"   ✅ Filled {batch_result['gaps_filled']} gaps with "
+            f"{batch_result['candles_added']} authentic candles"
+        )
+        return batch_result
+
+    def _confirm_unfillable_gaps(
+        self,
+        empty_gaps: List[Dict],
+        trading_timeframe: str,
+        symbol: str,
+        is_enhanced_format: bool,
+    ) -> List[Dict]:
+        """Keep the empty gaps that have settled and that a REST re-query confirms empty."""
+        settled_before = datetime.now(timezone.utc).replace(tzinfo=None) - (
+            UNFILLABLE_GAP_SETTLING_PERIOD
+        )
+        settled_gaps = [
+            timestamp_gap_info
+            for timestamp_gap_info in empty_gaps
+            if pd.Timestamp(timestamp_gap_info["end_time"]).to_pydatetime() <= settled_before
+        ]
+        if len(settled_gaps) < len(empty_gaps):
             logger.info(
-                f"   ✅ Step 1 Success: Retrieved {len(authentic_api_data)} authentic candles from API"
+                f"   ⏳ {len(empty_gaps) - len(settled_gaps)} empty gaps are too recent to "
+                "confirm as outages - retrying next run"
             )
+        if not settled_gaps:
+            return []
 
-            # Update gap fill details for authentic API data
-            gap_fill_metadata.update(
-                {
-                    "fill_method": "binance_rest_api",
-                    "data_source": "https://api.binance.com/api/v3/klines",
-                    "authentic_data": True,
-                    "synthetic_data": False,
-                    "reason": "missing_from_monthly_file_but_available_via_api",
-                }
+        rest_answers = _run_coroutine(
+            self._requery_gaps_async(settled_gaps, trading_timeframe, symbol, is_enhanced_format)
+        )
+        # None is a failed request; bars in the answer mean the gap is fillable after all
+        return [
+            timestamp_gap_info
+            for timestamp_gap_info, rest_answer in zip(settled_gaps, rest_answers)
+            if rest_answer == []
+        ]
+
+    async def _requery_gaps_async(
+        self,
+        detected_gaps: List[Dict],
+        trading_timeframe: str,
+        symbol: str,
+        is_enhanced_format: bool,
+    ) -> List[Optional[List[Dict]]]:
+        """Query each gap's whole range via REST, bypassing daily archives."""
+        async with self._rest_client() as rest_client:
+            return await asyncio.gather(
+                *(
+                    self.fetch_binance_data_async(
+                        pd.Timestamp(timestamp_gap_info["start_time"]).to_pydatetime(),
+                        pd.Timestamp(timestamp_gap_info["end_time"]).to_pydatetime(),
+                        trading_timeframe,
+                        symbol,
+                        enhanced_format=is_enhanced_format,
+                        rest_client=rest_client,
+                    )
+                    for timestamp_gap_info in detected_gaps
+                )
             )
 
-            if authentic_api_data:
-                first_candle_data = authentic_api_data[0]
-                gap_fill_metadata["ohlcv"] = {
-                    "open": first_candle_data["open"],
-                    "high": first_candle_data["high"],
-                    "low": first_candle_data["low"],
-                    "close": first_candle_data["close"],
-                    "volume": first_candle_data["volume"],
-                }
+    def _register_unfillable_gaps(
+        self,
+        csv_path: Path,
+        symbol: str,
+        trading_timeframe: str,
+        unfillable_gaps: List[Dict],
+    ) -> None:
+        """Record gaps confirmed absent upstream in the directory's dataset catalog."""
+        try:
+            catalog = DatasetCatalog.for_directory(Path(csv_path).parent)
+            for timestamp_gap_info in unfillable_gaps:
+                catalog.record_unfillable_gap(
+                    symbol,
+                    trading_timeframe,
+                    timestamp_gap_info["start_time"],
+                    timestamp_gap_info["end_time"],
+                    reason="No bars returned by Binance (confirmed via REST)",
+                )
+        except CatalogError as catalog_error:
+            logger.warning(f"   ⚠️ Could not register unfillable gaps: {catalog_error}")
+            return
+        logger.info(f"   📋 Registered {len(unfillable_gaps)} gaps as confirmed exchange outages")
+
+    def _detect_csv_format(self, columns) -> Optional[str]:
+        """Detect format: enhanced (11 columns) vs legacy (6 columns)"""
+        if all(column_name in columns for column_name in ENHANCED_COLUMNS):
+            logger.info("   🚀 Enhanced 11-column format detected")
+            return "enhanced"
+        if all(column_name in columns for column_name in LEGACY_COLUMNS):
+            logger.info("   📊 Legacy 6-column format detected")
+            return "legacy"
+        return None
 
-                if is_enhanced_format and "quote_asset_volume" in first_candle_data:
-                    gap_fill_metadata["microstructure_data"] = {
-                        "quote_asset_volume": first_candle_data["quote_asset_volume"],
-                        "number_of_trades": first_candle_data["number_of_trades"],
-                        "taker_buy_base_asset_volume": first_candle_data[
-                            "taker_buy_base_asset_volume"
-                        ],
-                        "taker_buy_quote_asset_volume": first_candle_data[
-                            "taker_buy_quote_asset_volume"
-                        ],
-                    }
+    async def _fetch_gaps_async(
+        self,
+        detected_gaps: List[Dict],
+        trading_timeframe: str,
+        symbol: str,
+        is_enhanced_format: bool,
+        use_daily_archives: bool = False,
+    ) -> List[Optional[List[Dict]]]:
+        """Fetch candles for many gaps concurrently, archives first, then pooled REST."""
+        archived_klines = {}
+        if use_daily_archives:
+            archived_klines = await self._download_daily_archives(
+                detected_gaps, trading_timeframe, symbol
+            )
+
+        async with self._rest_client() as rest_client:
+            return await asyncio.gather(
+                *(
+                    self._fetch_gap_candles(
+                        timestamp_gap_info,
+                        trading_timeframe,
+                        symbol,
+                        is_enhanced_format,
+                        archived_klines,
+                        rest_client,
+                    )
+                    for timestamp_gap_info in detected_gaps
+                )
+            )
+
+    async def _fetch_gap_candles(
+        self,
+        timestamp_gap_info: Dict,
+        trading_timeframe: str,
+        symbol: str,
+        is_enhanced_format: bool,
+        archived_klines: Dict[date, List[List]],
+        rest_client: BinanceRestClient,
+    ) -> Optional[List[Dict]]:
+        """Collect one gap's candles from downloaded archive days plus REST for the rest."""
+        gap_start_time = pd.Timestamp(timestamp_gap_info["start_time"]).to_pydatetime()
+        gap_end_time = pd.Timestamp(timestamp_gap_info["end_time"]).to_pydatetime()
+
+        archive_rows = []
+        rest_windows = []
+        for gap_day in self._gap_days(gap_start_time, gap_end_time, trading_timeframe):
+            if gap_day in archived_klines:
+                archive_rows.extend(archived_klines[gap_day])
+                continue
+            day_begin = datetime.combine(gap_day, datetime.min.time())
+            window_start = max(gap_start_time, day_begin)
+            window_end = min(gap_end_time, day_begin + timedelta(days=1))
+            if rest_windows and rest_windows[-1][1] == window_start:
+                rest_windows[-1] = (rest_windows[-1][0], window_end)
+            else:
+                rest_windows.append((window_start, window_end))
+
+        gap_candles = []
+        rest_fetch_failed = False
+        if archive_rows:
+            gap_candles.extend(
+                self._klines_to_candles(
+                    archive_rows, gap_start_time, gap_end_time, is_enhanced_format
+                )
+                or []
+            )
+        for window_start, window_end in rest_windows:
+            rest_candles = await self.fetch_binance_data_async(
+                window_start,
+                window_end,
+                trading_timeframe,
+                symbol,
+                enhanced_format=is_enhanced_format,
+                rest_client=rest_client,
+            )
+            if rest_candles is None:
+                rest_fetch_failed = True
+            else:
+                gap_candles.extend(rest_candles)
+
+        # Nothing collected after a failed request is an error, not a confirmed absence
+        if not gap_candles and rest_fetch_failed:
+            return None
+        return gap_candles
+
+    def _gap_days(
+        self, gap_start_time: datetime, gap_end_time: datetime, trading_timeframe: str
+    ) -> List[date]:
+        """UTC calendar days holding the missing bars of a gap."""
+        last_missing_bar = max(
+            gap_start_time, gap_end_time - get_timeframe_interval(trading_timeframe)
+        )
+        day_count = (last_missing_bar.date() - gap_start_time.date()).days + 1
+        return [gap_start_time.date() + timedelta(days=offset) for offset in range(day_count)]
+
+    async def _download_daily_archives(
+        self, detected_gaps: List[Dict], trading_timeframe: str, symbol: str
+    ) -> Dict[date, List[List]]:
+        """Download the daily archives covering the gaps, keyed by day.
+
+        Days that are not yet published (today or later), or whose archive cannot be
+        downloaded, are left out so their part of a gap falls back to REST.
+        """
+        today = datetime.now(timezone.utc).date()
+        gap_days = sorted(
+            {
+                gap_day
+                for timestamp_gap_info in detected_gaps
+                for gap_day in self._gap_days(
+                    pd.Timestamp(timestamp_gap_info["start_time"]).to_pydatetime(),
+                    pd.Timestamp(timestamp_gap_info["end_time"]).to_pydatetime(),
+                    trading_timeframe,
+                )
+                if gap_day < today
+            }
+        )
+        if not gap_days:
+            return {}
+
+        download_tasks = []
+        for gap_day in gap_days:
+            day_str = gap_day.strftime("%Y-%m-%d")
+            filename = f"{symbol}-{trading_timeframe}-{day_str}.zip"
+            day_start = datetime.combine(gap_day, datetime.min.time())
+            download_tasks.append(
+                DownloadTask(
+                    url=f"{self.archive_base_url}/daily/klines/{symbol}/{trading_timeframe}/{filename}",
+                    filename=filename,
+                    source_type=DataSource.DAILY,
+                    period_identifier=day_str,
+                    date_range=(day_start, day_start + timedelta(days=1) - timedelta(seconds=1)),
+                )
+            )
+
+        logger.info(f"   📦 Downloading {len(download_tasks)} daily archives for gap days")
+        # No retries: a missing or failed archive day simply falls back to REST
+        async with ConcurrentDownloadManager(
+            max_concurrent=self.max_concurrent_archives, max_retries=0
+        ) as download_manager:
+            download_results = await download_manager.download_tasks(download_tasks)
+
+        archived_klines = {}
+        for gap_day, download_result in zip(gap_days, download_results):
+            if download_result.success:
+                archived_klines[gap_day] = _archive_rows_to_klines(download_result.data)
+            else:
+                logger.info(
+                    f"   ↪️ Daily archive {download_result.task.filename} unavailable "
+                    f"({download_result.error}) - using REST API"
+                )
+        logger.info(
+            f"   📦 {len(archived_klines)}/{len(download_tasks)} gap days served from archives"
+        )
+        return archived_klines
+
+    def _gap_fill_frame(
+        self,
+        timestamp_gap_info: Dict,
+        authentic_api_data: Optional[List[Dict]],
+        is_enhanced_format: bool,
+    ) -> Optional[pd.DataFrame]:
+        """Turn fetched candles for one gap into rows restricted to the gap period."""
+        if not authentic_api_data:
+            # Gap represents legitimate exchange outage - preserve data integrity
+            logger.error(
+                f"   ❌ Gap {timestamp_gap_info['start_time']} → {timestamp_gap_info['end_time']} "
+                "not filled: No authentic data available via API"
+            )
+            logger.info("   📋 Preserving authentic data integrity - no synthetic fill applied")
+            return None
 
         # Create DataFrame for Binance data
         api_data_dataframe = pd.DataFrame(authentic_api_data)
         api_data_dataframe["date"] = pd.to_datetime(api_data_dataframe["timestamp"])
 
         # Select appropriate columns based on format
-        if is_enhanced_format:
-            # For enhanced format, include all microstructure columns
-            selected_columns = ["date", "open", "high", "low", "close", "volume"]
-            if "close_time" in api_data_dataframe.columns:
-                selected_columns.extend(
-                    [
-                        "close_time",
-                        "quote_asset_volume",
-                        "number_of_trades",
-                        "taker_buy_base_asset_volume",
-                        "taker_buy_quote_asset_volume",
-                    ]
-                )
-            api_data_dataframe = api_data_dataframe[selected_columns]
+        if is_enhanced_format and "close_time" in api_data_dataframe.columns:
+            api_data_dataframe = api_data_dataframe[ENHANCED_COLUMNS]
         else:
-            # For legacy format, only basic OHLCV columns
-            api_data_dataframe = api_data_dataframe[
-                ["date", "open", "high", "low", "close", "volume"]
-            ]
+            api_data_dataframe = api_data_dataframe[LEGACY_COLUMNS]
 
-        # FIXED: Filter Binance data to only include timestamps within the gap period
+        # Only include Binance data that falls within the gap period
         gap_start_time = pd.to_datetime(timestamp_gap_info["start_time"])
         gap_end_time = pd.to_datetime(timestamp_gap_info["end_time"])
-
-        # Only include Binance data that falls within the gap period
         gap_time_filter = (api_data_dataframe["date"] >= gap_start_time) & (
             api_data_dataframe["date"] < gap_end_time
         )
-        filtered_api_data = api_data_dataframe[gap_time_filter].copy()
+        filtered_api_data = api_data_dataframe[gap_time_filter]
 
         if len(filtered_api_data) == 0:
             logger.warning("   ⚠️ No authentic Binance data falls within gap period after filtering")
-            return False
+            return None
 
         logger.info(
             f"   📊 Filtered to {len(filtered_api_data)} authentic candles within gap period"
         )
-
-        # FIXED: Simple append and sort - no position-based insertion needed
-        combined_dataframe = pd.concat([existing_ohlcv_data, filtered_api_data], ignore_index=True)
-
-        # Sort by date and remove any exact timestamp duplicates (keep first occurrence)
-        combined_dataframe = combined_dataframe.sort_values("date").drop_duplicates(
-            subset=["date"], keep="first"
+        return filtered_api_data
+
+    def _count_remaining_gaps(self, dates: pd.Series, trading_timeframe: str) -> int:
+        """Count intervals still wider than the timeframe after a splice."""
+        expected_interval = np.timedelta64(get_timeframe_interval(trading_timeframe))
+        return int(np.count_nonzero(np.diff(dates.to_numpy()) > expected_interval))
+
+    def _refresh_catalog_entry(self, csv_path: Path) -> None:
+        """Update a cataloged file's range and row count after it was modified in place."""
+        csv_path = Path(csv_path)
+        catalog = DatasetCatalog.existing(csv_path.parent)
+        if catalog is None:
+            return
+        dataset = catalog.get(csv_path)
+        if dataset is None:
+            return
+
+        dates = pd.read_csv(csv_path, comment="#", usecols=["date"])["date"]
+        catalog.record_dataset(
+            csv_path,
+            symbol=dataset.symbol,
+            timeframe=dataset.timeframe,
+            start_time=str(dates.iloc[0]) if len(dates) else None,
+            end_time=str(dates.iloc[-1]) if len(dates) else None,
+            row_count=len(dates),
+            # Filled rows change the content - the collection-time data hash no longer applies
+            content_hash=None,
         )
 
-        # Validate gap was actually filled
-        gap_filled_dataframe = combined_dataframe.sort_values("date").reset_index(drop=True)
-        remaining_timestamp_gaps = []
-
-        # Check if gap is filled by looking for continuous timestamps
-        for validation_index in range(1, len(gap_filled_dataframe)):
-            current_timestamp = gap_filled_dataframe.iloc[validation_index]["date"]
-            previous_timestamp = gap_filled_dataframe.iloc[validation_index - 1]["date"]
-            expected_time_interval = (
-                pd.Timedelta(minutes=1)
-                if trading_timeframe == "1m"
-                else pd.Timedelta(hours=1)
-                if trading_timeframe == "1h"
-                else pd.Timedelta(minutes=int(trading_timeframe[:-1]))
-            )
-            actual_time_difference = current_timestamp - previous_timestamp
-
-            if actual_time_difference > expected_time_interval:
-                # Check if this overlaps with our target gap
-                if (previous_timestamp < gap_end_time) and (current_timestamp > gap_start_time):
-                    remaining_timestamp_gaps.append(f"{previous_timestamp} → {current_timestamp}")
-
-        if remaining_timestamp_gaps:
-            logger.warning(
-                f"   ⚠️ Gap partially filled - remaining gaps: {remaining_timestamp_gaps}"
-            )
-
-        # Save back to CSV with header comments preserved
-        csv_header_comments = []
-        with open(csv_path, "r") as csv_file_handle:
-            for csv_line in csv_file_handle:
-                if csv_line.startswith("#"):
-                    csv_header_comments.append(csv_line.rstrip())
-                else:
-                    break
-
-        # Write header comments + data
-        with open(csv_path, "w") as output_file_handle:
-            for header_comment in csv_header_comments:
-                output_file_handle.write(header_comment + "\n")
-            combined_dataframe.to_csv(output_file_handle, index=False)
-
-        logger.info(f"   ✅ Gap filled with {len(filtered_api_data)} authentic candles")
-        return True
-
     def process_file(self, csv_path: Path, trading_timeframe: str) -> Dict:
         """Process a single CSV file - detect and fill ALL gaps"""
         logger.info(f"🎯 Processing {csv_path} ({trading_timeframe})")
@@ -539,26 +904,23 @@ class UniversalGapFiller:
                 "gaps_detected": 0,
                 "gaps_filled": 0,
                 "gaps_failed": 0,
+                "gaps_unfillable": 0,
                 "success_rate": 100.0,
             }
 
-        # Fill each gap
-        gaps_filled_count = 0
-        gaps_failed_count = 0
-
-        for gap_index, timestamp_gap in enumerate(detected_gaps, 1):
-            logger.info(f"   🔧 Processing gap {gap_index}/{len(detected_gaps)}")
-            if self.fill_gap(timestamp_gap, csv_path, trading_timeframe):
-                gaps_filled_count += 1
-            else:
-                gaps_failed_count += 1
+        # Fill all gaps with one read and one atomic write
+        batch_result = self.fill_gaps_batch(detected_gaps, csv_path, trading_timeframe)
+        gaps_filled_count = batch_result["gaps_filled"]
+        gaps_failed_count = batch_result["gaps_failed"]
+        gaps_unfillable_count = batch_result["gaps_unfillable"]
 
-            # Brief pause between API calls
-            if gap_index < len(detected_gaps):
-                time.sleep(1)
+        if gaps_filled_count:
+            self._refresh_catalog_entry(csv_path)
 
+        # Confirmed exchange outages cannot be filled and do not count against the rate
+        fillable_gap_count = len(detected_gaps) - gaps_unfillable_count
         gap_fill_success_rate = (
-            (gaps_filled_count / len(detected_gaps)) * 100 if detected_gaps else 100.0
+            (gaps_filled_count / fillable_gap_count) * 100 if fillable_gap_count else 100.0
         )
 
         processing_result = {
@@ -566,14 +928,60 @@ class UniversalGapFiller:
             "gaps_detected": len(detected_gaps),
             "gaps_filled": gaps_filled_count,
             "gaps_failed": gaps_failed_count,
+            "gaps_unfillable": gaps_unfillable_count,
             "success_rate": gap_fill_success_rate,
         }
 
         logger.info(
-            f"   📊 Result: {gaps_filled_count}/{len(detected_gaps)} gaps filled ({gap_fill_success_rate:.1f}%)"
+            f"   📊 Result: {gaps_filled_count}/{fillable_gap_count} gaps filled "
+            f"({gap_fill_success_rate:.1f}%), {gaps_unfillable_count} confirmed exchange outages"
         )
         return processing_result
 
+    def process_files(self, csv_files: List[Tuple[Path, str]], max_workers: int = 4) -> List[Dict]:
+        """Process several CSV files concurrently - detect and fill ALL gaps in each.
+
+        Files run on a thread pool; every file is still read once and committed with
+        one atomic write. All workers draw REST request weight from this filler's
+        rate_limiter, so the combined request rate stays within one budget. A file
+        that raises gets an error result instead of aborting the other files.
+
+        Args:
+            csv_files: (csv_path, timeframe) pairs
+            max_workers: Maximum files processed at the same time
+
+        Returns:
+            process_file() result dicts in the order of csv_files; failed files carry
+            an "error" message
+        """
+        if max_workers <= 1 or len(csv_files) <= 1:
+            return [self._process_file_isolated(*csv_file) for csv_file in csv_files]
+
+        logger.info(f"🚀 Processing {len(csv_files)} files with {max_workers} workers")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda csv_file: self._process_file_isolated(*csv_file),
+                    csv_files,
+                )
+            )
+
+    def _process_file_isolated(self, csv_path: Path, trading_timeframe: str) -> Dict:
+        """Run process_file, turning an exception into an error result for this file."""
+        try:
+            return self.process_file(csv_path, trading_timeframe)
+        except Exception as processing_error:
+            logger.error(f"   ❌ Gap filling failed for {csv_path}: {processing_error}")
+            return {
+                "timeframe": trading_timeframe,
+                "gaps_detected": 0,
+                "gaps_filled": 0,
+                "gaps_failed": 0,
+                "gaps_unfillable": 0,
+                "success_rate": 0.0,
+                "error": str(processing_error),
+            }
+
 
 def main():
     """Main execution function"""
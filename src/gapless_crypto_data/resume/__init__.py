@@ -5,8 +5,11 @@ Provides intelligent checkpointing and resume capabilities for large-scale data
 """
 
 from .intelligent_checkpointing import CheckpointError, IntelligentCheckpointManager
+from .task_staging import TaskStagingArea, period_is_closed
 
 __all__ = [
     "IntelligentCheckpointManager",
     "CheckpointError",
+    "TaskStagingArea",
+    "period_is_closed",
 ]
@@ -11,10 +11,24 @@ Architecture:
     - Collection-level checkpointing: Resume from last completed collection task
     - Progress persistence: Maintains collection state across interruptions
     - Integrity validation: Verifies checkpoint consistency before resume
+    - Stable session identity: The checkpoint file is named after a hash of the
+      collection parameters, so rerunning an interrupted collection finds its state
+    - Append-only journal: Each progress update is one JSON line appended to
+      ``session_<id>.journal.jsonl``; every ``compact_every`` updates the state is
+      written to the ``session_<id>.json`` snapshot and the journal starts over.
+      Recovery loads the snapshot and replays the journal on top of it.
+
+Journal lines are flushed to the OS on every update, so a killed process loses
+nothing; fsync runs every ``fsync_every`` updates (and on compaction and close),
+bounding what a power failure can lose. Every update carries a sequence number
+and the snapshot records the last one it includes, so a crash between writing
+the snapshot and truncating the journal never applies an update twice. A torn
+final line from a crash mid-append is ignored.
 """
 
 import hashlib
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -22,6 +36,12 @@ from typing import Any, Dict, List, Optional, Union
 # joblib removed - using simple JSON state persistence
 from ..utils import GaplessCryptoError, get_standard_logger
 
+# Journal lines appended between fsync calls
+DEFAULT_FSYNC_BATCH = 32
+
+# Journal lines after which the state is compacted into the snapshot
+DEFAULT_COMPACT_EVENTS = 1000
+
 
 class CheckpointError(GaplessCryptoError):
     """Checkpoint-specific errors"""
@@ -42,15 +62,32 @@ class IntelligentCheckpointManager:
         cache_dir: Optional[Union[str, Path]] = None,
         verbose: int = 1,
         compress: Union[bool, int] = True,
+        symbols: Optional[List[str]] = None,
+        timeframes: Optional[List[str]] = None,
+        collection_params: Optional[Dict[str, Any]] = None,
+        fsync_every: int = DEFAULT_FSYNC_BATCH,
+        compact_every: int = DEFAULT_COMPACT_EVENTS,
     ):
         """
         Initialize checkpoint manager with SOTA joblib configuration.
 
+        The session ID is derived from the collection parameters (see
+        ``checkpoint_key``); ``get_resume_plan`` rebinds the session to the parameters
+        it is given, so they may also be supplied there.
+
         Args:
             cache_dir: Directory for checkpoint cache (default: ./.gapless_checkpoints)
             verbose: Joblib verbosity level (0=silent, 1=progress, 2=debug)
             compress: Compression level for checkpoints (True/False or 0-9)
+            symbols: Symbols of the collection
+            timeframes: Timeframes of the collection
+            collection_params: Collection parameters (start_date, end_date, output_dir)
+            fsync_every: Journal lines appended between fsync calls
+            compact_every: Journal lines after which the snapshot is rewritten
         """
+        if fsync_every < 1 or compact_every < 1:
+            raise ValueError("fsync_every and compact_every must be at least 1")
+
         self.cache_dir = Path(cache_dir or ".gapless_checkpoints").resolve()
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -59,12 +96,56 @@ class IntelligentCheckpointManager:
         self._verbose = verbose
         self._compress = compress
 
+        self.fsync_every = fsync_every
+        self.compact_every = compact_every
+        self._journal = None
+        self._journal_lines = 0
+        self._unsynced_lines = 0
+
         self.logger = get_standard_logger("checkpoint_manager")
-        self.session_id = self._generate_session_id()
-        self.checkpoint_file = self.cache_dir / f"session_{self.session_id}.json"
+        self._bind_session(self.checkpoint_key(symbols or [], timeframes or [], collection_params))
 
         # Progress tracking
-        self.progress_data: Dict[str, Any] = {
+        self.progress_data = self._new_progress_data()
+
+        self.logger.info(f"🔄 Checkpoint manager initialized: {self.cache_dir}")
+        self.logger.info(f"📋 Session ID: {self.session_id}")
+
+    @staticmethod
+    def checkpoint_key(
+        symbols: List[str],
+        timeframes: List[str],
+        collection_params: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Deterministic session identifier for a collection.
+
+        The same symbols, timeframes, date range and output directory always map to
+        the same key (regardless of list order or how the directory is spelled), so a
+        restarted collection reopens the checkpoint of the interrupted one.
+
+        Args:
+            symbols: Symbols to collect
+            timeframes: Timeframes to collect
+            collection_params: Collection parameters (start_date, end_date, output_dir)
+
+        Returns:
+            16-character hex key
+        """
+        collection_params = collection_params or {}
+        output_dir = collection_params.get("output_dir")
+        identity = {
+            "symbols": sorted(set(symbols)),
+            "timeframes": sorted(set(timeframes)),
+            "start_date": collection_params.get("start_date"),
+            "end_date": collection_params.get("end_date"),
+            "output_dir": str(Path(output_dir).resolve()) if output_dir else None,
+        }
+        encoded = json.dumps(identity, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def _new_progress_data(self) -> Dict[str, Any]:
+        return {
             "session_id": self.session_id,
             "created_at": datetime.now().isoformat(),
             "last_updated": datetime.now().isoformat(),
@@ -73,65 +154,200 @@ class IntelligentCheckpointManager:
             "total_datasets_collected": 0,
             "collection_parameters": {},
             "errors": [],
+            "journal_seq": 0,
         }
 
-        self.logger.info(f"🔄 Checkpoint manager initialized: {self.cache_dir}")
-        self.logger.info(f"📋 Session ID: {self.session_id}")
+    def _bind_session(self, session_id: str) -> None:
+        """Point the manager at the checkpoint files of a session."""
+        if getattr(self, "session_id", None) != session_id:
+            self.close()
+        self.session_id = session_id
+        self.checkpoint_file = self.cache_dir / f"session_{session_id}.json"
+        self.journal_file = self.cache_dir / f"session_{session_id}.journal.jsonl"
+        if hasattr(self, "progress_data"):
+            self.progress_data["session_id"] = session_id
+
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        """Apply one progress update to progress_data (live and during replay)."""
+        op = event["op"]
+        symbols_in_progress = self.progress_data["symbols_in_progress"]
+        symbol = event.get("symbol")
+
+        if op == "update":
+            self.progress_data.update(event["data"])
+        elif op == "symbol_start":
+            previous = symbols_in_progress.get(symbol, {})
+            symbols_in_progress[symbol] = {
+                "started_at": previous.get("started_at", event["at"]),
+                "timeframes": event["timeframes"],
+                "completed_timeframes": previous.get("completed_timeframes", []),
+                "failed_timeframes": [],
+            }
+            self.progress_data["current_symbol"] = symbol
+        elif op == "timeframe_complete":
+            symbols_in_progress[symbol]["completed_timeframes"].append(
+                {
+                    "timeframe": event["timeframe"],
+                    "completed_at": event["at"],
+                    "filepath": event["filepath"],
+                    "file_size_mb": event["file_size_mb"],
+                }
+            )
+            self.progress_data["total_datasets_collected"] += 1
+        elif op == "symbol_complete":
+            # Move from in_progress to completed
+            self.progress_data["symbols_completed"].append(symbol)
+            del symbols_in_progress[symbol]
+            self.progress_data["completed_symbol"] = symbol
+        elif op == "symbol_failed":
+            self.progress_data["errors"].append(
+                {"symbol": symbol, "error": event["error"], "timestamp": event["at"]}
+            )
+            # Keep timeframes collected before the failure so a rerun skips them
+            if symbol in symbols_in_progress and not self.completed_timeframes(symbol):
+                del symbols_in_progress[symbol]
+            self.progress_data["failed_symbol"] = symbol
+        else:
+            raise CheckpointError(f"Unknown checkpoint journal operation: {op}")
+
+        self.progress_data["journal_seq"] = event["seq"]
+        self.progress_data["last_updated"] = event["at"]
+
+    def _record(self, op: str, **fields: Any) -> None:
+        """Apply a progress update and append it to the journal."""
+        event = {
+            "op": op,
+            "seq": self.progress_data.get("journal_seq", 0) + 1,
+            "at": datetime.now().isoformat(),
+            **fields,
+        }
+        try:
+            self._apply_event(event)
+
+            if self._journal is None:
+                self._journal = open(self.journal_file, "a")
+            self._journal.write(json.dumps(event, default=str) + "\n")
+            self._journal.flush()
+            self._journal_lines += 1
+            self._unsynced_lines += 1
+
+            if self._journal_lines >= self.compact_every:
+                self.compact()
+            elif self._unsynced_lines >= self.fsync_every:
+                self.sync()
+
+        except CheckpointError:
+            raise
+        except Exception as e:
+            raise CheckpointError(f"Failed to save checkpoint: {e}")
 
-    def _generate_session_id(self) -> str:
-        """Generate unique session identifier for checkpoint isolation."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        random_suffix = hashlib.md5(str(datetime.now().timestamp()).encode()).hexdigest()[:8]
-        return f"{timestamp}_{random_suffix}"
+    def sync(self) -> None:
+        """Force journal lines appended so far to disk."""
+        if self._journal is not None and self._unsynced_lines:
+            os.fsync(self._journal.fileno())
+        self._unsynced_lines = 0
 
-    def save_checkpoint(self, checkpoint_data: Dict[str, Any]) -> None:
+    def compact(self) -> None:
         """
-        Save checkpoint with atomic operations and integrity validation.
+        Write the full state to the snapshot and start an empty journal.
 
-        Args:
-            checkpoint_data: Checkpoint state to persist
+        The snapshot is written to a temporary file, synced and renamed into place
+        before the journal is truncated; replay skips journal lines the snapshot
+        already includes, so a crash at any point leaves a consistent checkpoint.
         """
         try:
-            # Update progress data
-            self.progress_data.update(checkpoint_data)
-            self.progress_data["last_updated"] = datetime.now().isoformat()
-
-            # Atomic write to prevent corruption
             temp_file = self.checkpoint_file.with_suffix(".tmp")
             with open(temp_file, "w") as f:
                 json.dump(self.progress_data, f, indent=2, default=str)
-
-            # Atomic rename for consistency
+                f.flush()
+                os.fsync(f.fileno())
             temp_file.replace(self.checkpoint_file)
 
-            self.logger.debug(
-                f"💾 Checkpoint saved: {checkpoint_data.get('current_symbol', 'unknown')}"
-            )
+            self.close()
+            self.journal_file.unlink(missing_ok=True)
+            self._journal_lines = 0
+
+            self.logger.debug(f"💾 Checkpoint compacted: {self.progress_data['journal_seq']}")
 
         except Exception as e:
             raise CheckpointError(f"Failed to save checkpoint: {e}")
 
+    def close(self) -> None:
+        """Sync and close the journal (it is reopened by the next update)."""
+        if getattr(self, "_journal", None) is not None:
+            self.sync()
+            self._journal.close()
+            self._journal = None
+
+    def save_checkpoint(self, checkpoint_data: Dict[str, Any]) -> None:
+        """
+        Record top-level checkpoint fields (e.g., collection_parameters) in the journal.
+
+        Args:
+            checkpoint_data: Checkpoint state to persist
+        """
+        self._record("update", data=checkpoint_data)
+        self.logger.debug(
+            f"💾 Checkpoint saved: {checkpoint_data.get('current_symbol', 'unknown')}"
+        )
+
+    def _replay_journal(self) -> int:
+        """Apply journal lines newer than the loaded state; returns lines read."""
+        if not self.journal_file.exists():
+            return 0
+
+        lines_read = 0
+        valid_bytes = 0
+        with open(self.journal_file, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated line")
+                    event = json.loads(line)
+                except ValueError:
+                    # Torn final line from a crash mid-append: cut it off so new
+                    # lines are not appended to the fragment
+                    self.logger.warning("⚠️  Dropping incomplete checkpoint journal line")
+                    os.truncate(self.journal_file, valid_bytes)
+                    break
+                lines_read += 1
+                valid_bytes += len(line)
+                if event["seq"] > self.progress_data.get("journal_seq", 0):
+                    self._apply_event(event)
+        return lines_read
+
     def load_checkpoint(self) -> Optional[Dict[str, Any]]:
         """
-        Load checkpoint with integrity validation.
+        Load checkpoint (snapshot plus journal) with integrity validation.
 
         Returns:
             Checkpoint data if valid, None if no valid checkpoint exists
         """
         try:
-            if not self.checkpoint_file.exists():
+            if not self.checkpoint_file.exists() and not self.journal_file.exists():
                 self.logger.info("📂 No existing checkpoint found")
                 return None
 
-            with open(self.checkpoint_file, "r") as f:
-                checkpoint_data = json.load(f)
+            self.close()
+            if self.checkpoint_file.exists():
+                with open(self.checkpoint_file, "r") as f:
+                    checkpoint_data = json.load(f)
+            else:
+                checkpoint_data = self._new_progress_data()
 
             # Validate checkpoint integrity
             if not self._validate_checkpoint(checkpoint_data):
                 self.logger.warning("⚠️  Invalid checkpoint detected, starting fresh")
                 return None
 
+            previous_data = self.progress_data
             self.progress_data = checkpoint_data
+            try:
+                self._journal_lines = self._replay_journal()
+            except Exception:
+                self.progress_data = previous_data
+                raise
+
             self.logger.info(f"📋 Loaded checkpoint: Session {checkpoint_data.get('session_id')}")
             self.logger.info(
                 f"✅ Completed symbols: {len(checkpoint_data.get('symbols_completed', []))}"
@@ -175,15 +391,21 @@ class IntelligentCheckpointManager:
             collection_params: Collection parameters (dates, output_dir, etc.)
 
         Returns:
-            Resume plan with remaining work and progress summary
+            Resume plan with remaining work and progress summary. ``remaining_timeframes``
+            maps each remaining symbol to the timeframes it still needs.
         """
+        self._bind_session(
+            self.checkpoint_key(requested_symbols, requested_timeframes, collection_params)
+        )
         checkpoint = self.load_checkpoint()
+        fresh_timeframes = {symbol: list(requested_timeframes) for symbol in requested_symbols}
 
         if not checkpoint:
             # No checkpoint - start from beginning
             return {
                 "resume_required": False,
                 "remaining_symbols": requested_symbols,
+                "remaining_timeframes": fresh_timeframes,
                 "completed_symbols": [],
                 "symbols_in_progress": {},
                 "total_progress": 0.0,
@@ -198,6 +420,7 @@ class IntelligentCheckpointManager:
             return {
                 "resume_required": False,
                 "remaining_symbols": requested_symbols,
+                "remaining_timeframes": fresh_timeframes,
                 "completed_symbols": [],
                 "symbols_in_progress": {},
                 "total_progress": 0.0,
@@ -208,6 +431,10 @@ class IntelligentCheckpointManager:
         completed_symbols = set(checkpoint.get("symbols_completed", []))
         symbols_in_progress = checkpoint.get("symbols_in_progress", {})
         remaining_symbols = [s for s in requested_symbols if s not in completed_symbols]
+        remaining_timeframes = {}
+        for symbol in remaining_symbols:
+            done = self.completed_timeframes(symbol)
+            remaining_timeframes[symbol] = [tf for tf in requested_timeframes if tf not in done]
 
         # Calculate progress
         total_tasks = len(requested_symbols) * len(requested_timeframes)
@@ -222,6 +449,7 @@ class IntelligentCheckpointManager:
         resume_plan = {
             "resume_required": len(completed_symbols) > 0 or len(symbols_in_progress) > 0,
             "remaining_symbols": remaining_symbols,
+            "remaining_timeframes": remaining_timeframes,
             "completed_symbols": list(completed_symbols),
             "symbols_in_progress": symbols_in_progress,
             "total_progress": progress_percentage,
@@ -255,60 +483,48 @@ class IntelligentCheckpointManager:
 
         return True
 
+    def completed_timeframes(self, symbol: str) -> List[str]:
+        """Timeframes of an in-progress symbol that were already collected."""
+        symbol_progress = self.progress_data["symbols_in_progress"].get(symbol, {})
+        return [entry["timeframe"] for entry in symbol_progress.get("completed_timeframes", [])]
+
     def mark_symbol_start(self, symbol: str, timeframes: List[str]) -> None:
-        """Mark symbol collection as started."""
-        self.progress_data["symbols_in_progress"][symbol] = {
-            "started_at": datetime.now().isoformat(),
-            "timeframes": timeframes,
-            "completed_timeframes": [],
-            "failed_timeframes": [],
-        }
-        self.save_checkpoint({"current_symbol": symbol})
+        """Mark symbol collection as started (keeping timeframes completed before a restart)."""
+        self._record("symbol_start", symbol=symbol, timeframes=timeframes)
 
     def mark_timeframe_complete(
         self, symbol: str, timeframe: str, filepath: Path, file_size_mb: float
     ) -> None:
         """Mark timeframe collection as completed."""
         if symbol in self.progress_data["symbols_in_progress"]:
-            symbol_progress = self.progress_data["symbols_in_progress"][symbol]
-            symbol_progress["completed_timeframes"].append(
-                {
-                    "timeframe": timeframe,
-                    "completed_at": datetime.now().isoformat(),
-                    "filepath": str(filepath),
-                    "file_size_mb": file_size_mb,
-                }
+            if timeframe in self.completed_timeframes(symbol):
+                return
+            self._record(
+                "timeframe_complete",
+                symbol=symbol,
+                timeframe=timeframe,
+                filepath=str(filepath),
+                file_size_mb=file_size_mb,
             )
 
-            self.progress_data["total_datasets_collected"] += 1
-            self.save_checkpoint({})
-
     def mark_symbol_complete(self, symbol: str) -> None:
         """Mark symbol collection as fully completed."""
         if symbol in self.progress_data["symbols_in_progress"]:
-            # Move from in_progress to completed
-            self.progress_data["symbols_completed"].append(symbol)
-            del self.progress_data["symbols_in_progress"][symbol]
-
-            self.save_checkpoint({"completed_symbol": symbol})
+            self._record("symbol_complete", symbol=symbol)
             self.logger.info(f"✅ Symbol completed: {symbol}")
 
     def mark_symbol_failed(self, symbol: str, error: str) -> None:
         """Mark symbol collection as failed."""
-        self.progress_data["errors"].append(
-            {"symbol": symbol, "error": error, "timestamp": datetime.now().isoformat()}
-        )
-
-        if symbol in self.progress_data["symbols_in_progress"]:
-            del self.progress_data["symbols_in_progress"][symbol]
-
-        self.save_checkpoint({"failed_symbol": symbol})
+        self._record("symbol_failed", symbol=symbol, error=error)
 
     def clear_checkpoint(self) -> None:
         """Clear checkpoint and start fresh."""
         try:
-            if self.checkpoint_file.exists():
-                self.checkpoint_file.unlink()
+            self.close()
+            self.checkpoint_file.unlink(missing_ok=True)
+            self.journal_file.unlink(missing_ok=True)
+            self._journal_lines = 0
+            self.progress_data = self._new_progress_data()
 
             # Clear cache directory (joblib removed)
             import shutil
@@ -340,7 +556,10 @@ class IntelligentCheckpointManager:
         try:
             cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 3600)
 
-            for checkpoint_file in self.cache_dir.glob("session_*.json"):
+            session_files = list(self.cache_dir.glob("session_*.json")) + list(
+                self.cache_dir.glob("session_*.journal.jsonl")
+            )
+            for checkpoint_file in session_files:
                 if checkpoint_file.stat().st_mtime < cutoff_time:
                     checkpoint_file.unlink()
                     self.logger.debug(f"🗑️  Cleaned up old session: {checkpoint_file.name}")
@@ -0,0 +1,133 @@
+"""
+Task-level staging of downloaded archives for resumable collection.
+
+Each completed download task (one monthly or daily Binance archive) is written to
+the staging area as soon as it has been parsed, keyed by symbol, timeframe and
+period identifier ("2024-01" or "2024-01-15"). A collection that dies after 70 of
+80 archives therefore leaves 70 staged tasks behind; the next run loads them
+from disk and downloads only the remaining 10. Staged tasks of a timeframe are
+cleared once its output file has been written.
+
+Only periods that have fully ended are staged: an archive of the current month
+or day can still grow, so it is always downloaded again.
+
+Layout::
+
+    <staging_dir>/<symbol>/<timeframe>/<period_identifier>.json
+"""
+
+import json
+import os
+import shutil
+from calendar import monthrange
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Set, Union
+
+from ..utils import get_standard_logger
+
+
+def period_is_closed(period_identifier: str, today: Optional[date] = None) -> bool:
+    """
+    Whether a monthly ("2024-01") or daily ("2024-01-15") period has fully ended.
+
+    Args:
+        period_identifier: Period of a download task
+        today: Reference UTC date (default: current UTC date)
+
+    Returns:
+        True if the last day of the period is before ``today``
+    """
+    today = today or datetime.now(timezone.utc).date()
+    parts = [int(part) for part in period_identifier.split("-")]
+    if len(parts) == 2:
+        year, month = parts
+        period_end = date(year, month, monthrange(year, month)[1])
+    else:
+        period_end = date(*parts)
+    return period_end < today
+
+
+class TaskStagingArea:
+    """
+    Directory of parsed download tasks that survives interrupted collections.
+
+    Examples:
+        >>> staging = TaskStagingArea("./data/.staging/parsed")
+        >>> staging.save("BTCUSDT", "1h", "2024-01", rows)
+        >>> staging.completed_periods("BTCUSDT", "1h")
+        {'2024-01'}
+        >>> staging.load("BTCUSDT", "1h", "2024-01") == rows
+        True
+        >>> staging.clear("BTCUSDT", "1h")
+    """
+
+    def __init__(self, staging_dir: Union[str, Path]):
+        """
+        Initialize staging area.
+
+        Args:
+            staging_dir: Directory holding staged tasks (created on first save)
+        """
+        self.staging_dir = Path(staging_dir)
+        self.logger = get_standard_logger("task_staging")
+
+    def task_path(self, symbol: str, timeframe: str, period_identifier: str) -> Path:
+        """Path of the staged file for one download task."""
+        return self.staging_dir / symbol / timeframe / f"{period_identifier}.json"
+
+    def save(self, symbol: str, timeframe: str, period_identifier: str, rows: List[List]) -> Path:
+        """
+        Stage the parsed rows of a completed download task.
+
+        The file is written to a temporary name and renamed into place, so a crash
+        mid-write never leaves a truncated task behind.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe of the archive
+            period_identifier: Period of the archive
+            rows: Parsed rows of the archive
+
+        Returns:
+            Path of the staged task
+        """
+        path = self.task_path(symbol, timeframe, period_identifier)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump({"period": period_identifier, "rows": rows}, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+        return path
+
+    def load(self, symbol: str, timeframe: str, period_identifier: str) -> Optional[List[List]]:
+        """
+        Rows of a staged task.
+
+        Returns:
+            The staged rows, or None if the task is not staged or its file is unreadable
+        """
+        path = self.task_path(symbol, timeframe, period_identifier)
+        try:
+            with open(path, "r") as f:
+                return json.load(f)["rows"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"⚠️  Discarding unreadable staged task {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def completed_periods(self, symbol: str, timeframe: str) -> Set[str]:
+        """Period identifiers staged for a symbol and timeframe."""
+        task_dir = self.staging_dir / symbol / timeframe
+        if not task_dir.is_dir():
+            return set()
+        return {path.stem for path in task_dir.glob("*.json")}
+
+    def clear(self, symbol: str, timeframe: str) -> None:
+        """Remove the staged tasks of a symbol and timeframe."""
+        task_dir = self.staging_dir / symbol / timeframe
+        if task_dir.exists():
+            shutil.rmtree(task_dir, ignore_errors=True)
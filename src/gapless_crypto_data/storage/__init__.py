@@ -0,0 +1,36 @@
+"""
+Storage layer for gapless-crypto-data.
+
+Provides columnar file layouts (Parquet, Arrow IPC) with time-range aware and
+memory-mapped reads, plus the SQLite catalog indexing collected datasets.
+"""
+
+from .catalog import (
+    CATALOG_FILENAME,
+    UNFILLABLE_GAP_MAX_AGE,
+    CatalogError,
+    DatasetCatalog,
+    DatasetRecord,
+    UnfillableGap,
+)
+from .columnar import (
+    read_arrow_ipc,
+    read_arrow_ipc_table,
+    read_parquet_range,
+    write_arrow_ipc,
+    write_partitioned_parquet,
+)
+
+__all__ = [
+    "DatasetCatalog",
+    "DatasetRecord",
+    "UnfillableGap",
+    "CatalogError",
+    "CATALOG_FILENAME",
+    "UNFILLABLE_GAP_MAX_AGE",
+    "write_partitioned_parquet",
+    "read_parquet_range",
+    "write_arrow_ipc",
+    "read_arrow_ipc",
+    "read_arrow_ipc_table",
+]
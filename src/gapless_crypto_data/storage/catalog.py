@@ -0,0 +1,815 @@
+"""
+Dataset Catalog - SQLite index of collected datasets in an output directory
+
+Replaces directory globbing and filename heuristics with a small SQLite database
+stored next to the data. Each dataset row records symbol, timeframe, exact time
+range, row count, content hash, file format and the last validation result.
+
+Architecture:
+    - One catalog file per output directory (.gapless_catalog.sqlite)
+    - Every writer updates the catalog inside a single transaction
+    - Lookups and coverage ("what's missing") queries use a
+      (symbol, timeframe, end_time) index instead of scanning the directory
+    - Directories written before the catalog existed are bootstrapped from
+      filenames and their metadata JSON sidecars; lookups reconcile with the
+      directory only when its mtime changed (files added, renamed or removed),
+      and reconcile() re-indexes in-place edits on request
+    - Gaps confirmed absent upstream (exchange outages) are registered per
+      symbol/timeframe/range so gap filling and validation can skip them
+"""
+
+import json
+import re
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from ..utils import TIMEFRAME_INTERVALS, GaplessCryptoError, get_standard_logger
+
+CATALOG_FILENAME = ".gapless_catalog.sqlite"
+CATALOG_SCHEMA_VERSION = 1
+
+# Registered unfillable gaps older than this are re-checked instead of trusted
+UNFILLABLE_GAP_MAX_AGE = timedelta(days=30)
+
+# binance_spot_{SYMBOL}-{TIMEFRAME}_{START}-{END}_{VERSION}.{EXT}
+OUTPUT_FILENAME_PATTERN = re.compile(
+    r"^binance_spot_(?P<symbol>[A-Z0-9]+)-(?P<timeframe>[0-9]+(?:s|m|h|d|w|mo))"
+    r"_(?P<start>\d{8})-(?P<end>\d{8})_(?P<version>v[\d.]+)\.(?P<extension>csv|parquet|arrow)$"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    filename TEXT PRIMARY KEY,
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    start_time TEXT,
+    end_time TEXT,
+    row_count INTEGER,
+    content_hash TEXT,
+    format TEXT NOT NULL,
+    file_size INTEGER,
+    updated_at TEXT NOT NULL,
+    validation_status TEXT,
+    validation_timestamp TEXT,
+    validation_summary TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_datasets_symbol_timeframe
+    ON datasets (symbol, timeframe, end_time);
+CREATE INDEX IF NOT EXISTS idx_datasets_timeframe ON datasets (timeframe);
+CREATE TABLE IF NOT EXISTS unfillable_gaps (
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    gap_start TEXT NOT NULL,
+    gap_end TEXT NOT NULL,
+    confirmed_at TEXT NOT NULL,
+    reason TEXT,
+    PRIMARY KEY (symbol, timeframe, gap_start, gap_end)
+);
+CREATE TABLE IF NOT EXISTS catalog_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Looser names accepted for CSV files (e.g., BTCUSDT_1h_data.csv, ETHUSDT-4h.csv);
+# CSV files without a recognizable timeframe token are not datasets
+LOOSE_CSV_TIMEFRAME_PATTERN = re.compile(r"[-_](?P<timeframe>[0-9]+(?:s|m|h|d|w|mo))(?:[-_.]|$)")
+
+_UPSERT_DATASET = """
+INSERT INTO datasets (filename, symbol, timeframe, start_time, end_time,
+                      row_count, content_hash, format, file_size, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(filename) DO UPDATE SET
+    symbol = excluded.symbol,
+    timeframe = excluded.timeframe,
+    start_time = excluded.start_time,
+    end_time = excluded.end_time,
+    row_count = excluded.row_count,
+    content_hash = excluded.content_hash,
+    format = excluded.format,
+    file_size = excluded.file_size,
+    updated_at = excluded.updated_at,
+    validation_status = NULL,
+    validation_timestamp = NULL,
+    validation_summary = NULL
+"""
+
+_COLUMNS = (
+    "filename, symbol, timeframe, start_time, end_time, row_count, content_hash, format, "
+    "file_size, updated_at, validation_status, validation_timestamp, validation_summary"
+)
+
+
+class CatalogError(GaplessCryptoError):
+    """Dataset catalog errors"""
+
+    pass
+
+
+@dataclass
+class DatasetRecord:
+    """Catalog entry for one dataset file."""
+
+    path: Path
+    symbol: str
+    timeframe: str
+    start_time: Optional[str]
+    end_time: Optional[str]
+    row_count: Optional[int]
+    content_hash: Optional[str]
+    format: str
+    file_size: Optional[int] = None
+    updated_at: Optional[str] = None
+    validation_status: Optional[str] = None
+    validation_timestamp: Optional[str] = None
+    validation_summary: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class UnfillableGap:
+    """
+    Gap confirmed to have no data upstream (e.g., an exchange outage).
+
+    ``gap_start`` is the open time of the first missing bar and ``gap_end`` the
+    open time of the next bar present in the data, both "YYYY-MM-DD HH:MM:SS" UTC.
+    """
+
+    symbol: str
+    timeframe: str
+    gap_start: str
+    gap_end: str
+    confirmed_at: str
+    reason: Optional[str] = None
+
+    def covers(self, gap_start: Union[str, datetime], gap_end: Union[str, datetime]) -> bool:
+        """Check whether [gap_start, gap_end) lies inside this gap."""
+        return self.gap_start <= _format_bound(
+            gap_start, end_of_day=False
+        ) and self.gap_end >= _format_bound(gap_end, end_of_day=False)
+
+
+class DatasetCatalog:
+    """
+    SQLite-backed catalog of datasets stored in one output directory.
+
+    Examples:
+        >>> catalog = DatasetCatalog.for_directory("./data")
+        >>> for record in catalog.find(symbol="BTCUSDT", format="csv"):
+        ...     print(record.timeframe, record.start_time, record.end_time, record.row_count)
+
+        >>> catalog.find_missing(["BTCUSDT", "ETHUSDT"], ["1h", "4h"], "2024-01-01", "2024-06-30")
+        [{'symbol': 'ETHUSDT', 'timeframe': '4h', 'missing_start': '2024-01-01 00:00:00', ...}]
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Open (and create if needed) the catalog for a directory.
+
+        Args:
+            directory: Output directory holding the datasets
+        """
+        self.directory = Path(directory)
+        self.catalog_path = self.directory / CATALOG_FILENAME
+        self.logger = get_standard_logger("dataset_catalog")
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as conn:
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+
+    @classmethod
+    def for_directory(cls, directory: Union[str, Path]) -> "DatasetCatalog":
+        """
+        Open the catalog for a directory, bootstrapping it from existing files once.
+
+        Args:
+            directory: Output directory holding the datasets
+
+        Returns:
+            DatasetCatalog for the directory
+        """
+        is_new = not (Path(directory) / CATALOG_FILENAME).exists()
+        catalog = cls(directory)
+        if is_new:
+            catalog.rebuild()
+        return catalog
+
+    @classmethod
+    def existing(cls, directory: Union[str, Path]) -> Optional["DatasetCatalog"]:
+        """Open the catalog only if the directory already has one."""
+        if not (Path(directory) / CATALOG_FILENAME).exists():
+            return None
+        return cls(directory)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection whose statements commit together or roll back together."""
+        try:
+            conn = sqlite3.connect(str(self.catalog_path), timeout=30.0)
+        except sqlite3.Error as e:
+            raise CatalogError(f"Cannot open dataset catalog {self.catalog_path}: {e}") from e
+
+        try:
+            # A persistent rollback journal is never created or deleted per connection,
+            # so catalog access leaves the directory mtime (the reconcile trigger) alone
+            conn.execute("PRAGMA journal_mode=PERSIST")
+            with conn:
+                yield conn
+        except sqlite3.Error as e:
+            raise CatalogError(f"Dataset catalog operation failed: {e}") from e
+        finally:
+            conn.close()
+
+    def _row_to_record(self, row: tuple) -> DatasetRecord:
+        summary = json.loads(row[12]) if row[12] else None
+        return DatasetRecord(
+            path=self.directory / row[0],
+            symbol=row[1],
+            timeframe=row[2],
+            start_time=row[3],
+            end_time=row[4],
+            row_count=row[5],
+            content_hash=row[6],
+            format=row[7],
+            file_size=row[8],
+            updated_at=row[9],
+            validation_status=row[10],
+            validation_timestamp=row[11],
+            validation_summary=summary,
+        )
+
+    def record_dataset(
+        self,
+        path: Union[str, Path],
+        symbol: str,
+        timeframe: str,
+        start_time: Optional[str],
+        end_time: Optional[str],
+        row_count: Optional[int],
+        content_hash: Optional[str],
+        replaces: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        Insert or update a dataset entry after its file has been written.
+
+        Args:
+            path: Dataset file path (inside the catalog directory)
+            symbol: Trading pair symbol
+            timeframe: Bar timeframe (e.g., "1h")
+            start_time: First bar open time ("YYYY-MM-DD HH:MM:SS")
+            end_time: Last bar open time ("YYYY-MM-DD HH:MM:SS")
+            row_count: Number of data rows
+            content_hash: Data hash recorded in the dataset metadata
+            replaces: Previous file of the same dataset removed by this write
+                (e.g., after an incremental update renamed it); dropped in the
+                same transaction
+        """
+        path = Path(path)
+        file_size = path.stat().st_size if path.exists() else None
+        now = datetime.now(timezone.utc).isoformat()
+
+        with self._transaction() as conn:
+            if replaces is not None and Path(replaces).name != path.name:
+                conn.execute("DELETE FROM datasets WHERE filename = ?", (Path(replaces).name,))
+            conn.execute(
+                _UPSERT_DATASET,
+                (
+                    path.name,
+                    symbol,
+                    timeframe,
+                    start_time,
+                    end_time,
+                    row_count,
+                    content_hash,
+                    path.suffix.lstrip("."),
+                    file_size,
+                    now,
+                ),
+            )
+
+    def record_validation(
+        self, path: Union[str, Path], status: str, summary: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Store the latest validation result for a dataset.
+
+        Args:
+            path: Dataset file path
+            status: Validation status (e.g., "PERFECT", "GOOD", "FAILED", "ERROR")
+            summary: Compact validation summary stored as JSON
+
+        Returns:
+            True if the dataset is in the catalog and was updated
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE datasets
+                SET validation_status = ?, validation_timestamp = ?, validation_summary = ?
+                WHERE filename = ?
+                """,
+                (
+                    status,
+                    datetime.now(timezone.utc).isoformat(),
+                    json.dumps(summary, default=str) if summary is not None else None,
+                    Path(path).name,
+                ),
+            )
+            return cursor.rowcount > 0
+
+    def remove(self, path: Union[str, Path]) -> None:
+        """Drop a dataset entry (e.g., after its file was deleted)."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM datasets WHERE filename = ?", (Path(path).name,))
+
+    def get(self, path: Union[str, Path]) -> Optional[DatasetRecord]:
+        """
+        Look up the entry for a dataset file.
+
+        Args:
+            path: Dataset file path (only the filename is used)
+
+        Returns:
+            DatasetRecord or None if the file is not cataloged
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM datasets WHERE filename = ?", (Path(path).name,)
+            ).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def record_unfillable_gap(
+        self,
+        symbol: str,
+        timeframe: str,
+        gap_start: Union[str, datetime],
+        gap_end: Union[str, datetime],
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Register a gap confirmed absent upstream, or refresh its confirmation time.
+
+        Args:
+            symbol: Trading pair symbol (e.g., "BTCUSDT")
+            timeframe: Timeframe (e.g., "1h")
+            gap_start: Open time of the first missing bar
+            gap_end: Open time of the next bar present in the data
+            reason: Short note on how absence was confirmed
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO unfillable_gaps
+                    (symbol, timeframe, gap_start, gap_end, confirmed_at, reason)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (symbol, timeframe, gap_start, gap_end)
+                DO UPDATE SET confirmed_at = excluded.confirmed_at, reason = excluded.reason
+                """,
+                (
+                    symbol,
+                    timeframe,
+                    _format_bound(gap_start, end_of_day=False),
+                    _format_bound(gap_end, end_of_day=False),
+                    datetime.now(timezone.utc).isoformat(),
+                    reason,
+                ),
+            )
+
+    def find_unfillable_gaps(
+        self,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> List[UnfillableGap]:
+        """
+        List registered unfillable gaps in chronological order.
+
+        Args:
+            symbol: Filter by symbol
+            timeframe: Filter by timeframe
+            max_age: Only return gaps confirmed within this age; older confirmations
+                are due for revalidation
+
+        Returns:
+            List of UnfillableGap entries
+        """
+        clauses, params = [], []
+        if symbol:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if timeframe:
+            clauses.append("timeframe = ?")
+            params.append(timeframe)
+        if max_age is not None:
+            clauses.append("confirmed_at >= ?")
+            params.append((datetime.now(timezone.utc) - max_age).isoformat())
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT symbol, timeframe, gap_start, gap_end, confirmed_at, reason "
+                f"FROM unfillable_gaps {where} ORDER BY symbol, timeframe, gap_start",
+                params,
+            ).fetchall()
+        return [UnfillableGap(*row) for row in rows]
+
+    def is_unfillable_gap(
+        self,
+        symbol: str,
+        timeframe: str,
+        gap_start: Union[str, datetime],
+        gap_end: Union[str, datetime],
+        max_age: Optional[timedelta] = None,
+    ) -> bool:
+        """
+        Check whether a gap lies inside a registered (and still fresh) outage.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            gap_start: Open time of the first missing bar
+            gap_end: Open time of the next bar present in the data
+            max_age: Treat confirmations older than this as stale
+
+        Returns:
+            True if a registered outage covers [gap_start, gap_end)
+        """
+        return any(
+            unfillable_gap.covers(gap_start, gap_end)
+            for unfillable_gap in self.find_unfillable_gaps(symbol, timeframe, max_age=max_age)
+        )
+
+    def remove_unfillable_gap(
+        self,
+        symbol: str,
+        timeframe: str,
+        gap_start: Union[str, datetime],
+        gap_end: Union[str, datetime],
+    ) -> None:
+        """Drop a registered gap (e.g., after revalidation found data for it)."""
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                DELETE FROM unfillable_gaps
+                WHERE symbol = ? AND timeframe = ? AND gap_start = ? AND gap_end = ?
+                """,
+                (
+                    symbol,
+                    timeframe,
+                    _format_bound(gap_start, end_of_day=False),
+                    _format_bound(gap_end, end_of_day=False),
+                ),
+            )
+
+    def find(
+        self,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        format: Optional[str] = None,
+        symbols: Optional[List[str]] = None,
+    ) -> List[DatasetRecord]:
+        """
+        Find cataloged datasets, newest range end first within each symbol/timeframe.
+
+        Args:
+            symbol: Restrict to one symbol
+            timeframe: Restrict to one timeframe
+            format: Restrict to one file format ("csv", "parquet", "arrow")
+            symbols: Restrict to a list of symbols
+
+        Returns:
+            List of DatasetRecord whose files still exist
+        """
+        self._reconcile_if_changed()
+
+        clauses = []
+        params: List[Any] = []
+        if symbol is not None:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if symbols:
+            clauses.append(f"symbol IN ({', '.join('?' for _ in symbols)})")
+            params.extend(symbols)
+        if timeframe is not None:
+            clauses.append("timeframe = ?")
+            params.append(timeframe)
+        if format is not None:
+            clauses.append("format = ?")
+            params.append(format)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM datasets {where} "
+                "ORDER BY symbol, timeframe, end_time DESC",
+                params,
+            ).fetchall()
+
+        records = [self._row_to_record(row) for row in rows]
+        stale = [record for record in records if not record.path.exists()]
+        if stale:
+            with self._transaction() as conn:
+                conn.executemany(
+                    "DELETE FROM datasets WHERE filename = ?",
+                    [(record.path.name,) for record in stale],
+                )
+        return [record for record in records if record.path.exists()]
+
+    def find_missing(
+        self,
+        symbols: List[str],
+        timeframes: List[str],
+        start: Union[str, datetime],
+        end: Union[str, datetime],
+    ) -> List[Dict[str, Any]]:
+        """
+        Report which requested symbol/timeframe ranges are not covered by any dataset.
+
+        Coverage is the span of cataloged ranges per symbol/timeframe; missing
+        head and tail ranges are reported, interior bar gaps are left to gap
+        detection. A dataset covers the requested end when its last bar's
+        interval reaches it.
+
+        Args:
+            symbols: Requested symbols
+            timeframes: Requested timeframes
+            start: Requested range start (date or datetime)
+            end: Requested range end (date or datetime, inclusive)
+
+        Returns:
+            List of dicts with symbol, timeframe, missing_start, missing_end and reason
+            ("not_collected", "starts_late" or "ends_early")
+        """
+        start_str = _format_bound(start, end_of_day=False)
+        end_str = _format_bound(end, end_of_day=True)
+        self._reconcile_if_changed()
+
+        with self._transaction() as conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS requested (symbol TEXT, timeframe TEXT)")
+            conn.execute("DELETE FROM requested")
+            conn.executemany(
+                "INSERT INTO requested VALUES (?, ?)",
+                [(symbol, timeframe) for symbol in symbols for timeframe in timeframes],
+            )
+            rows = conn.execute(
+                """
+                SELECT r.symbol, r.timeframe, MIN(d.start_time), MAX(d.end_time)
+                FROM requested r
+                LEFT JOIN datasets d
+                    ON d.symbol = r.symbol AND d.timeframe = r.timeframe
+                GROUP BY r.symbol, r.timeframe
+                ORDER BY r.symbol, r.timeframe
+                """
+            ).fetchall()
+
+        missing = []
+        for symbol, timeframe, covered_start, covered_end in rows:
+            if covered_start is None or covered_end is None:
+                missing.append(
+                    {
+                        "symbol": symbol,
+                        "timeframe": timeframe,
+                        "missing_start": start_str,
+                        "missing_end": end_str,
+                        "reason": "not_collected",
+                    }
+                )
+                continue
+            if covered_start > start_str:
+                missing.append(
+                    {
+                        "symbol": symbol,
+                        "timeframe": timeframe,
+                        "missing_start": start_str,
+                        "missing_end": covered_start,
+                        "reason": "starts_late",
+                    }
+                )
+            last_bar_close = datetime.strptime(covered_end, "%Y-%m-%d %H:%M:%S") + (
+                TIMEFRAME_INTERVALS.get(timeframe, timedelta(0)) - timedelta(seconds=1)
+            )
+            if last_bar_close.strftime("%Y-%m-%d %H:%M:%S") < end_str:
+                missing.append(
+                    {
+                        "symbol": symbol,
+                        "timeframe": timeframe,
+                        "missing_start": covered_end,
+                        "missing_end": end_str,
+                        "reason": "ends_early",
+                    }
+                )
+        return missing
+
+    def rebuild(self) -> int:
+        """
+        Re-index all dataset files in the directory from scratch.
+
+        Uses each file's metadata JSON sidecar for the exact range, row count and
+        data hash when present; otherwise the day-level range from the filename.
+
+        Returns:
+            Number of datasets indexed
+        """
+        directory_mtime_ns = self._directory_mtime_ns()
+        entries = []
+        for candidate in sorted(self.directory.iterdir()):
+            filename_fields = self._parse_candidate(candidate.name)
+            if filename_fields is None or not candidate.is_file():
+                continue
+            entries.append(self._index_entry(candidate, filename_fields, use_sidecar=True))
+
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM datasets")
+            conn.executemany(_UPSERT_DATASET, entries)
+            self._store_directory_mtime(conn, directory_mtime_ns)
+
+        self.logger.info(f"📚 Indexed {len(entries)} datasets in {self.catalog_path.name}")
+        return len(entries)
+
+    def reconcile(self) -> int:
+        """
+        Bring the catalog in line with the files currently in the directory.
+
+        Indexes dataset files the catalog does not know (e.g., copied in or written
+        by older versions), re-indexes files whose size changed or that were
+        modified after their entry was recorded, and drops entries whose file is
+        gone. Unchanged entries, including their validation results, are kept.
+
+        Lookups call this only when the directory mtime changed; files edited in
+        place do not change it, so call reconcile() directly to pick those up.
+
+        Returns:
+            Number of datasets (re-)indexed
+        """
+        # Taken before scanning, so changes made during the scan trigger the next one
+        directory_mtime_ns = self._directory_mtime_ns()
+        with self._transaction() as conn:
+            known = {
+                filename: (file_size, updated_at)
+                for filename, file_size, updated_at in conn.execute(
+                    "SELECT filename, file_size, updated_at FROM datasets"
+                )
+            }
+
+        entries = []
+        present = set()
+        for candidate in sorted(self.directory.iterdir()):
+            # Entries recorded by writers under non-standard names stay while their file does
+            present.add(candidate.name)
+            if candidate.name in known and _parse_dataset_filename(candidate.name) is None:
+                continue
+            filename_fields = self._parse_candidate(candidate.name)
+            if filename_fields is None:
+                continue
+            try:
+                stat = candidate.stat()
+            except OSError:
+                continue
+            if not candidate.is_file():
+                continue
+
+            if candidate.name in known:
+                file_size, updated_at = known[candidate.name]
+                modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+                if file_size == stat.st_size and (
+                    updated_at is not None and modified <= datetime.fromisoformat(updated_at)
+                ):
+                    continue
+
+            # A sidecar written before the data file changed describes the old contents
+            metadata_path = candidate.with_suffix(".metadata.json")
+            use_sidecar = metadata_path.exists() and metadata_path.stat().st_mtime >= stat.st_mtime
+            entries.append(self._index_entry(candidate, filename_fields, use_sidecar))
+
+        removed = [(filename,) for filename in known if filename not in present]
+        with self._transaction() as conn:
+            conn.executemany(_UPSERT_DATASET, entries)
+            conn.executemany("DELETE FROM datasets WHERE filename = ?", removed)
+            self._store_directory_mtime(conn, directory_mtime_ns)
+        if entries or removed:
+            self.logger.info(
+                f"📚 Catalog reconciled: {len(entries)} indexed, {len(removed)} removed"
+            )
+        return len(entries)
+
+    def _reconcile_if_changed(self) -> None:
+        """Reconcile only if files were added, renamed or removed since the last scan."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT value FROM catalog_state WHERE key = 'directory_mtime_ns'"
+            ).fetchone()
+        if row is None or int(row[0]) != self._directory_mtime_ns():
+            self.reconcile()
+
+    def _directory_mtime_ns(self) -> int:
+        return self.directory.stat().st_mtime_ns
+
+    @staticmethod
+    def _store_directory_mtime(conn: sqlite3.Connection, directory_mtime_ns: int) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO catalog_state (key, value) VALUES ('directory_mtime_ns', ?)",
+            (str(directory_mtime_ns),),
+        )
+
+    def _parse_candidate(self, name: str) -> Optional[Dict[str, Optional[str]]]:
+        """Parse a directory entry name, warning about CSV files that cannot be cataloged."""
+        filename_fields = _parse_dataset_filename(name)
+        if filename_fields is None and _is_csv_candidate(name):
+            self.logger.warning(
+                f"⚠️  Skipping {name}: no symbol/timeframe in filename "
+                "(expected e.g. binance_spot_BTCUSDT-1h_..._v2.10.0.csv or BTCUSDT_1h.csv)"
+            )
+        return filename_fields
+
+    def _index_entry(
+        self, candidate: Path, filename_fields: Dict[str, Optional[str]], use_sidecar: bool
+    ) -> tuple:
+        """Build a datasets row for a file from its name and optional metadata sidecar."""
+        start_time = filename_fields["start_time"]
+        end_time = filename_fields["end_time"]
+        row_count = None
+        content_hash = None
+
+        metadata_path = candidate.with_suffix(".metadata.json")
+        if use_sidecar and metadata_path.exists():
+            try:
+                with open(metadata_path, "r") as f:
+                    metadata = json.load(f)
+                start_time = metadata.get("date_range", {}).get("start") or start_time
+                end_time = metadata.get("date_range", {}).get("end") or end_time
+                row_count = metadata.get("actual_bars")
+                content_hash = metadata.get("data_integrity", {}).get("data_hash")
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"⚠️  Unreadable metadata {metadata_path.name}: {e}")
+
+        return (
+            candidate.name,
+            filename_fields["symbol"],
+            filename_fields["timeframe"],
+            start_time,
+            end_time,
+            row_count,
+            content_hash,
+            filename_fields["extension"],
+            candidate.stat().st_size,
+            datetime.now(timezone.utc).isoformat(),
+        )
+
+
+def _parse_dataset_filename(name: str) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Extract dataset fields from a filename, or None if it is not a dataset file.
+
+    Standard output filenames give symbol, timeframe and day-level range. Other
+    CSV files are accepted when they carry a "-1h_"/"_1h." style timeframe token,
+    with the symbol taken from the leading name token. Hidden files, temp files,
+    backups and CSV files without a timeframe token are not datasets.
+    """
+    filename_match = OUTPUT_FILENAME_PATTERN.match(name)
+    if filename_match:
+        return {
+            "symbol": filename_match.group("symbol"),
+            "timeframe": filename_match.group("timeframe"),
+            "start_time": _filename_date(filename_match.group("start")),
+            "end_time": _filename_date(filename_match.group("end")),
+            "extension": filename_match.group("extension"),
+        }
+
+    if not _is_csv_candidate(name):
+        return None
+
+    stem = name[: -len(".csv")]
+    timeframe_match = LOOSE_CSV_TIMEFRAME_PATTERN.search(stem)
+    symbol = re.split(r"[-_.]", stem.replace("binance_spot_", "", 1), maxsplit=1)[0].upper()
+    if timeframe_match is None or not symbol:
+        return None
+    return {
+        "symbol": symbol,
+        "timeframe": timeframe_match.group("timeframe"),
+        "start_time": None,
+        "end_time": None,
+        "extension": "csv",
+    }
+
+
+def _is_csv_candidate(name: str) -> bool:
+    """Check whether a name is a visible CSV file other than a backup."""
+    return not name.startswith(".") and name.endswith(".csv") and ".backup_" not in name
+
+
+def _filename_date(value: str) -> str:
+    """Convert a YYYYMMDD filename date to the catalog timestamp format."""
+    return datetime.strptime(value, "%Y%m%d").strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _format_bound(value: Union[str, datetime], end_of_day: bool) -> str:
+    """Normalize a range bound to the catalog timestamp format."""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if len(value.strip()) == 10:
+        return f"{value.strip()} {'23:59:59' if end_of_day else '00:00:00'}"
+    return datetime.fromisoformat(value.strip()).strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,285 @@
+"""
+Columnar storage with calendar-aligned row groups and time-range pushdown.
+
+Parquet files are written sorted by ``date`` with one row group per calendar month
+(or per day for sub-3-minute data), so the min/max statistics pyarrow records for
+each row group describe a tight, non-overlapping time window. Range reads consult
+those statistics first and only decode the row groups and columns that are needed.
+
+Arrow IPC (Feather v2) files are written uncompressed by default so they can be
+memory-mapped and read zero-copy; many processes loading the same file then share
+one copy in the OS page cache.
+"""
+
+from datetime import timedelta
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DATE_COLUMN = "date"
+
+# Arrow IPC buffer compression codecs; None keeps buffers mappable without decoding
+ARROW_COMPRESSIONS = (None, "lz4")
+
+# Below this bar interval a calendar month holds too many rows for one row group
+DAILY_ROW_GROUP_THRESHOLD = timedelta(minutes=3)
+
+
+def _infer_row_group_period(dates: pd.Series) -> str:
+    """Pick "D" (daily) or "M" (monthly) row groups from the typical bar spacing."""
+    sample = dates.iloc[:1000]
+    if len(sample) < 2:
+        return "M"
+
+    median_interval = sample.diff().dropna().median()
+    if pd.notna(median_interval) and median_interval < DAILY_ROW_GROUP_THRESHOLD:
+        return "D"
+    return "M"
+
+
+def _to_timestamp(
+    value: Union[str, pd.Timestamp, None], end_of_day: bool
+) -> Optional[pd.Timestamp]:
+    """Normalize a range bound; a date-only string as end covers that whole day."""
+    if value is None:
+        return None
+
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    if end_of_day and isinstance(value, str) and len(value.strip()) == 10:
+        timestamp = timestamp + pd.Timedelta(days=1) - pd.Timedelta(microseconds=1)
+    return timestamp
+
+
+def write_partitioned_parquet(
+    df: pd.DataFrame,
+    path: Union[str, Path],
+    row_group_period: Optional[str] = None,
+    compression: str = "snappy",
+) -> None:
+    """Write a DataFrame to Parquet with row groups aligned to calendar periods.
+
+    Rows are sorted by ``date`` and split at every month (or day) boundary, each
+    slice becoming exactly one row group with min/max statistics on ``date``.
+    DataFrames without a ``date`` column are written unchanged.
+
+    Args:
+        df: DataFrame to save
+        path: Output file path (should end with .parquet)
+        row_group_period: "M" for monthly or "D" for daily row groups
+            (default: inferred from bar spacing, daily below 3-minute bars)
+        compression: Parquet compression codec
+
+    Examples:
+        >>> write_partitioned_parquet(df, "btc_1m.parquet")
+        >>> pq.ParquetFile("btc_1m.parquet").metadata.num_row_groups
+        31
+    """
+    if DATE_COLUMN not in df.columns or df.empty:
+        df.to_parquet(path, engine="pyarrow", compression=compression, index=False)
+        return
+
+    dates = pd.to_datetime(df[DATE_COLUMN])
+    if not dates.is_monotonic_increasing:
+        order = np.argsort(dates.to_numpy(), kind="stable")
+        df = df.iloc[order]
+        dates = dates.iloc[order]
+
+    period = row_group_period or _infer_row_group_period(dates)
+    period_codes = dates.dt.to_period(period).to_numpy()
+    boundaries = np.flatnonzero(period_codes[1:] != period_codes[:-1]) + 1
+    slice_starts = np.concatenate(([0], boundaries))
+    slice_ends = np.concatenate((boundaries, [len(df)]))
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(
+        path, table.schema, compression=compression, write_statistics=True
+    ) as writer:
+        for slice_start, slice_end in zip(slice_starts, slice_ends):
+            row_count = int(slice_end - slice_start)
+            writer.write_table(table.slice(slice_start, row_count), row_group_size=row_count)
+
+
+def _select_row_groups(
+    parquet_file: pq.ParquetFile,
+    start: Optional[pd.Timestamp],
+    end: Optional[pd.Timestamp],
+) -> List[int]:
+    """Return indices of row groups whose ``date`` statistics overlap [start, end]."""
+    metadata = parquet_file.metadata
+    date_index = parquet_file.schema_arrow.get_field_index(DATE_COLUMN)
+
+    selected = []
+    for row_group_index in range(metadata.num_row_groups):
+        statistics = metadata.row_group(row_group_index).column(date_index).statistics
+        if statistics is None or not statistics.has_min_max:
+            # No statistics - the row group has to be read to be filtered
+            selected.append(row_group_index)
+            continue
+
+        if start is not None and pd.Timestamp(statistics.max) < start:
+            continue
+        if end is not None and pd.Timestamp(statistics.min) > end:
+            continue
+        selected.append(row_group_index)
+
+    return selected
+
+
+def read_parquet_range(
+    path: Union[str, Path],
+    start: Union[str, pd.Timestamp, None] = None,
+    end: Union[str, pd.Timestamp, None] = None,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Read only the rows in [start, end] and the requested columns from a Parquet file.
+
+    Row groups are pruned with their ``date`` min/max statistics before any data is
+    decoded, so the I/O cost is proportional to the requested window rather than
+    to the file size.
+
+    Args:
+        path: Parquet file path
+        start: Inclusive start (e.g., "2024-01-01" or "2024-01-01 12:00:00")
+        end: Inclusive end; a date-only string covers the whole day
+        columns: Columns to return (default: all)
+
+    Returns:
+        DataFrame with matching rows and columns
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If a range is requested on a file without a date column
+
+    Examples:
+        >>> week = read_parquet_range(
+        ...     "btc_1m.parquet", start="2024-03-04", end="2024-03-10", columns=["date", "close"]
+        ... )
+    """
+    start_ts = _to_timestamp(start, end_of_day=False)
+    end_ts = _to_timestamp(end, end_of_day=True)
+    ranged = start_ts is not None or end_ts is not None
+
+    parquet_file = pq.ParquetFile(path)
+    if not ranged:
+        return parquet_file.read(columns=columns).to_pandas()
+
+    if parquet_file.schema_arrow.get_field_index(DATE_COLUMN) < 0:
+        raise ValueError(f"Cannot filter by time range: '{DATE_COLUMN}' column not found in {path}")
+
+    read_columns = columns
+    if columns is not None and DATE_COLUMN not in columns:
+        read_columns = [DATE_COLUMN] + list(columns)
+
+    row_groups = _select_row_groups(parquet_file, start_ts, end_ts)
+    if row_groups:
+        table = parquet_file.read_row_groups(row_groups, columns=read_columns)
+    else:
+        table = parquet_file.schema_arrow.empty_table()
+        if read_columns is not None:
+            table = table.select(read_columns)
+
+    df = table.to_pandas()
+    dates = df[DATE_COLUMN]
+    mask = np.ones(len(df), dtype=bool)
+    if start_ts is not None:
+        mask &= (dates >= start_ts).to_numpy()
+    if end_ts is not None:
+        mask &= (dates <= end_ts).to_numpy()
+
+    df = df.loc[mask].reset_index(drop=True)
+    if columns is not None:
+        df = df[list(columns)]
+    return df
+
+
+def write_arrow_ipc(
+    df: pd.DataFrame,
+    path: Union[str, Path],
+    compression: Optional[str] = None,
+) -> None:
+    """Write a DataFrame to an Arrow IPC (Feather v2) file.
+
+    Uncompressed files can be memory-mapped and read without copying; "lz4" trades
+    a fast decode on load for smaller files.
+
+    Args:
+        df: DataFrame to save
+        path: Output file path (should end with .arrow)
+        compression: None (uncompressed, zero-copy loads) or "lz4"
+
+    Raises:
+        ValueError: If compression is not supported
+
+    Examples:
+        >>> write_arrow_ipc(df, "btc_1m.arrow")
+        >>> write_arrow_ipc(df, "btc_1m_small.arrow", compression="lz4")
+    """
+    if compression not in ARROW_COMPRESSIONS:
+        raise ValueError(
+            f"Arrow compression must be one of {ARROW_COMPRESSIONS}, got '{compression}'"
+        )
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+
+def read_arrow_ipc_table(
+    path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    memory_map: bool = True,
+) -> pa.Table:
+    """Open an Arrow IPC file as a pyarrow Table, memory-mapped by default.
+
+    With memory_map=True and an uncompressed file, the returned table references
+    the mapped pages directly - no bytes are read until columns are accessed.
+
+    Args:
+        path: Arrow IPC file path
+        columns: Columns to select (default: all)
+        memory_map: Map the file instead of reading it into process memory
+
+    Returns:
+        pyarrow Table backed by the mapped file
+    """
+    if memory_map:
+        # The mapping stays alive as long as the table's buffers reference it
+        table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+    else:
+        with pa.OSFile(str(path), "rb") as source:
+            table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    return table
+
+
+def read_arrow_ipc(
+    path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    memory_map: bool = True,
+) -> pd.DataFrame:
+    """Load an Arrow IPC file into a DataFrame via a memory map.
+
+    Args:
+        path: Arrow IPC file path
+        columns: Columns to load (default: all)
+        memory_map: Map the file instead of reading it into process memory
+
+    Returns:
+        DataFrame with original structure and data types
+
+    Examples:
+        >>> df = read_arrow_ipc("btc_1m.arrow", columns=["date", "close"])
+    """
+    table = read_arrow_ipc_table(path, columns=columns, memory_map=memory_map)
+    # split_blocks avoids consolidating columns into new 2D blocks, keeping numeric
+    # columns as views over the mapped buffers where the dtype allows it
+    return table.to_pandas(split_blocks=True)
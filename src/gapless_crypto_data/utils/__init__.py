@@ -1,5 +1,6 @@
 """Utility modules for gapless-crypto-data."""
 
+from .data_hashing import StreamingDataHasher, merkle_root
 from .error_handling import (
     DataCollectionError,
     FileOperationError,
@@ -13,6 +14,7 @@ from .error_handling import (
     safe_operation,
     validate_file_path,
 )
+from .timeframes import TIMEFRAME_INTERVALS, get_timeframe_interval
 
 __all__ = [
     "GaplessCryptoError",
@@ -26,4 +28,8 @@ __all__ = [
     "validate_file_path",
     "format_user_error",
     "format_user_warning",
+    "TIMEFRAME_INTERVALS",
+    "get_timeframe_interval",
+    "StreamingDataHasher",
+    "merkle_root",
 ]
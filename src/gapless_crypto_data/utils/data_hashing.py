@@ -0,0 +1,128 @@
+"""
+Streaming data hashes for collected datasets.
+
+Rows are hashed in their canonical text form - one line per bar with values joined
+by commas, exactly as the CSV data section is written - without ever materializing
+the whole dataset as one string. Alongside the whole-dataset digest, one SHA-256
+leaf per calendar month is kept and combined into a Merkle root, so a single month
+can be re-verified, or an appended month re-hashed, without touching the rest.
+"""
+
+import hashlib
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# Rows rendered and hashed per batch; bounds the transient string memory
+HASH_CHUNK_ROWS = 50_000
+
+
+def render_canonical_lines(rows: Iterable[Sequence]) -> List[str]:
+    """Render rows to canonical line text (values joined by commas, no newline)."""
+    return [",".join(map(str, row)) for row in rows]
+
+
+def merkle_root(leaf_hashes: List[str]) -> str:
+    """
+    Combine hex leaf digests into a SHA-256 Merkle root.
+
+    Pairs are hashed left to right over their raw digest bytes; an odd node at the
+    end of a level is promoted unchanged.
+
+    Args:
+        leaf_hashes: Hex digests in chronological order
+
+    Returns:
+        Hex digest of the root (SHA-256 of empty input if there are no leaves)
+    """
+    if not leaf_hashes:
+        return hashlib.sha256(b"").hexdigest()
+
+    level = [bytes.fromhex(leaf) for leaf in leaf_hashes]
+    while len(level) > 1:
+        next_level = [
+            hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+    return level[0].hex()
+
+
+class StreamingDataHasher:
+    """
+    Incremental SHA-256 over canonical row lines with per-month Merkle leaves.
+
+    The dataset digest equals sha256("\\n".join(lines)) for all lines fed, so it
+    matches a hash of the full joined string while only one chunk is held in memory.
+
+    Examples:
+        >>> hasher = StreamingDataHasher()
+        >>> hasher.update_rows(rows)
+        >>> hasher.hexdigest(), hasher.merkle_root()
+    """
+
+    def __init__(self) -> None:
+        self._digest = hashlib.sha256()
+        self._has_lines = False
+        self._month_digests: Dict[str, "hashlib._Hash"] = {}
+
+    def update_rows(self, rows: Sequence[Sequence]) -> None:
+        """Render and hash rows in bounded-size chunks."""
+        for chunk_start in range(0, len(rows), HASH_CHUNK_ROWS):
+            self.update_lines(
+                render_canonical_lines(rows[chunk_start : chunk_start + HASH_CHUNK_ROWS])
+            )
+
+    def update_lines(self, lines: List[str]) -> None:
+        """
+        Hash already-rendered canonical lines (chronological, without newlines).
+
+        Args:
+            lines: Canonical line text; the first 7 characters ("YYYY-MM") of each
+                line select its month leaf
+        """
+        if not lines:
+            return
+
+        segment_start = 0
+        for line_index in range(1, len(lines) + 1):
+            if line_index < len(lines) and lines[line_index][:7] == lines[segment_start][:7]:
+                continue
+            self._update_segment(lines[segment_start][:7], lines[segment_start:line_index])
+            segment_start = line_index
+
+    def _update_segment(self, month: str, lines: List[str]) -> None:
+        segment = "\n".join(lines).encode()
+
+        if self._has_lines:
+            self._digest.update(b"\n")
+        self._digest.update(segment)
+        self._has_lines = True
+
+        month_digest = self._month_digests.get(month)
+        if month_digest is None:
+            month_digest = self._month_digests[month] = hashlib.sha256()
+        else:
+            month_digest.update(b"\n")
+        month_digest.update(segment)
+
+    def hexdigest(self) -> str:
+        """Digest of every line fed so far, joined by newlines."""
+        return self._digest.hexdigest()
+
+    def month_hashes(self) -> Dict[str, str]:
+        """Per-month leaf digests keyed by "YYYY-MM"."""
+        return {month: digest.hexdigest() for month, digest in self._month_digests.items()}
+
+    def merkle_root(self, existing_month_hashes: Optional[Dict[str, str]] = None) -> str:
+        """
+        Merkle root over month leaves, optionally merged into previously stored leaves.
+
+        Args:
+            existing_month_hashes: Stored leaves; months hashed here replace them
+
+        Returns:
+            Hex Merkle root over all months in chronological order
+        """
+        leaves = dict(existing_month_hashes or {})
+        leaves.update(self.month_hashes())
+        return merkle_root([leaves[month] for month in sorted(leaves)])
@@ -0,0 +1,49 @@
+"""
+Timeframe interval definitions shared across collectors, gap filling and validation.
+
+Binance kline intervals are fixed-width except for "1mo", which is calendar based and
+therefore has no single timedelta representation.
+"""
+
+from datetime import timedelta
+from typing import Dict
+
+TIMEFRAME_INTERVALS: Dict[str, timedelta] = {
+    "1s": timedelta(seconds=1),
+    "1m": timedelta(minutes=1),
+    "3m": timedelta(minutes=3),
+    "5m": timedelta(minutes=5),
+    "15m": timedelta(minutes=15),
+    "30m": timedelta(minutes=30),
+    "1h": timedelta(hours=1),
+    "2h": timedelta(hours=2),
+    "4h": timedelta(hours=4),
+    "6h": timedelta(hours=6),
+    "8h": timedelta(hours=8),
+    "12h": timedelta(hours=12),
+    "1d": timedelta(days=1),
+    "3d": timedelta(days=3),
+    "1w": timedelta(weeks=1),
+}
+
+
+def get_timeframe_interval(timeframe: str) -> timedelta:
+    """
+    Get the fixed bar interval for a timeframe.
+
+    Args:
+        timeframe: Binance timeframe string (e.g., "1m", "1h", "1d")
+
+    Returns:
+        Bar interval as timedelta
+
+    Raises:
+        ValueError: If timeframe is unknown or not fixed-width (e.g., "1mo")
+    """
+    try:
+        return TIMEFRAME_INTERVALS[timeframe]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported timeframe '{timeframe}'. "
+            f"Fixed-width timeframes: {', '.join(TIMEFRAME_INTERVALS)}"
+        )
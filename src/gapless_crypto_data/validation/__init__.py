@@ -0,0 +1,24 @@
+"""
+Validation layer for gapless-crypto-data.
+
+Provides the fused OHLCV validation kernel behind BinancePublicDataCollector's
+CSV validation report, a chunked validator with the same report for files
+larger than memory, the cache that reuses reports of unchanged files, and a
+consistency check between two timeframes of the same symbol.
+"""
+
+from .cache import VALIDATOR_VERSION
+from .cross_timeframe import CrossTimeframeValidator
+from .kernel import AnomalySketches, OHLCVValidationKernel
+from .sketches import HeavyHitterSketch, KLLSketch
+from .streaming import StreamingOHLCVValidator
+
+__all__ = [
+    "OHLCVValidationKernel",
+    "StreamingOHLCVValidator",
+    "CrossTimeframeValidator",
+    "AnomalySketches",
+    "KLLSketch",
+    "HeavyHitterSketch",
+    "VALIDATOR_VERSION",
+]
@@ -0,0 +1,122 @@
+"""
+Validation result cache stored in the dataset metadata JSON.
+
+``update_metadata_with_validation`` saves each report under ``"validation"`` in
+the ``.metadata.json`` sidecar of a CSV file. Reports built by ``validate_csv_file``
+carry a ``cache_key`` recording what was validated: file size, modification time,
+SHA-256 of the file bytes, the validator version and the validation parameters
+(timeframe and registered exchange outages). A later validation of the same file
+reuses the stored report when the key still matches:
+
+- same size and modification time: reused after a ``stat`` call, no reads
+- same size, different modification time (copied or touched file): the file is
+  hashed and the report is reused if the bytes are unchanged
+
+A modification time within RACY_WINDOW_NS of when the key was recorded is not
+trusted, since a write in the same clock tick would leave it unchanged; such
+files are always hashed.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+# Bump whenever a change to the validators changes their reports
+VALIDATOR_VERSION = "3"
+
+RACY_WINDOW_NS = 2_000_000_000
+HASH_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """SHA-256 of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _outage_fingerprint(unfillable_gaps: List) -> str:
+    bounds = sorted(f"{gap.gap_start}/{gap.gap_end}" for gap in unfillable_gaps)
+    return hashlib.sha256("\n".join(bounds).encode()).hexdigest()
+
+
+def validation_cache_key(
+    csv_filepath: Union[str, Path],
+    expected_timeframe: Optional[str],
+    unfillable_gaps: Optional[List] = None,
+) -> Dict[str, Any]:
+    """
+    Cache key for validating a file in its current state.
+
+    Args:
+        csv_filepath: CSV file about to be validated
+        expected_timeframe: Timeframe the file is validated against
+        unfillable_gaps: Registered exchange outages used by the validation
+
+    Returns:
+        JSON-serializable key to store with the validation results
+    """
+    stat = Path(csv_filepath).stat()
+    return {
+        "validator_version": VALIDATOR_VERSION,
+        "expected_timeframe": expected_timeframe,
+        "outages": _outage_fingerprint(unfillable_gaps or []),
+        "file_size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "content_sha256": file_sha256(csv_filepath),
+        "recorded_ns": time.time_ns(),
+    }
+
+
+def load_cached_validation(
+    csv_filepath: Union[str, Path],
+    expected_timeframe: Optional[str],
+    unfillable_gaps: Optional[List] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Stored validation results for a file, if they still describe it.
+
+    Args:
+        csv_filepath: CSV file to validate
+        expected_timeframe: Timeframe the file is validated against
+        unfillable_gaps: Registered exchange outages the validation would use
+
+    Returns:
+        The stored results (with a refreshed cache_key if the file had to be
+        re-hashed), or None if the file must be validated
+    """
+    csv_filepath = Path(csv_filepath)
+    metadata_filepath = csv_filepath.with_suffix(".metadata.json")
+    try:
+        with open(metadata_filepath, "r") as f:
+            cached = json.load(f).get("validation")
+        stat = csv_filepath.stat()
+    except (OSError, ValueError, AttributeError):
+        return None
+
+    key = cached.get("cache_key") if isinstance(cached, dict) else None
+    if not isinstance(key, dict):
+        return None
+
+    if (
+        key.get("validator_version") != VALIDATOR_VERSION
+        or key.get("expected_timeframe") != expected_timeframe
+        or key.get("outages") != _outage_fingerprint(unfillable_gaps or [])
+        or key.get("file_size") != stat.st_size
+    ):
+        return None
+
+    mtime_trusted = key.get("mtime_ns", 0) + RACY_WINDOW_NS < key.get("recorded_ns", 0)
+    if stat.st_mtime_ns == key.get("mtime_ns") and mtime_trusted:
+        return cached
+
+    if file_sha256(csv_filepath) != key.get("content_sha256"):
+        return None
+
+    # Same bytes under a new timestamp: remember it so the next lookup is stat-only
+    cached["cache_key"] = dict(key, mtime_ns=stat.st_mtime_ns, recorded_ns=time.time_ns())
+    return cached
@@ -0,0 +1,360 @@
+"""
+Consistency check between two timeframes of the same symbol.
+
+Binance builds every kline from the same trades, so a coarse bar must equal the
+aggregate of the finer bars inside it: first open, highest high, lowest low, last
+close and close time, and summed volume, quote volume, trade count and taker-buy
+volumes. ``CrossTimeframeValidator`` streams the finer file in chunks, aggregates
+each chunk to the coarser timeframe with ``reduceat`` over bucket boundaries and
+compares the result with the coarser file read alongside it. Only complete buckets
+are compared; the rows of the last bucket of a chunk are carried into the next
+one, so memory is bounded by the chunk size even for 1s against 1d.
+
+Prices, trade counts and close times must match exactly. Summed volumes are
+compared with a relative tolerance of SUM_RTOL, since adding float64 values in a
+different order than the exchange did can change the last bits.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils import get_timeframe_interval
+from .streaming import DEFAULT_CHUNK_ROWS
+
+# Columns compared and how fine bars combine into a coarse bar
+FIRST_COLUMNS = ["open"]
+LAST_COLUMNS = ["close"]
+MAX_COLUMNS = ["high"]
+MIN_COLUMNS = ["low"]
+SUM_COLUMNS = [
+    "volume",
+    "quote_asset_volume",
+    "taker_buy_base_asset_volume",
+    "taker_buy_quote_asset_volume",
+]
+COUNT_COLUMNS = ["number_of_trades"]
+
+SUM_RTOL = 1e-9
+SUM_ATOL = 1e-8  # Half the smallest quantity step (8 decimals)
+
+# Discrepancies listed in detail; all of them are counted
+MAX_REPORTED_DISCREPANCIES = 1000
+
+
+class CrossTimeframeValidator:
+    """
+    Check that a finer dataset aggregates exactly to a coarser one.
+
+    Examples:
+        >>> validator = CrossTimeframeValidator("1m", "1h")
+        >>> result = validator.validate(minute_csv, hour_csv)
+        >>> result["incomplete_bars"], result["mismatched_bars"]
+        (0, 0)
+    """
+
+    def __init__(
+        self, fine_timeframe: str, coarse_timeframe: str, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ):
+        """
+        Initialize the validator.
+
+        Args:
+            fine_timeframe: Timeframe of the finer dataset (e.g., "1s", "1m")
+            coarse_timeframe: Timeframe of the coarser dataset (up to "1d")
+            chunk_rows: Rows of the finer file read per chunk
+
+        Raises:
+            ValueError: If a timeframe is unsupported or the coarse interval is not
+                a whole multiple of the fine interval
+        """
+        fine_interval = get_timeframe_interval(fine_timeframe)
+        coarse_interval = get_timeframe_interval(coarse_timeframe)
+        if coarse_interval <= fine_interval or coarse_interval % fine_interval:
+            raise ValueError(
+                f"Cannot aggregate {fine_timeframe} bars to {coarse_timeframe}: "
+                "the coarse interval must be a whole multiple of the fine interval"
+            )
+
+        self.fine_timeframe = fine_timeframe
+        self.coarse_timeframe = coarse_timeframe
+        self.chunk_rows = chunk_rows
+        self.fine_ns = int(pd.Timedelta(fine_interval).value)
+        self.coarse_ns = int(pd.Timedelta(coarse_interval).value)
+        self.bars_per_bucket = self.coarse_ns // self.fine_ns
+
+    def validate(self, fine_csv: Union[str, Path], coarse_csv: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Compare two CSV files of the same symbol.
+
+        Only coarse bars fully inside the finer file's date range are compared.
+
+        Args:
+            fine_csv: CSV file of the finer timeframe
+            coarse_csv: CSV file of the coarser timeframe
+
+        Returns:
+            dict: Status, errors, counts of compared, incomplete, missing and
+            mismatched bars, mismatches per column and discrepancy details
+        """
+        result = {
+            "fine_timeframe": self.fine_timeframe,
+            "coarse_timeframe": self.coarse_timeframe,
+            "bars_compared": 0,
+            "incomplete_bars": 0,
+            "missing_in_fine": 0,
+            "missing_in_coarse": 0,
+            "mismatched_bars": 0,
+            "column_mismatches": {},
+            "discrepancies": [],
+            "errors": [],
+        }
+
+        fine_chunks = pd.read_csv(fine_csv, comment="#", chunksize=self.chunk_rows)
+        coarse_chunks = pd.read_csv(coarse_csv, comment="#", chunksize=self.chunk_rows)
+        with fine_chunks, coarse_chunks:
+            self._compare_streams(
+                self._aggregate_chunks(fine_chunks, result), coarse_chunks, result
+            )
+
+        errors = result["errors"]
+        if result["incomplete_bars"]:
+            errors.append(
+                f"{result['incomplete_bars']} {self.coarse_timeframe} bars have missing "
+                f"{self.fine_timeframe} bars"
+            )
+        if result["missing_in_fine"] or result["missing_in_coarse"]:
+            errors.append(
+                f"Bars missing from one timeframe: {result['missing_in_fine']} only in "
+                f"{self.coarse_timeframe}, {result['missing_in_coarse']} only in "
+                f"{self.fine_timeframe}"
+            )
+        for column, count in result["column_mismatches"].items():
+            errors.append(f"{count} bars where aggregated {column} does not match")
+        result["status"] = "VALID" if not errors else "INVALID"
+        return result
+
+    def _aggregate_chunks(
+        self, fine_chunks: Iterator[pd.DataFrame], result: Dict[str, Any]
+    ) -> Iterator[Tuple[pd.DataFrame, bool]]:
+        """Yield (coarse bars aggregated from the finer file, is-last-bucket) pairs."""
+        carried = None
+        for chunk in fine_chunks:
+            if carried is not None:
+                chunk = pd.concat([carried, chunk], ignore_index=True)
+            if not len(chunk):
+                continue
+            open_ns = _open_time_ns(chunk)
+            if np.any(np.diff(open_ns) <= 0):
+                result["errors"].append(
+                    f"{self.fine_timeframe} timestamps are not strictly increasing; "
+                    "cannot aggregate"
+                )
+                return
+
+            buckets = open_ns - open_ns % self.coarse_ns
+            # The last bucket may continue in the next chunk
+            last_bucket_start = int(np.searchsorted(buckets, buckets[-1]))
+            carried = chunk.iloc[last_bucket_start:]
+            if last_bucket_start:
+                yield (
+                    self._aggregate(chunk.iloc[:last_bucket_start], open_ns[:last_bucket_start]),
+                    False,
+                )
+
+        if carried is not None and len(carried):
+            yield self._aggregate(carried, _open_time_ns(carried)), True
+
+    def _aggregate(self, rows: pd.DataFrame, open_ns: np.ndarray) -> pd.DataFrame:
+        """Aggregate sorted fine rows to one row per coarse bucket."""
+        buckets = open_ns - open_ns % self.coarse_ns
+        starts = np.flatnonzero(np.concatenate([[True], buckets[1:] != buckets[:-1]]))
+        ends = np.concatenate([starts[1:], [len(buckets)]])
+
+        aggregated = {
+            "bucket": buckets[starts],
+            "fine_bars": ends - starts,
+            "first_open": open_ns[starts],
+            "last_open": open_ns[ends - 1],
+        }
+        for column in _compared_columns(rows.columns):
+            if column == "close_time":
+                aggregated[column] = rows[column].to_numpy()[ends - 1]
+                continue
+            values = rows[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            if column in FIRST_COLUMNS:
+                aggregated[column] = values[starts]
+            elif column in LAST_COLUMNS:
+                aggregated[column] = values[ends - 1]
+            elif column in MAX_COLUMNS:
+                aggregated[column] = np.maximum.reduceat(values, starts)
+            elif column in MIN_COLUMNS:
+                aggregated[column] = np.minimum.reduceat(values, starts)
+            else:
+                aggregated[column] = np.add.reduceat(values, starts)
+        return pd.DataFrame(aggregated)
+
+    def _compare_streams(
+        self,
+        fine_bars: Iterator[Tuple[pd.DataFrame, bool]],
+        coarse_chunks: Iterator[pd.DataFrame],
+        result: Dict[str, Any],
+    ) -> None:
+        """Merge-join both streams, comparing one aligned partition at a time."""
+        coarse_buffer = pd.DataFrame({"bucket": np.zeros(0, dtype=np.int64)})
+        coarse_exhausted = False
+        coarse_first = coarse_last = range_start = None
+        first_partition = True
+
+        for aggregated, is_last in fine_bars:
+            # The finer file may start after its first bucket opens or end before its last
+            # bucket closes; such edge buckets are skipped. Bars missing inside an edge
+            # bucket still make it incomplete.
+            if first_partition and aggregated["first_open"].iloc[0] > aggregated["bucket"].iloc[0]:
+                aggregated = aggregated.iloc[1:]
+            if (
+                is_last
+                and len(aggregated)
+                and aggregated["last_open"].iloc[-1]
+                < aggregated["bucket"].iloc[-1] + self.coarse_ns - self.fine_ns
+            ):
+                aggregated = aggregated.iloc[:-1]
+            first_partition = False
+            if not len(aggregated):
+                continue
+            if range_start is None:
+                # Coarse bars before the first comparable bucket are outside the overlap
+                range_start = int(aggregated["bucket"].iloc[0])
+
+            # Read the coarser file up to this partition's last bucket
+            partition_end = int(aggregated["bucket"].iloc[-1])
+            while not coarse_exhausted and (
+                not len(coarse_buffer) or coarse_buffer["bucket"].iloc[-1] <= partition_end
+            ):
+                coarse_chunk = next(coarse_chunks, None)
+                if coarse_chunk is None:
+                    coarse_exhausted = True
+                    break
+                coarse_chunk = coarse_chunk.assign(bucket=_open_time_ns(coarse_chunk))
+                if coarse_first is None and len(coarse_chunk):
+                    coarse_first = int(coarse_chunk["bucket"].iloc[0])
+                if len(coarse_chunk):
+                    coarse_last = int(coarse_chunk["bucket"].iloc[-1])
+                coarse_buffer = pd.concat([coarse_buffer, coarse_chunk], ignore_index=True)
+
+            in_partition = coarse_buffer["bucket"] <= partition_end
+            coarse_part = coarse_buffer[in_partition & (coarse_buffer["bucket"] >= range_start)]
+            coarse_buffer = coarse_buffer[~in_partition]
+
+            if coarse_first is None:
+                continue  # Empty coarser file: nothing overlaps
+            # Fine-only buckets outside the coarser file's range are not missing bars
+            covered = aggregated["bucket"] >= coarse_first
+            if coarse_exhausted and not len(coarse_buffer):
+                covered &= aggregated["bucket"] <= coarse_last
+            self._compare_partition(aggregated[covered], coarse_part, result)
+
+    def _compare_partition(
+        self, fine: pd.DataFrame, coarse: pd.DataFrame, result: Dict[str, Any]
+    ) -> None:
+        """Compare aggregated fine bars with coarse bars of the same buckets."""
+        merged = fine.merge(
+            coarse, on="bucket", how="outer", suffixes=("_fine", "_coarse"), indicator=True
+        )
+        for side, counter, missing_from in (
+            ("left_only", "missing_in_coarse", self.coarse_timeframe),
+            ("right_only", "missing_in_fine", self.fine_timeframe),
+        ):
+            missing = merged.loc[merged["_merge"] == side, "bucket"]
+            result[counter] += len(missing)
+            for bucket in missing:
+                self._add_discrepancy(result, {"date": _iso(bucket), "missing_from": missing_from})
+
+        both = merged[merged["_merge"] == "both"]
+        result["bars_compared"] += len(both)
+        incomplete = both["fine_bars"].to_numpy() < self.bars_per_bucket
+        result["incomplete_bars"] += int(np.count_nonzero(incomplete))
+
+        mismatches = {}
+        for column in _compared_columns(fine.columns):
+            if f"{column}_coarse" not in both.columns:
+                continue
+            fine_values, coarse_values = both[f"{column}_fine"], both[f"{column}_coarse"]
+            if column == "close_time":
+                mismatch = (
+                    pd.to_datetime(fine_values).dt.floor("s")
+                    != pd.to_datetime(coarse_values).dt.floor("s")
+                ).to_numpy()
+            elif column in SUM_COLUMNS:
+                mismatch = ~np.isclose(
+                    fine_values.to_numpy(dtype=np.float64),
+                    coarse_values.to_numpy(dtype=np.float64),
+                    rtol=SUM_RTOL,
+                    atol=SUM_ATOL,
+                )
+            else:
+                mismatch = (fine_values != coarse_values).to_numpy()
+            if mismatch.any():
+                mismatches[column] = mismatch
+                result["column_mismatches"][column] = result["column_mismatches"].get(
+                    column, 0
+                ) + int(np.count_nonzero(mismatch))
+
+        any_mismatch = np.zeros(len(both), dtype=bool)
+        for mismatch in mismatches.values():
+            any_mismatch |= mismatch
+        result["mismatched_bars"] += int(np.count_nonzero(any_mismatch))
+
+        for position in np.flatnonzero(any_mismatch | incomplete):
+            row = both.iloc[position]
+            self._add_discrepancy(
+                result,
+                {
+                    "date": _iso(row["bucket"]),
+                    "fine_bars": int(row["fine_bars"]),
+                    "expected_fine_bars": self.bars_per_bucket,
+                    "columns": {
+                        column: {
+                            "fine": _plain(row[f"{column}_fine"]),
+                            "coarse": _plain(row[f"{column}_coarse"]),
+                        }
+                        for column, mismatch in mismatches.items()
+                        if mismatch[position]
+                    },
+                },
+            )
+
+    @staticmethod
+    def _add_discrepancy(result: Dict[str, Any], discrepancy: Dict[str, Any]) -> None:
+        if len(result["discrepancies"]) < MAX_REPORTED_DISCREPANCIES:
+            result["discrepancies"].append(discrepancy)
+
+
+def _open_time_ns(rows: pd.DataFrame) -> np.ndarray:
+    """Bar open times as int64 nanoseconds since the epoch."""
+    return pd.to_datetime(rows["date"]).to_numpy().astype("datetime64[ns]").view(np.int64)
+
+
+def _compared_columns(columns) -> List[str]:
+    return [
+        column
+        for column in FIRST_COLUMNS
+        + LAST_COLUMNS
+        + MAX_COLUMNS
+        + MIN_COLUMNS
+        + SUM_COLUMNS
+        + COUNT_COLUMNS
+        + ["close_time"]
+        if column in columns
+    ]
+
+
+def _iso(bucket_ns: int) -> str:
+    return pd.Timestamp(int(bucket_ns)).isoformat()
+
+
+def _plain(value: Any) -> Any:
+    """A JSON-friendly scalar."""
+    return value.item() if hasattr(value, "item") else value
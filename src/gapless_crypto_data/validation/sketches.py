@@ -0,0 +1,242 @@
+"""
+Mergeable streaming sketches for validation statistics.
+
+``KLLSketch`` answers quantile and rank queries over a stream of floats in memory
+independent of the stream length. Items live in a hierarchy of compactors: level
+``h`` holds items of weight ``2**h``. When a level fills up it is sorted and every
+other item (from a random offset) moves up one level with doubled weight, which
+keeps rank queries unbiased. Capacities shrink geometrically towards the lowest
+levels as in Karnin, Lang and Liberty's KLL sketch, so the footprint stays around
+``3 * k`` items and the rank error is roughly ``1.7 / k`` of the stream length.
+
+``HeavyHitterSketch`` is a Misra-Gries summary: at most ``capacity`` counters,
+each an undercount of its value's frequency by no more than ``count / (capacity + 1)``.
+Any value more frequent than that bound is guaranteed to hold a counter.
+
+Sketches built over different chunks (or different files) are merged by
+combining their state and compacting again, with the same error guarantees as a
+single sketch over the concatenated stream.
+"""
+
+import math
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Default compactor size; rank error about 0.05% of the item count
+DEFAULT_SKETCH_K = 4096
+
+# Default heavy-hitter counters; frequency error at most 0.1% of the item count
+DEFAULT_HEAVY_HITTERS = 1023
+
+# Capacity ratio between consecutive levels (KLL's c) and the smallest capacity
+_CAPACITY_RATIO = 2.0 / 3.0
+_MIN_CAPACITY = 8
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch over float values (NaN is ignored).
+
+    Examples:
+        >>> sketch = KLLSketch()
+        >>> for chunk in chunks:
+        ...     sketch.update(chunk["close"].to_numpy())
+        >>> q1, q3 = sketch.quantiles([0.25, 0.75])
+        >>> below = sketch.rank(q1 - 1.5 * (q3 - q1))
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K, seed: Optional[int] = None):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            k: Size of the top compactor; larger is more accurate
+            seed: Seed for the compaction offsets (for reproducible sketches)
+        """
+        self.k = k
+        self.count = 0
+        self.min_value = math.nan
+        self.max_value = math.nan
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - 1 - level
+        return max(int(math.ceil(self.k * _CAPACITY_RATIO**depth)), _MIN_CAPACITY)
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of values."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+
+        self.count += len(values)
+        self.min_value = np.fmin(self.min_value, values.min())
+        self.max_value = np.fmax(self.max_value, values.max())
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        """Fold another sketch (e.g., of another chunk or file) into this one."""
+        if not other.count:
+            return
+
+        self.count += other.count
+        self.min_value = np.fmin(self.min_value, other.min_value)
+        self.max_value = np.fmax(self.max_value, other.max_value)
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._compress()
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) < self._capacity(level):
+                level += 1
+                continue
+
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+
+            items = np.sort(items)
+            # An odd item out stays at this level so no weight is lost
+            leftover = items[-1:] if len(items) % 2 else items[:0]
+            paired = items[: len(items) - len(leftover)]
+            promoted = paired[self._rng.integers(2) :: 2]
+
+            self._levels[level] = leftover
+            self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            # Capacities of lower levels shrink when a level is added; recheck from the bottom
+            level = 0
+
+    def _weighted_items(self):
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(len(level_items), 2**level) for level, level_items in enumerate(self._levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        return items[order], weights[order]
+
+    def quantiles(self, fractions: List[float]) -> List[float]:
+        """
+        Approximate quantiles.
+
+        Args:
+            fractions: Quantile fractions in [0, 1]
+
+        Returns:
+            One value per fraction (NaN if the sketch is empty)
+        """
+        if not self.count:
+            return [math.nan] * len(fractions)
+
+        if len(self._levels) == 1:
+            # Nothing compacted yet: the sketch holds every value, so interpolate exactly
+            return [float(q) for q in np.percentile(self._levels[0], np.multiply(fractions, 100))]
+
+        items, weights = self._weighted_items()
+        cumulative = np.cumsum(weights)
+        results = []
+        for fraction in fractions:
+            if fraction <= 0:
+                results.append(float(self.min_value))
+            elif fraction >= 1:
+                results.append(float(self.max_value))
+            else:
+                index = np.searchsorted(cumulative, fraction * cumulative[-1], side="left")
+                results.append(float(items[min(index, len(items) - 1)]))
+        return results
+
+    def quantile(self, fraction: float) -> float:
+        """Approximate quantile for one fraction."""
+        return self.quantiles([fraction])[0]
+
+    def rank(self, value: float, inclusive: bool = False) -> int:
+        """
+        Approximate number of values below ``value`` (or at most ``value``).
+
+        Args:
+            value: Threshold
+            inclusive: Count values equal to the threshold as well
+
+        Returns:
+            Estimated count, exact at or beyond the minimum and maximum
+        """
+        if not self.count or value < self.min_value:
+            return 0
+        if value > self.max_value or (inclusive and value == self.max_value):
+            return self.count
+
+        compare = np.less_equal if inclusive else np.less
+        estimate = sum(
+            (2**level) * int(np.count_nonzero(compare(items, value)))
+            for level, items in enumerate(self._levels)
+        )
+        return int(min(estimate, self.count))
+
+
+class HeavyHitterSketch:
+    """
+    Misra-Gries frequent-value summary over float values (NaN is ignored).
+
+    Examples:
+        >>> sketch = HeavyHitterSketch()
+        >>> for chunk in chunks:
+        ...     sketch.update(chunk["open"].to_numpy())
+        >>> sketch.max_count() > 0.1 * sketch.count
+        False
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HEAVY_HITTERS):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            capacity: Maximum number of counters kept
+        """
+        self.capacity = capacity
+        self.count = 0
+        # Total amount subtracted from counters; bounds the undercount of any value
+        self.error = 0
+        self._counters = pd.Series(dtype=np.int64)
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of values."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+
+        self.count += len(values)
+        self._combine(pd.Series(values, copy=False).value_counts(sort=False))
+
+    def merge(self, other: "HeavyHitterSketch") -> None:
+        """Fold another sketch (e.g., of another chunk or file) into this one."""
+        self.count += other.count
+        self.error += other.error
+        self._combine(other._counters)
+
+    def _combine(self, counters: pd.Series) -> None:
+        combined = pd.concat([self._counters, counters])
+        combined = combined.groupby(level=0, sort=False).sum()
+        if len(combined) > self.capacity:
+            # Subtract the (capacity + 1)-th largest count from all and drop the non-positive
+            cut = len(combined) - self.capacity - 1
+            threshold = np.partition(combined.to_numpy(), cut)[cut]
+            combined = combined[combined > threshold] - threshold
+            self.error += int(threshold)
+        self._counters = combined.astype(np.int64)
+
+    def estimate(self, value: float) -> int:
+        """Lower bound on the frequency of ``value`` (within ``error`` of the truth)."""
+        return int(self._counters.get(value, 0))
+
+    def max_count(self) -> int:
+        """Lower bound on the frequency of the most frequent value (0 if empty)."""
+        return int(self._counters.max()) if len(self._counters) else 0
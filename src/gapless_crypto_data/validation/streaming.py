@@ -0,0 +1,237 @@
+"""
+Chunked validation of OHLCV CSV files larger than memory.
+
+``StreamingOHLCVValidator`` consumes a CSV file chunk by chunk and carries the
+state each report section needs across chunk boundaries:
+
+- the last timestamp, so gaps and ordering are checked across chunk edges
+- the date range, row count and rule-violation counts
+- running min/max and sum/count of each column for ranges and the volume mean
+- quantile and heavy-hitter sketches (``AnomalySketches``) for the outlier and
+  repeated-value checks
+
+The report has the same sections and keys as ``OHLCVValidationKernel``, built by
+the same report functions; only the anomaly counts are approximate (see
+``AnomalySketches`` for the error bounds). Memory is bounded by the chunk size
+plus the fixed-size sketches.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .kernel import (
+    ANOMALY_COLUMNS,
+    PRICE_COLUMNS,
+    AnomalySketches,
+    coverage_report,
+    datetime_report,
+    quality_counts,
+    quality_report,
+    scan_gaps,
+    structure_report,
+)
+
+# Rows per chunk when streaming a CSV file
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+# validate_csv_file streams files at least this large instead of loading them whole
+STREAMING_THRESHOLD_BYTES = 512 * 1024 * 1024
+
+
+class StreamingOHLCVValidator:
+    """
+    Validator that accumulates OHLCV statistics over chunks of one file.
+
+    Examples:
+        >>> validator = StreamingOHLCVValidator.from_csv(csv_path, "1s", chunk_rows=500_000)
+        >>> validator.validate_all()["datetime_validation"]["gaps_found"]
+        0
+
+        Feed chunks from another source:
+
+        >>> validator = StreamingOHLCVValidator("1h")
+        >>> for chunk in chunks:
+        ...     validator.update(chunk)
+        >>> report = validator.validate_all()
+    """
+
+    def __init__(
+        self,
+        expected_timeframe: Optional[str] = None,
+        unfillable_gaps: Optional[List] = None,
+    ):
+        """
+        Initialize an empty validator.
+
+        Args:
+            expected_timeframe: Timeframe (e.g., "1h") for gap and coverage checks
+            unfillable_gaps: Registered exchange outages (storage.UnfillableGap);
+                gaps they cover are reported as known_outages
+        """
+        self.expected_timeframe = expected_timeframe
+        self.unfillable_gaps = unfillable_gaps or []
+        self.columns: Optional[List[str]] = None
+        self.row_count = 0
+
+        # Date state; a parse failure ends date checks for the file
+        self.date_error: Optional[Exception] = None
+        self.is_sorted = True
+        self.last_date = None
+        self.start_time = pd.NaT
+        self.end_time = pd.NaT
+        self.gap_scan: Dict[str, Any] = {"gap_details": [], "warnings": [], "known_outages": 0}
+
+        # Column statistics
+        self.counts: Dict[str, int] = {}
+        self.minimums = dict.fromkeys(ANOMALY_COLUMNS, np.nan)
+        self.maximums = dict.fromkeys(ANOMALY_COLUMNS, np.nan)
+        self.volume_sum = 0.0
+        self.volume_count = 0
+        self.anomaly_sketches = AnomalySketches()
+
+    @classmethod
+    def from_csv(
+        cls,
+        csv_filepath: Union[str, Path],
+        expected_timeframe: Optional[str] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        unfillable_gaps: Optional[List] = None,
+    ) -> "StreamingOHLCVValidator":
+        """
+        Stream a CSV file through a new validator.
+
+        Args:
+            csv_filepath: CSV file (``#`` header comments are skipped)
+            expected_timeframe: Timeframe for gap and coverage checks
+            chunk_rows: Rows read per chunk
+            unfillable_gaps: Registered exchange outages
+
+        Returns:
+            Validator holding the statistics of the whole file
+        """
+        validator = cls(expected_timeframe, unfillable_gaps)
+        with pd.read_csv(csv_filepath, comment="#", chunksize=chunk_rows) as reader:
+            validator.update_all(reader)
+        return validator
+
+    def update_all(self, chunks: Iterable[pd.DataFrame]) -> None:
+        """Consume chunks in file order."""
+        for chunk in chunks:
+            self.update(chunk)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold the next chunk (rows in file order) into the running state."""
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+        if len(chunk) == 0:
+            return
+
+        self._update_dates(chunk)
+        arrays = {
+            col: chunk[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in ANOMALY_COLUMNS
+        }
+
+        for name, count in quality_counts(
+            {col: arrays[col] for col in PRICE_COLUMNS}, arrays["volume"]
+        ).items():
+            self.counts[name] = self.counts.get(name, 0) + count
+
+        for col, values in arrays.items():
+            valid = values[~np.isnan(values)]
+            if len(valid):
+                self.minimums[col] = np.fmin(self.minimums[col], valid.min())
+                self.maximums[col] = np.fmax(self.maximums[col], valid.max())
+            if col == "volume":
+                self.volume_sum += valid.sum()
+                self.volume_count += len(valid)
+        self.anomaly_sketches.update(arrays)
+
+        self.row_count += len(chunk)
+
+    def _update_dates(self, chunk: pd.DataFrame) -> None:
+        if self.date_error is not None:
+            return
+
+        try:
+            dates = pd.to_datetime(chunk["date"])
+        except Exception as e:
+            self.date_error = e
+            return
+
+        date_values = dates.to_numpy()
+        first_position = self.row_count
+        if self.last_date is not None:
+            first_date = date_values[0]
+            if pd.isna(first_date) or pd.isna(self.last_date) or first_date < self.last_date:
+                self.is_sorted = False
+            # Prepend the previous chunk's last timestamp to catch a gap at the boundary
+            date_values = np.concatenate([[self.last_date], date_values])
+            first_position -= 1
+
+        self.is_sorted = self.is_sorted and dates.is_monotonic_increasing
+        chunk_scan = scan_gaps(
+            date_values, first_position, self.expected_timeframe, self.unfillable_gaps
+        )
+        self.gap_scan["gap_details"].extend(chunk_scan["gap_details"])
+        self.gap_scan["warnings"].extend(chunk_scan["warnings"])
+        self.gap_scan["known_outages"] += chunk_scan["known_outages"]
+
+        chunk_start, chunk_end = dates.min(), dates.max()
+        if pd.notna(chunk_start):
+            self.start_time = (
+                chunk_start if pd.isna(self.start_time) else min(self.start_time, chunk_start)
+            )
+            self.end_time = chunk_end if pd.isna(self.end_time) else max(self.end_time, chunk_end)
+        self.last_date = date_values[-1]
+
+    def validate_all(self) -> Dict[str, Dict[str, Any]]:
+        """Every report section keyed as in the validate_csv_file results."""
+        return {
+            "structure_validation": self.structure(),
+            "datetime_validation": self.datetime_sequence(),
+            "ohlcv_validation": self.ohlcv_quality(),
+            "coverage_validation": self.expected_coverage(),
+            "anomaly_validation": self.statistical_anomalies(),
+        }
+
+    def structure(self) -> Dict[str, Any]:
+        """Validate CSV has correct structure and columns."""
+        return structure_report(self.columns or [], self.row_count)
+
+    def datetime_sequence(self) -> Dict[str, Any]:
+        """Validate datetime sequence is complete and chronological."""
+        if self.date_error is not None:
+            return {
+                "status": "INVALID",
+                "errors": [f"Failed to parse dates: {self.date_error}"],
+                "warnings": [],
+            }
+        return datetime_report(self.is_sorted, self.gap_scan, self.start_time, self.end_time)
+
+    def ohlcv_quality(self) -> Dict[str, Any]:
+        """Validate OHLCV data quality and logical consistency."""
+        return quality_report(
+            self.counts,
+            price_mins=[self.minimums[col] for col in PRICE_COLUMNS],
+            price_maxes=[self.maximums[col] for col in PRICE_COLUMNS],
+            volume_stats={
+                "min": self.minimums["volume"],
+                "max": self.maximums["volume"],
+                "mean": self.volume_sum / self.volume_count if self.volume_count else np.nan,
+            },
+        )
+
+    def expected_coverage(self) -> Dict[str, Any]:
+        """Validate data coverage matches expected timeframe and duration."""
+        if self.date_error is not None and self.expected_timeframe and self.row_count:
+            raise self.date_error
+        return coverage_report(
+            self.expected_timeframe, self.row_count, self.start_time, self.end_time
+        )
+
+    def statistical_anomalies(self) -> Dict[str, Any]:
+        """Detect statistical anomalies in price and volume data."""
+        return self.anomaly_sketches.report()
@@ -2,10 +2,19 @@
 Pytest configuration and shared fixtures for gapless-crypto-data tests.
 """
 
+import io
+import json
+import threading
+import zipfile
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 
+from gapless_crypto_data.utils import get_timeframe_interval
+
 
 @pytest.fixture
 def test_data_dir():
@@ -29,3 +38,144 @@ def project_root():
 def sample_data_dir():
     """Path to sample data directory in source."""
     return Path(__file__).parent.parent / "src" / "gapless_crypto_data" / "sample_data"
+
+
+class BinanceStubServer:
+    """Local stand-in for the Binance /api/v3/klines endpoint and daily archives.
+
+    Serves deterministic klines for any symbol and fixed-width interval, reports
+    accumulated request weight in X-MBX-USED-WEIGHT-1M, and can be told to answer
+    the next requests with HTTP 429 or to omit given open times (exchange outages).
+    Daily archive ZIPs are served under ``archive_base_url`` in the data.binance.vision
+    layout (microsecond timestamps from 2025 on); days in ``unpublished_archive_days``
+    answer 404.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.archive_requests = []
+        self.unpublished_archive_days = set()
+        self.used_weight = 0
+        self.rate_limited_responses = 0
+        self.missing_open_times = set()
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class KlinesHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                if url.path.startswith("/data/spot/daily/klines/"):
+                    status, headers, payload = stub.handle_archive(url.path)
+                else:
+                    status, headers, body = stub.handle(url.path, params)
+                    payload = json.dumps(body).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                headers.setdefault("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), KlinesHandler)
+        root_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self.url = f"{root_url}/api/v3/klines"
+        self.archive_base_url = f"{root_url}/data/spot"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def handle(self, path, params):
+        with self._lock:
+            self.requests.append(params)
+            if self.rate_limited_responses:
+                self.rate_limited_responses -= 1
+                return 429, {"Retry-After": "0"}, {"code": -1003, "msg": "Too many requests"}
+            self.used_weight += 2
+            headers = {"X-MBX-USED-WEIGHT-1M": str(self.used_weight)}
+
+        if path != "/api/v3/klines":
+            return 404, headers, {"code": -1, "msg": "Not found"}
+
+        klines = self.klines(
+            params["interval"],
+            int(params["startTime"]),
+            int(params["endTime"]),
+            int(params.get("limit", 500)),
+        )
+        return 200, headers, klines
+
+    def handle_archive(self, path):
+        # .../daily/klines/{symbol}/{interval}/{symbol}-{interval}-{YYYY-MM-DD}.zip
+        filename = path.rsplit("/", 1)[-1]
+        interval = path.split("/")[-2]
+        day = filename[:-4].rsplit("-", 3)[-3:]
+        day_start = datetime(*map(int, day), tzinfo=timezone.utc)
+        with self._lock:
+            self.archive_requests.append(filename)
+        if day_start.date() in self.unpublished_archive_days:
+            return 404, {}, b"Not Found"
+
+        start_ms = int(day_start.timestamp() * 1000)
+        klines = self.klines(interval, start_ms, start_ms + 86_400_000 - 1, None)
+        timestamp_scale = 1000 if day_start.year >= 2025 else 1
+        csv_text = "".join(
+            ",".join(
+                str(value * timestamp_scale) if index in (0, 6) else str(value)
+                for index, value in enumerate(kline)
+            )
+            + "\n"
+            for kline in klines
+        )
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr(filename.replace(".zip", ".csv"), csv_text)
+        return 200, {"Content-Type": "application/zip"}, archive.getvalue()
+
+    def klines(self, interval, start_ms, end_ms, limit):
+        interval_ms = int(get_timeframe_interval(interval).total_seconds() * 1000)
+        first_open_ms = -(-start_ms // interval_ms) * interval_ms
+
+        klines = []
+        for open_ms in range(first_open_ms, end_ms + 1, interval_ms):
+            if open_ms in self.missing_open_times:
+                continue
+            price = 100.0 + (open_ms // interval_ms) % 50
+            klines.append(
+                [
+                    open_ms,
+                    f"{price:.2f}",
+                    f"{price + 1:.2f}",
+                    f"{price - 1:.2f}",
+                    f"{price + 0.5:.2f}",
+                    "10.0",
+                    open_ms + interval_ms - 1,
+                    "1000.0",
+                    42,
+                    "5.0",
+                    "500.0",
+                    "0",
+                ]
+            )
+            if len(klines) == limit:
+                break
+        return klines
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def binance_stub_server():
+    """Running BinanceStubServer; point clients at ``binance_stub_server.url``."""
+    server = BinanceStubServer()
+    server.start()
+    yield server
+    server.stop()
@@ -9,11 +9,12 @@ gap detection and filling with authentic Binance API data.
 import os
 import tempfile
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 
 import pandas as pd
 import pytest
 
+from gapless_crypto_data.gap_filling.binance_rest_client import BinanceRestClient
 from gapless_crypto_data.gap_filling.universal_gap_filler import UniversalGapFiller
 
 
@@ -116,15 +117,13 @@ class Test1sGapFilling:
         finally:
             os.unlink(temp_file)
 
-    @patch("gapless_crypto_data.gap_filling.universal_gap_filler.httpx.get")
-    def test_1s_gap_filling_api_call(self, mock_get):
+    @patch.object(BinanceRestClient, "fetch_klines", new_callable=AsyncMock)
+    def test_1s_gap_filling_api_call(self, mock_fetch_klines):
         """Test that 1s gap filling makes correct API calls."""
-        gap_filler = UniversalGapFiller()
+        gap_filler = UniversalGapFiller(use_daily_archives=False)
 
         # Mock API response for 1s data
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
+        mock_fetch_klines.return_value = [
             [
                 1758234363000,
                 "100.50",
@@ -154,7 +153,6 @@ class Test1sGapFilling:
                 "0",
             ],
         ]
-        mock_get.return_value = mock_response
 
         # Test gap filling
         test_gap = {
@@ -177,19 +175,13 @@ class Test1sGapFilling:
             # This should make an API call for 1s interval
             result = gap_filler.fill_gap(test_gap, temp_file, "1s")
 
-            # Verify API was called with correct parameters
-            mock_get.assert_called_once()
-            call_args = mock_get.call_args
+            # Verify the weight-limited REST client was called with correct parameters
+            mock_fetch_klines.assert_awaited_once()
+            symbol, interval = mock_fetch_klines.call_args.args[:2]
 
             # Check that the API call parameters include 1s interval
-            call_kwargs = call_args[1] if len(call_args) > 1 else {}
-            params = call_kwargs.get("params", {})
-            assert params.get("interval") == "1s", (
-                f"Expected 1s interval, got {params.get('interval')}"
-            )
-            assert params.get("symbol") == "BTCUSDT", (
-                f"Expected BTCUSDT symbol, got {params.get('symbol')}"
-            )
+            assert interval == "1s", f"Expected 1s interval, got {interval}"
+            assert symbol == "BTCUSDT", f"Expected BTCUSDT symbol, got {symbol}"
 
         finally:
             os.unlink(temp_file)
@@ -357,15 +349,13 @@ class Test1dGapFilling:
         finally:
             os.unlink(temp_file)
 
-    @patch("gapless_crypto_data.gap_filling.universal_gap_filler.httpx.get")
-    def test_1d_gap_filling_api_call(self, mock_get):
+    @patch.object(BinanceRestClient, "fetch_klines", new_callable=AsyncMock)
+    def test_1d_gap_filling_api_call(self, mock_fetch_klines):
         """Test that 1d gap filling makes correct API calls."""
-        gap_filler = UniversalGapFiller()
+        gap_filler = UniversalGapFiller(use_daily_archives=False)
 
         # Mock API response for 1d data
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
+        mock_fetch_klines.return_value = [
             [
                 1757894400000,
                 "45000.0",
@@ -395,7 +385,6 @@ class Test1dGapFilling:
                 "0",
             ],
         ]
-        mock_get.return_value = mock_response
 
         # Test gap filling
         test_gap = {
@@ -418,19 +407,13 @@ class Test1dGapFilling:
             # This should make an API call for 1d interval
             result = gap_filler.fill_gap(test_gap, temp_file, "1d")
 
-            # Verify API was called with correct parameters
-            mock_get.assert_called_once()
-            call_args = mock_get.call_args
+            # Verify the weight-limited REST client was called with correct parameters
+            mock_fetch_klines.assert_awaited_once()
+            symbol, interval = mock_fetch_klines.call_args.args[:2]
 
             # Check that the API call parameters include 1d interval
-            call_kwargs = call_args[1] if len(call_args) > 1 else {}
-            params = call_kwargs.get("params", {})
-            assert params.get("interval") == "1d", (
-                f"Expected 1d interval, got {params.get('interval')}"
-            )
-            assert params.get("symbol") == "BTCUSDT", (
-                f"Expected BTCUSDT symbol, got {params.get('symbol')}"
-            )
+            assert interval == "1d", f"Expected 1d interval, got {interval}"
+            assert symbol == "BTCUSDT", f"Expected BTCUSDT symbol, got {symbol}"
 
         finally:
             os.unlink(temp_file)
@@ -1,7 +1,8 @@
 """Test Atomic File Operations functionality."""
 
+import hashlib
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
 
@@ -267,6 +268,62 @@ class TestAtomicCSVOperations:
 
             assert success is False
 
+    def test_write_dataframe_atomic_verifies_without_reparse(self):
+        """Test that the default write is verified from its own checksum and line count."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "test.csv"
+            valid_df = pd.DataFrame(
+                {
+                    "date": ["2024-01-01 00:00:00", "2024-01-01 01:00:00"],
+                    "open": [100.0, 101.0],
+                    "high": [105.0, 106.0],
+                    "low": [95.0, 96.0],
+                    "close": [102.0, 103.0],
+                    "volume": [1000.0, 1100.0],
+                }
+            )
+
+            atomic_ops = AtomicCSVOperations(csv_path)
+            with patch("pandas.read_csv") as mock_read_csv:
+                success = atomic_ops.write_dataframe_atomic(valid_df, ["# Header"])
+
+            assert success is True
+            mock_read_csv.assert_not_called()
+            assert csv_path.read_text() == (
+                "# Header\n"
+                "date,open,high,low,close,volume\n"
+                "2024-01-01 00:00:00,100.0,105.0,95.0,102.0,1000.0\n"
+                "2024-01-01 01:00:00,101.0,106.0,96.0,103.0,1100.0\n"
+            )
+            assert (
+                atomic_ops.last_write_checksum == hashlib.sha256(csv_path.read_bytes()).hexdigest()
+            )
+
+    def test_write_dataframe_atomic_paranoid_reparses(self):
+        """Test that paranoid mode re-parses the temporary file before committing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "test.csv"
+            valid_df = pd.DataFrame(
+                {
+                    "date": ["2024-01-01 00:00:00"],
+                    "open": [100.0],
+                    "high": [105.0],
+                    "low": [95.0],
+                    "close": [102.0],
+                    "volume": [1000.0],
+                }
+            )
+
+            atomic_ops = AtomicCSVOperations(csv_path)
+            with patch("pandas.read_csv", return_value=pd.DataFrame()) as mock_read_csv:
+                success = atomic_ops.write_dataframe_atomic(valid_df, [], paranoid=True)
+
+            # The re-parse saw no rows, so the write is rejected and nothing is committed
+            mock_read_csv.assert_called_once()
+            assert success is False
+            assert not csv_path.exists()
+            assert list(Path(temp_dir).iterdir()) == []
+
     def test_rollback_from_backup_success(self):
         """Test successful rollback from backup."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -325,6 +382,97 @@ class TestAtomicCSVOperations:
             assert success is True
             assert not backup_path.exists()
 
+    def test_backup_survives_atomic_write_and_rollback(self):
+        """Test that a linked or cloned backup keeps the original data."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "test.csv"
+            original_content = "date,open,high,low,close,volume\n2024-01-01 00:00:00,100.0,105.0,95.0,102.0,1000.0\n"
+            csv_path.write_text(original_content)
+
+            atomic_ops = AtomicCSVOperations(csv_path)
+            backup_path = atomic_ops.create_backup()
+
+            new_df = pd.DataFrame(
+                {
+                    "date": ["2024-01-02 00:00:00"],
+                    "open": [1.0],
+                    "high": [2.0],
+                    "low": [0.5],
+                    "close": [1.5],
+                    "volume": [10.0],
+                }
+            )
+            assert atomic_ops.write_dataframe_atomic(new_df) is True
+            assert backup_path.read_text() == original_content
+
+            assert atomic_ops.rollback_from_backup() is True
+            assert csv_path.read_text() == original_content
+            assert backup_path.read_text() == original_content
+
+            # Restored file no longer shares data with the backup
+            csv_path.write_text("changed")
+            assert backup_path.read_text() == original_content
+
+    def test_create_backup_falls_back_to_copy(self):
+        """Test the copy fallback when reflinks and hardlinks are unavailable."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "test.csv"
+            csv_path.write_text("date,open\n2024-01-01 00:00:00,1.0\n")
+
+            with (
+                patch(
+                    "gapless_crypto_data.gap_filling.safe_file_operations._reflink",
+                    return_value=False,
+                ),
+                patch("os.link", side_effect=OSError("Hardlinks not supported")),
+            ):
+                backup_path = AtomicCSVOperations(csv_path).create_backup()
+
+            assert backup_path.read_text() == csv_path.read_text()
+            assert backup_path.stat().st_ino != csv_path.stat().st_ino
+
+    def test_backup_retention_keeps_newest(self):
+        """Test that only the newest keep_backups backups are kept."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "test.csv"
+            csv_path.write_text("date,open\n2024-01-01 00:00:00,1.0\n")
+            old_backups = [
+                Path(temp_dir) / "test.backup_20240101_000000.csv",
+                Path(temp_dir) / "test.backup_20240102_000000_000000.csv",
+                Path(temp_dir) / "test.backup_20240103_000000_000000.csv",
+            ]
+            for old_backup in old_backups:
+                old_backup.write_text("old")
+            unrelated = Path(temp_dir) / "test.backup_notes.csv"
+            unrelated.write_text("keep")
+
+            atomic_ops = AtomicCSVOperations(csv_path, keep_backups=2)
+            backup_path = atomic_ops.create_backup()
+
+            remaining = [path for _, path in atomic_ops.list_backups()]
+            assert remaining == [old_backups[2], backup_path]
+            assert unrelated.exists()
+
+    def test_backup_retention_by_age(self):
+        """Test that backups older than max_backup_age are removed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "test.csv"
+            csv_path.write_text("date,open\n2024-01-01 00:00:00,1.0\n")
+            recent = datetime.now() - timedelta(hours=1)
+            recent_backup = csv_path.with_name(f"test.backup_{recent:%Y%m%d_%H%M%S_%f}.csv")
+            recent_backup.write_text("recent")
+            stale_backup = Path(temp_dir) / "test.backup_20200101_000000_000000.csv"
+            stale_backup.write_text("stale")
+
+            atomic_ops = AtomicCSVOperations(
+                csv_path, keep_backups=None, max_backup_age=timedelta(days=7)
+            )
+            backup_path = atomic_ops.create_backup()
+
+            assert not stale_backup.exists()
+            assert recent_backup.exists()
+            assert backup_path.exists()
+
     def test_cleanup_backup_no_backup(self):
         """Test cleanup when no backup exists."""
         atomic_ops = AtomicCSVOperations(Path("/tmp/test.csv"))
@@ -500,10 +648,10 @@ class TestSafeCSVMerger:
             # Verify original file is unchanged
             assert csv_path.read_text() == original_content
 
-    @patch("pandas.concat")
-    def test_merge_gap_data_safe_merge_failure(self, mock_concat):
+    @patch("gapless_crypto_data.gap_filling.safe_file_operations._copy_byte_range")
+    def test_merge_gap_data_safe_merge_failure(self, mock_copy):
         """Test gap merge with merge operation failure."""
-        mock_concat.side_effect = Exception("Merge failed")
+        mock_copy.side_effect = OSError("Merge failed")
 
         with tempfile.TemporaryDirectory() as temp_dir:
             csv_path = Path(temp_dir) / "test.csv"
@@ -544,3 +692,134 @@ class TestSafeCSVMerger:
 
             # Verify original file is restored (rollback occurred)
             assert csv_path.read_text() == original_content
+
+    def test_merge_splices_without_rewriting_unchanged_rows(self):
+        """Test that only the gap range changes and the file is never parsed whole."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "test.csv"
+            dates = pd.date_range("2024-01-01", periods=500, freq="1min")
+            # Hand-formatted prices a pandas rewrite would normalize ("100.00" -> "100.0")
+            rows = [f"{date:%Y-%m-%d %H:%M:%S},100.00,101.00,99.00,100.50,10.00" for date in dates]
+            del rows[300:303]
+            header = "# Binance Spot Market Data\ndate,open,high,low,close,volume\n"
+            csv_path.write_text(header + "\n".join(rows) + "\n")
+
+            gap_data = pd.DataFrame(
+                {
+                    "date": dates[300:303],
+                    "open": [200.0, 201.0, 202.0],
+                    "high": [205.0, 206.0, 207.0],
+                    "low": [195.0, 196.0, 197.0],
+                    "close": [202.0, 203.0, 204.0],
+                    "volume": [1.0, 2.0, 3.0],
+                }
+            )
+
+            merger = SafeCSVMerger(csv_path)
+            with patch("pandas.read_csv") as mock_read_csv:
+                success = merger.merge_gap_data_safe(gap_data, dates[300], dates[302])
+
+            assert success is True
+            mock_read_csv.assert_not_called()
+            expected_rows = (
+                rows[:300]
+                + [
+                    "2024-01-01 05:00:00,200.0,205.0,195.0,202.0,1.0",
+                    "2024-01-01 05:01:00,201.0,206.0,196.0,203.0,2.0",
+                    "2024-01-01 05:02:00,202.0,207.0,197.0,204.0,3.0",
+                ]
+                + rows[300:]
+            )
+            assert csv_path.read_text() == header + "\n".join(expected_rows) + "\n"
+
+    @pytest.mark.parametrize(
+        "gap_dates,expected_dates",
+        [
+            # Before the first row
+            (["2023-12-31 23:00:00"], ["2023-12-31 23:00:00", "2024-01-01 00:00:00"]),
+            # After the last row, which has no line terminator
+            (["2024-01-01 02:00:00"], ["2024-01-01 00:00:00", "2024-01-01 02:00:00"]),
+        ],
+    )
+    def test_merge_at_file_edges(self, gap_dates, expected_dates):
+        """Test splicing rows in front of the first row and behind the last row."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "test.csv"
+            csv_path.write_text(
+                "date,open,high,low,close,volume\n2024-01-01 00:00:00,1.0,2.0,0.5,1.5,10.0"
+            )
+            gap_data = pd.DataFrame(
+                {
+                    "date": gap_dates,
+                    "open": [1.0],
+                    "high": [2.0],
+                    "low": [0.5],
+                    "close": [1.5],
+                    "volume": [10.0],
+                }
+            )
+            gap_time = datetime.fromisoformat(gap_dates[0])
+
+            merger = SafeCSVMerger(csv_path)
+            assert merger.merge_gap_data_safe(gap_data, gap_time, gap_time) is True
+
+            merged_df = pd.read_csv(csv_path)
+            assert merged_df["date"].tolist() == expected_dates
+
+    def test_merge_keeps_close_time_precision(self):
+        """Test that datetime close_time values keep the file's millisecond precision."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "test.csv"
+            csv_path.write_text(
+                "date,open,high,low,close,volume,close_time\n"
+                "2024-01-01 00:00:00,1.0,2.0,0.5,1.5,10.0,2024-01-01 00:59:59.999\n"
+                "2024-01-01 02:00:00,1.0,2.0,0.5,1.5,10.0,2024-01-01 02:59:59.999\n"
+            )
+            gap_data = pd.DataFrame(
+                {
+                    "date": pd.to_datetime(["2024-01-01 01:00:00"]),
+                    "open": [1.0],
+                    "high": [2.0],
+                    "low": [0.5],
+                    "close": [1.5],
+                    "volume": [10.0],
+                    "close_time": pd.to_datetime(["2024-01-01 01:59:59.999"]),
+                }
+            )
+
+            merger = SafeCSVMerger(csv_path)
+            gap_time = datetime(2024, 1, 1, 1)
+            assert merger.merge_gap_data_safe(gap_data, gap_time, gap_time) is True
+
+            assert csv_path.read_text().splitlines()[2] == (
+                "2024-01-01 01:00:00,1.0,2.0,0.5,1.5,10.0,2024-01-01 01:59:59.999"
+            )
+
+    def test_merge_rejects_rows_outside_gap(self):
+        """Test that gap rows outside the gap boundaries leave the file unchanged."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "test.csv"
+            csv_path.write_text(
+                "date,open,high,low,close,volume\n"
+                "2024-01-01 00:00:00,1.0,2.0,0.5,1.5,10.0\n"
+                "2024-01-01 03:00:00,1.0,2.0,0.5,1.5,10.0\n"
+            )
+            original_content = csv_path.read_text()
+            gap_data = pd.DataFrame(
+                {
+                    "date": ["2024-01-01 01:00:00", "2024-01-01 05:00:00"],
+                    "open": [1.0, 1.0],
+                    "high": [2.0, 2.0],
+                    "low": [0.5, 0.5],
+                    "close": [1.5, 1.5],
+                    "volume": [10.0, 10.0],
+                }
+            )
+
+            merger = SafeCSVMerger(csv_path)
+            success = merger.merge_gap_data_safe(
+                gap_data, datetime(2024, 1, 1, 1), datetime(2024, 1, 1, 2)
+            )
+
+            assert success is False
+            assert csv_path.read_text() == original_content
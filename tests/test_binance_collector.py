@@ -1,5 +1,7 @@
 """Test Binance Public Data Collector functionality."""
 
+import hashlib
+import json
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -8,6 +10,8 @@ import pandas as pd
 import pytest
 
 from gapless_crypto_data.collectors.binance_public_data_collector import BinancePublicDataCollector
+from gapless_crypto_data.storage import UnfillableGap
+from gapless_crypto_data.utils import StreamingDataHasher
 
 
 class TestBinancePublicDataCollector:
@@ -415,6 +419,32 @@ class TestBinancePublicDataCollector:
         # May be valid or invalid depending on implementation tolerance
         assert "errors" in result
 
+    def test_validate_datetime_sequence_known_outage(self):
+        """Test that gaps in a registered exchange outage are not warnings."""
+        collector = BinancePublicDataCollector()
+
+        gapped_df = pd.DataFrame(
+            {
+                "date": pd.to_datetime(
+                    ["2024-01-01 00:00:00", "2024-01-01 01:00:00", "2024-01-01 04:00:00"]
+                ),
+                "open": [100.0, 101.0, 102.0],
+                "high": [105.0, 106.0, 107.0],
+                "low": [95.0, 96.0, 97.0],
+                "close": [102.0, 103.0, 104.0],
+                "volume": [1000.0, 1100.0, 1200.0],
+            }
+        )
+        outage = UnfillableGap(
+            "BTCUSDT", "1h", "2024-01-01 02:00:00", "2024-01-01 04:00:00", "2024-06-01T00:00:00"
+        )
+
+        result = collector._validate_datetime_sequence(gapped_df, "1h", unfillable_gaps=[outage])
+
+        assert result["gaps_found"] == 0
+        assert result["known_outages"] == 1
+        assert result["warnings"] == []
+
     def test_validate_datetime_sequence_duplicates(self):
         """Test datetime sequence validation with duplicate timestamps."""
         collector = BinancePublicDataCollector()
@@ -611,3 +641,237 @@ class TestBinancePublicDataCollector:
         suspicious = result.get("suspicious_patterns", 0)
         outliers = result.get("price_outliers", 0)
         assert (suspicious + outliers) > 0
+
+
+def _make_rows(start: str, periods: int, freq: str = "1h"):
+    """Build processed candle rows in the collector's internal list format."""
+    rows = []
+    for i, ts in enumerate(pd.date_range(start, periods=periods, freq=freq)):
+        price = 100.0 + i
+        rows.append(
+            [
+                ts.strftime("%Y-%m-%d %H:%M:%S"),
+                price,
+                price + 1.0,
+                price - 1.0,
+                price + 0.5,
+                10.0,
+                (ts + pd.Timedelta(freq) - pd.Timedelta(milliseconds=1)).strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                ),
+                1000.0,
+                50,
+                5.0,
+                500.0,
+            ]
+        )
+    return rows
+
+
+class TestIncrementalUpdate:
+    """Test suite for BinancePublicDataCollector.update()."""
+
+    def _collector(self, output_dir, end_date, output_format="csv"):
+        return BinancePublicDataCollector(
+            symbol="BTCUSDT",
+            start_date="2024-01-01",
+            end_date=end_date,
+            output_dir=output_dir,
+            output_format=output_format,
+        )
+
+    def _save_initial(self, collector, rows):
+        stats = {"method": "direct_download", "duration": 0.0, "bars_per_second": 0}
+        return collector.save_data("1h", rows, stats)
+
+    def test_read_last_timestamp_csv(self):
+        """Test that the last bar is read from the file tail."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector = self._collector(temp_dir, "2024-01-02")
+            filepath = self._save_initial(collector, _make_rows("2024-01-01", 24))
+
+            last = collector._read_last_timestamp(filepath)
+
+            assert last == pd.Timestamp("2024-01-01 23:00:00").to_pydatetime()
+
+    def test_update_appends_only_new_rows(self):
+        """Test that update downloads from the next bar and appends atomically."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._save_initial(
+                self._collector(temp_dir, "2024-01-01"), _make_rows("2024-01-01", 24)
+            )
+            all_rows = _make_rows("2024-01-01", 48)
+            collector = self._collector(temp_dir, "2024-01-02")
+
+            with patch.object(
+                collector, "_download_candle_rows", return_value=all_rows
+            ) as mock_download:
+                result = collector.update("1h")
+
+            requested_start = mock_download.call_args[0][1]
+            assert requested_start == pd.Timestamp("2024-01-02 00:00:00").to_pydatetime()
+            assert result["stats"]["bars_appended"] == 24
+            assert (
+                result["filepath"].name == "binance_spot_BTCUSDT-1h_20240101-20240102_v2.10.0.csv"
+            )
+            assert not (
+                Path(temp_dir) / "binance_spot_BTCUSDT-1h_20240101-20240101_v2.10.0.csv"
+            ).exists()
+
+            df = pd.read_csv(result["filepath"], comment="#")
+            assert len(df) == 48
+            assert df["date"].is_monotonic_increasing
+            assert not df["date"].duplicated().any()
+
+            with open(result["filepath"]) as f:
+                assert "# Coverage: 48 bars" in f.read()
+
+            # Content hash and Merkle root after the append equal a from-scratch hash of all rows
+            full_hasher = StreamingDataHasher()
+            full_hasher.update_rows(all_rows)
+            integrity = json.loads(result["filepath"].with_suffix(".metadata.json").read_text())[
+                "data_integrity"
+            ]
+            assert integrity["data_hash"] == full_hasher.hexdigest()
+            assert integrity["hash_method"] == "sha256_canonical_rows"
+            assert integrity["merkle_root"] == full_hasher.merkle_root()
+
+            metadata = json.loads(result["filepath"].with_suffix(".metadata.json").read_text())
+            assert metadata["actual_bars"] == 48
+            assert metadata["date_range"]["end"] == "2024-01-02 23:00:00"
+            assert metadata["incremental_updates"][0]["bars_appended"] == 24
+
+    def test_save_data_hash_and_csv_layout(self):
+        """Test that the streamed hash and CSV data section match the canonical rows."""
+        rows = _make_rows("2024-01-31 20:00:00", 8)  # Spans a month boundary
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector = self._collector(temp_dir, "2024-02-01")
+            filepath = self._save_initial(collector, rows)
+
+            canonical = "\n".join(",".join(map(str, row)) for row in rows)
+            metadata = json.loads(filepath.with_suffix(".metadata.json").read_text())
+            integrity = metadata["data_integrity"]
+            assert integrity["data_hash"] == hashlib.sha256(canonical.encode()).hexdigest()
+            assert list(integrity["month_hashes"]) == ["2024-01", "2024-02"]
+
+            expected_csv = collector._rows_to_output_frame(rows).to_csv(index=False)
+            data_section = "".join(
+                line for line in filepath.read_text().splitlines(True) if not line.startswith("#")
+            )
+            assert data_section == expected_csv
+            # The header placeholder is patched with the final hash
+            assert f"# Data Hash: {integrity['data_hash'][:16]}..." in filepath.read_text()
+            assert not list(Path(temp_dir).glob("*.tmp"))
+
+    def test_update_when_current(self):
+        """Test that an up-to-date dataset is left untouched."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector = self._collector(temp_dir, "2024-01-01")
+            filepath = self._save_initial(collector, _make_rows("2024-01-01", 24))
+            original_bytes = filepath.read_bytes()
+
+            with patch.object(collector, "_download_candle_rows") as mock_download:
+                result = collector.update("1h")
+
+            mock_download.assert_not_called()
+            assert result["stats"]["bars_appended"] == 0
+            assert filepath.read_bytes() == original_bytes
+
+    def test_update_parquet(self):
+        """Test incremental update for Parquet output."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._save_initial(
+                self._collector(temp_dir, "2024-01-01", "parquet"),
+                _make_rows("2024-01-01", 24),
+            )
+            collector = self._collector(temp_dir, "2024-01-02", "parquet")
+
+            with patch.object(
+                collector, "_download_candle_rows", return_value=_make_rows("2024-01-02", 24)
+            ):
+                result = collector.update("1h")
+
+            df = pd.read_parquet(result["filepath"])
+            assert len(df) == 48
+            assert result["filepath"].suffix == ".parquet"
+
+    def test_update_arrow(self):
+        """Test Arrow IPC output and incremental update."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            initial = self._save_initial(
+                self._collector(temp_dir, "2024-01-01", "arrow"), _make_rows("2024-01-01", 24)
+            )
+            assert initial.suffix == ".arrow"
+
+            collector = self._collector(temp_dir, "2024-01-02", "arrow")
+            assert (
+                collector._read_last_timestamp(initial)
+                == pd.Timestamp("2024-01-01 23:00:00").to_pydatetime()
+            )
+
+            with patch.object(
+                collector, "_download_candle_rows", return_value=_make_rows("2024-01-02", 24)
+            ):
+                result = collector.update("1h")
+
+            df = pd.read_feather(result["filepath"])
+            assert len(df) == 48
+            assert df["date"].is_monotonic_increasing
+
+
+class TestVectorizedMetadata:
+    """Test suite for gap analysis and statistics in generated metadata."""
+
+    def test_gap_analysis_reports_every_gap(self):
+        """Test that all gaps are listed (no truncation) with correct bar counts."""
+        collector = BinancePublicDataCollector()
+        rows = _make_rows("2024-01-01", 60)
+        # Drop every 4th bar (the last one is trailing): 14 single-bar gaps, more than 10
+        gapped_rows = [row for i, row in enumerate(rows) if i % 4 != 3]
+
+        result = collector._perform_gap_analysis(gapped_rows, "1h")
+
+        assert result["total_gaps_detected"] == 14
+        assert len(result["gap_details"]) == 14
+        assert result["total_missing_bars"] == 14
+        first_gap = result["gap_details"][0]
+        assert first_gap["gap_start"] == "2024-01-01 02:00:00"
+        assert first_gap["gap_end"] == "2024-01-01 04:00:00"
+        assert first_gap["missing_bars"] == 1
+        assert first_gap["duration_minutes"] == 60
+        assert result["data_completeness_score"] == round(45 / 59, 4)
+
+    def test_gap_analysis_uses_timeframe_interval(self):
+        """Test that sub-minute timeframes use their own interval."""
+        collector = BinancePublicDataCollector()
+        rows = _make_rows("2024-01-01", 10, freq="1s")
+        gapped_rows = rows[:3] + rows[8:]
+
+        result = collector._perform_gap_analysis(gapped_rows, "1s")
+
+        assert result["total_gaps_detected"] == 1
+        assert result["gap_details"][0]["missing_bars"] == 5
+        assert result["analysis_parameters"]["expected_interval_minutes"] == 1 / 60
+
+    def test_gap_analysis_continuous_data(self):
+        """Test that continuous data reports no gaps."""
+        collector = BinancePublicDataCollector()
+        result = collector._perform_gap_analysis(_make_rows("2024-01-01", 48), "1h")
+
+        assert result["total_gaps_detected"] == 0
+        assert result["gap_details"] == []
+        assert result["data_completeness_score"] == 1.0
+
+    def test_statistics(self):
+        """Test price and volume statistics over the collected rows."""
+        collector = BinancePublicDataCollector()
+        rows = _make_rows("2024-01-01", 24)
+        stats = {"method": "direct_download", "duration": 0.0, "bars_per_second": 0}
+
+        metadata = collector.generate_metadata("1h", rows, stats)
+
+        assert metadata["statistics"]["price_min"] == 99.0
+        assert metadata["statistics"]["price_max"] == 124.0
+        assert metadata["statistics"]["volume_total"] == 240.0
+        assert metadata["statistics"]["volume_mean"] == 10.0
+        json.dumps(metadata)  # Statistics must stay JSON serializable
@@ -0,0 +1,134 @@
+"""Test weight-aware async Binance REST client."""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from gapless_crypto_data.gap_filling.binance_rest_client import (
+    BinanceRestClient,
+    WeightRateLimiter,
+    kline_page_windows,
+    stitch_kline_pages,
+)
+
+
+def _ms(*args) -> int:
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+class TestWeightRateLimiter:
+    """Test suite for WeightRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_consumes_tokens(self):
+        """Test that acquiring weight draws down the bucket without waiting."""
+        limiter = WeightRateLimiter(weight_limit_per_minute=6000, safety_factor=0.5)
+        assert limiter.capacity == 3000
+
+        started = time.monotonic()
+        for _ in range(10):
+            await limiter.acquire(2)
+
+        assert time.monotonic() - started < 0.1
+        assert limiter.tokens == pytest.approx(2980, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_server_reported_weight_throttles(self):
+        """Test that a used-weight header at the budget makes the next acquire wait."""
+        limiter = WeightRateLimiter(weight_limit_per_minute=600, safety_factor=1.0)
+        limiter.observe_used_weight(600)
+
+        started = time.monotonic()
+        await limiter.acquire(2)
+
+        # 600/minute refills 10 tokens per second: two tokens take ~0.2s
+        assert 0.15 < time.monotonic() - started < 1.0
+
+    @pytest.mark.asyncio
+    async def test_block_for_delays_requests(self):
+        """Test that a Retry-After backoff delays the next acquire."""
+        limiter = WeightRateLimiter()
+        limiter.block_for(0.2)
+
+        started = time.monotonic()
+        await limiter.acquire(2)
+
+        assert time.monotonic() - started >= 0.15
+
+
+class TestKlinePages:
+    """Test suite for page window helpers."""
+
+    def test_page_windows_cover_gap(self):
+        """Test that windows hold at most 1000 bars and cover the whole gap."""
+        start_ms = _ms(2024, 1, 1)
+        end_ms = start_ms + 2500 * 60_000
+
+        windows = kline_page_windows(start_ms, end_ms, "1m")
+
+        assert windows == [
+            (start_ms, start_ms + 1000 * 60_000 - 1),
+            (start_ms + 1000 * 60_000, start_ms + 2000 * 60_000 - 1),
+            (start_ms + 2000 * 60_000, end_ms),
+        ]
+
+    def test_single_window_for_short_gap(self):
+        """Test that short gaps need one request."""
+        start_ms = _ms(2024, 1, 1)
+        assert kline_page_windows(start_ms, start_ms + 3_000, "1s") == [
+            (start_ms, start_ms + 3_000)
+        ]
+
+    def test_stitch_orders_and_deduplicates(self):
+        """Test that pages are merged by open time."""
+        pages = [[[3, "c"], [4, "d"]], [[1, "a"], [2, "b"], [3, "dup"]]]
+        assert stitch_kline_pages(pages) == [[1, "a"], [2, "b"], [3, "c"], [4, "d"]]
+
+
+class TestBinanceRestClient:
+    """Test suite for BinanceRestClient against a local stub server."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_klines_paginates(self, binance_stub_server):
+        """Test that a long range is fetched as concurrent pages in order."""
+        start_ms = _ms(2024, 1, 1)
+        end_ms = start_ms + 2500 * 60_000 - 1
+
+        async with BinanceRestClient(base_url=binance_stub_server.url) as client:
+            klines = await client.fetch_klines("BTCUSDT", "1m", start_ms, end_ms)
+
+        assert len(binance_stub_server.requests) == 3
+        assert len(klines) == 2500
+        assert [kline[0] for kline in klines] == list(range(start_ms, end_ms, 60_000))
+
+    @pytest.mark.asyncio
+    async def test_used_weight_header_updates_limiter(self, binance_stub_server):
+        """Test that the X-MBX-USED-WEIGHT-1M header caps the shared budget."""
+        limiter = WeightRateLimiter(weight_limit_per_minute=6000, safety_factor=1.0)
+        binance_stub_server.used_weight = 5000
+
+        async with BinanceRestClient(
+            base_url=binance_stub_server.url, rate_limiter=limiter
+        ) as client:
+            await client.get_klines("BTCUSDT", "1h", _ms(2024, 1, 1), _ms(2024, 1, 2))
+
+        assert limiter.tokens <= 6000 - 5002 + 1
+
+    @pytest.mark.asyncio
+    async def test_retries_after_rate_limit(self, binance_stub_server):
+        """Test that HTTP 429 responses are retried after Retry-After."""
+        binance_stub_server.rate_limited_responses = 2
+
+        async with BinanceRestClient(base_url=binance_stub_server.url) as client:
+            klines = await client.get_klines("BTCUSDT", "1h", _ms(2024, 1, 1), _ms(2024, 1, 2))
+
+        assert len(binance_stub_server.requests) == 3
+        assert len(klines) == 25
+
+    @pytest.mark.asyncio
+    async def test_requires_context_manager(self):
+        """Test that requests outside ``async with`` are rejected."""
+        client = BinanceRestClient()
+        with pytest.raises(RuntimeError):
+            await client.get_klines("BTCUSDT", "1h", 0, 1)
@@ -105,6 +105,8 @@ def test_cli_single_symbol_backwards_compatibility():
                 "2024-01-01",
                 "--output-dir",
                 temp_dir,
+                "--checkpoint-dir",
+                str(Path(temp_dir) / ".gapless_checkpoints"),
             ],
             capture_output=True,
             text=True,
@@ -142,6 +144,8 @@ def test_cli_multiple_symbols_parsing():
                 "2024-01-01",
                 "--output-dir",
                 temp_dir,
+                "--checkpoint-dir",
+                str(Path(temp_dir) / ".gapless_checkpoints"),
             ],
             capture_output=True,
             text=True,
@@ -180,6 +184,8 @@ def test_cli_multiple_symbols_with_whitespace():
                 "2024-01-01",
                 "--output-dir",
                 temp_dir,
+                "--checkpoint-dir",
+                str(Path(temp_dir) / ".gapless_checkpoints"),
             ],
             capture_output=True,
             text=True,
@@ -218,6 +224,8 @@ def test_cli_error_handling_with_invalid_symbols():
                 "2024-01-01",
                 "--output-dir",
                 temp_dir,
+                "--checkpoint-dir",
+                str(Path(temp_dir) / ".gapless_checkpoints"),
             ],
             capture_output=True,
             text=True,
@@ -260,6 +268,8 @@ def test_cli_collect_subcommand_multi_symbol():
                 "2024-01-01",
                 "--output-dir",
                 temp_dir,
+                "--checkpoint-dir",
+                str(Path(temp_dir) / ".gapless_checkpoints"),
             ],
             capture_output=True,
             text=True,
@@ -358,6 +368,8 @@ def test_cli_invalid_timeframe_shows_available():
                 "2024-01-01",
                 "--output-dir",
                 temp_dir,
+                "--checkpoint-dir",
+                str(Path(temp_dir) / ".gapless_checkpoints"),
             ],
             capture_output=True,
             text=True,
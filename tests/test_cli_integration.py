@@ -33,6 +33,8 @@ class TestCLIIntegration:
                     "2024-01-01",
                     "--output-dir",
                     temp_dir,
+                    "--checkpoint-dir",
+                    str(Path(temp_dir) / ".gapless_checkpoints"),
                 ],
                 capture_output=True,
                 text=True,
@@ -98,6 +100,8 @@ class TestCLIIntegration:
                     "2024-01-01",
                     "--output-dir",
                     temp_dir,
+                    "--checkpoint-dir",
+                    str(Path(temp_dir) / ".gapless_checkpoints"),
                 ],
                 capture_output=True,
                 text=True,
@@ -135,6 +139,8 @@ class TestCLIIntegration:
                     "2024-01-01",
                     "--output-dir",
                     temp_dir,
+                    "--checkpoint-dir",
+                    str(Path(temp_dir) / ".gapless_checkpoints"),
                 ],
                 capture_output=True,
                 text=True,
@@ -174,6 +180,8 @@ class TestCLIIntegration:
                     "2024-01-01",
                     "--output-dir",
                     temp_dir,
+                    "--checkpoint-dir",
+                    str(Path(temp_dir) / ".gapless_checkpoints"),
                 ],
                 capture_output=True,
                 text=True,
@@ -208,6 +216,8 @@ class TestCLIIntegration:
                     "2024-01-01",
                     "--output-dir",
                     temp_dir,
+                    "--checkpoint-dir",
+                    str(Path(temp_dir) / ".gapless_checkpoints"),
                 ],
                 capture_output=True,
                 text=True,
@@ -350,6 +360,8 @@ class TestDataIntegrity:
                     "2024-01-01",
                     "--output-dir",
                     temp_dir,
+                    "--checkpoint-dir",
+                    str(Path(temp_dir) / ".gapless_checkpoints"),
                 ],
                 capture_output=True,
                 text=True,
@@ -404,6 +416,8 @@ class TestDataIntegrity:
                     "2024-01-01",
                     "--output-dir",
                     temp_dir,
+                    "--checkpoint-dir",
+                    str(Path(temp_dir) / ".gapless_checkpoints"),
                 ],
                 capture_output=True,
                 text=True,
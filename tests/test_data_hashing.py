@@ -0,0 +1,67 @@
+"""Test streaming data hashes and per-month Merkle roots."""
+
+import hashlib
+
+from gapless_crypto_data.utils import StreamingDataHasher, data_hashing, merkle_root
+
+
+def _rows(months=3, per_month=5):
+    """Build canonical-looking rows spread across several months."""
+    rows = []
+    for month in range(1, months + 1):
+        for day in range(1, per_month + 1):
+            rows.append([f"2024-{month:02d}-{day:02d} 00:00:00", 100.0 + day, 10, "x"])
+    return rows
+
+
+class TestStreamingDataHasher:
+    """Test suite for StreamingDataHasher."""
+
+    def test_matches_full_string_hash(self, monkeypatch):
+        """Test that chunked hashing equals hashing the fully joined string."""
+        rows = _rows()
+        expected = hashlib.sha256(
+            "\n".join(",".join(map(str, row)) for row in rows).encode()
+        ).hexdigest()
+
+        # Force many small chunks, including chunk boundaries inside a month
+        monkeypatch.setattr(data_hashing, "HASH_CHUNK_ROWS", 4)
+        hasher = StreamingDataHasher()
+        hasher.update_rows(rows)
+
+        assert hasher.hexdigest() == expected
+
+    def test_month_leaves(self):
+        """Test that each month leaf hashes only that month's lines."""
+        rows = _rows(months=2, per_month=3)
+        hasher = StreamingDataHasher()
+        hasher.update_rows(rows)
+
+        leaves = hasher.month_hashes()
+        assert list(leaves) == ["2024-01", "2024-02"]
+        january = "\n".join(",".join(map(str, row)) for row in rows[:3])
+        assert leaves["2024-01"] == hashlib.sha256(january.encode()).hexdigest()
+
+    def test_merkle_root_merges_existing_leaves(self):
+        """Test that re-hashing only the changed months reproduces the full root."""
+        rows = _rows(months=3)
+        full = StreamingDataHasher()
+        full.update_rows(rows)
+
+        stored = full.month_hashes()
+        partial = StreamingDataHasher()
+        partial.update_rows(rows[10:])  # Only March
+
+        assert partial.merkle_root(stored) == full.merkle_root()
+
+    def test_merkle_root_shapes(self):
+        """Test Merkle root for empty, single and odd leaf counts."""
+        leaf = hashlib.sha256(b"a").hexdigest()
+        assert merkle_root([]) == hashlib.sha256(b"").hexdigest()
+        assert merkle_root([leaf]) == leaf
+
+        pair = hashlib.sha256(bytes.fromhex(leaf) * 2).hexdigest()
+        assert (
+            merkle_root([leaf, leaf, leaf])
+            == hashlib.sha256(bytes.fromhex(pair) + bytes.fromhex(leaf)).hexdigest()
+        )
@@ -1,12 +1,16 @@
 """Test Universal Gap Filler functionality."""
 
 import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
+from gapless_crypto_data.gap_filling.safe_file_operations import AtomicCSVOperations
 from gapless_crypto_data.gap_filling.universal_gap_filler import UniversalGapFiller
+from gapless_crypto_data.storage import DatasetCatalog
 
 
 class TestUniversalGapFiller:
@@ -66,6 +70,34 @@ class TestUniversalGapFiller:
             assert isinstance(gaps, list)
             assert len(gaps) > 0
 
+    def test_detect_all_gaps_records(self):
+        """Test gap records for unsorted input with commented headers."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dates = pd.date_range("2024-01-01", periods=100, freq="1h")
+            sample_data = pd.DataFrame(
+                {"date": dates, "open": [100.0] * 100, "close": [102.0] * 100}
+            ).drop([10, 11, 12, 50])
+
+            csv_file = Path(temp_dir) / "test_data.csv"
+            with open(csv_file, "w") as f:
+                f.write("# Binance Spot Market Data\n#\n")
+                sample_data.iloc[::-1].to_csv(f, index=False)
+
+            gap_filler = UniversalGapFiller()
+            gaps = gap_filler.detect_all_gaps(csv_file, "1h")
+
+            assert len(gaps) == 2
+            assert gaps[0] == {
+                "position": 10,
+                "start_time": pd.Timestamp("2024-01-01 10:00:00"),
+                "end_time": pd.Timestamp("2024-01-01 13:00:00"),
+                "duration": pd.Timedelta(hours=4),
+                "expected_interval": timedelta(hours=1),
+            }
+            assert gaps[1]["position"] == 47
+            assert gaps[1]["start_time"] == pd.Timestamp("2024-01-03 02:00:00")
+            assert gaps[1]["end_time"] == pd.Timestamp("2024-01-03 03:00:00")
+
     def test_fill_gaps_no_gaps(self):
         """Test gap filling when no gaps exist."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -124,6 +156,284 @@ class TestUniversalGapFiller:
                 # Expected to handle invalid data gracefully
                 assert isinstance(e, (ValueError, KeyError, AttributeError))
 
+    def test_process_file_fills_all_gaps_with_one_write(self, binance_stub_server):
+        """Test that every gap is fetched and the file is rewritten exactly once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dates = pd.date_range("2024-01-01", periods=48, freq="1h")
+            full_data = pd.DataFrame(
+                {
+                    "date": dates.strftime("%Y-%m-%d %H:%M:%S"),
+                    "open": [100.0] * 48,
+                    "high": [105.0] * 48,
+                    "low": [95.0] * 48,
+                    "close": [102.0] * 48,
+                    "volume": [1000.0] * 48,
+                    "close_time": (dates + pd.Timedelta("59min59s")).strftime("%Y-%m-%d %H:%M:%S"),
+                    "quote_asset_volume": [10000.0] * 48,
+                    "number_of_trades": [50] * 48,
+                    "taker_buy_base_asset_volume": [500.0] * 48,
+                    "taker_buy_quote_asset_volume": [5000.0] * 48,
+                }
+            )
+            csv_file = Path(temp_dir) / "BTCUSDT_1h_data.csv"
+            with open(csv_file, "w") as f:
+                f.write("# Binance Spot Market Data v2.10.0\n#\n")
+                full_data.drop([5, 10, 11, 30]).to_csv(f, index=False)
+
+            original_write = AtomicCSVOperations.write_dataframe_atomic
+            gap_filler = UniversalGapFiller()
+            gap_filler.binance_base_url = binance_stub_server.url
+            gap_filler.archive_base_url = binance_stub_server.archive_base_url
+            with patch.object(
+                AtomicCSVOperations,
+                "write_dataframe_atomic",
+                autospec=True,
+                side_effect=original_write,
+            ) as atomic_write:
+                result = gap_filler.process_file(csv_file, "1h")
+
+            # Both gap days come from daily archives - no REST weight spent
+            assert binance_stub_server.archive_requests == [
+                "BTCUSDT-1h-2024-01-01.zip",
+                "BTCUSDT-1h-2024-01-02.zip",
+            ]
+            assert binance_stub_server.requests == []
+            assert atomic_write.call_count == 1
+            assert result["gaps_detected"] == 3
+            assert result["gaps_filled"] == 3
+            assert result["gaps_failed"] == 0
+
+            with open(csv_file) as f:
+                assert f.readline() == "# Binance Spot Market Data v2.10.0\n"
+            filled = pd.read_csv(csv_file, comment="#", dtype={"date": str})
+            assert filled["date"].tolist() == full_data["date"].tolist()
+            assert gap_filler.detect_all_gaps(csv_file, "1h") == []
+
+    def test_fetch_binance_data_paginates_long_gaps(self, binance_stub_server):
+        """Test that gaps over 1000 bars are fetched page by page and stitched in order."""
+        gap_filler = UniversalGapFiller(max_concurrent_requests=2)
+        gap_filler.binance_base_url = binance_stub_server.url
+        start_time = datetime(2024, 1, 1)
+        end_time = start_time + timedelta(minutes=2500)
+
+        candles = gap_filler.fetch_binance_data(
+            start_time, end_time, "1m", "BTCUSDT", enhanced_format=True
+        )
+
+        assert len(binance_stub_server.requests) == 3
+        assert len(candles) == 2500
+        assert candles[0]["timestamp"] == "2024-01-01 00:00:00"
+        assert candles[-1]["timestamp"] == "2024-01-02 17:39:00"
+        timestamps = [candle["timestamp"] for candle in candles]
+        assert timestamps == sorted(set(timestamps))
+
+    def test_process_file_reports_unfillable_gaps(self, binance_stub_server):
+        """Test that exchange outages are registered once and skipped on later runs."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dates = pd.date_range("2024-01-01", periods=24, freq="1h")
+            sample_data = pd.DataFrame(
+                {
+                    "date": dates.strftime("%Y-%m-%d %H:%M:%S"),
+                    "open": [100.0] * 24,
+                    "high": [105.0] * 24,
+                    "low": [95.0] * 24,
+                    "close": [102.0] * 24,
+                    "volume": [1000.0] * 24,
+                }
+            ).drop([4, 15])
+            csv_file = Path(temp_dir) / "ETHUSDT_1h_data.csv"
+            sample_data.to_csv(csv_file, index=False)
+
+            # The exchange has no bar for the second gap (an outage)
+            binance_stub_server.missing_open_times.add(
+                int(datetime(2024, 1, 1, 15).timestamp() * 1000)
+            )
+            gap_filler = UniversalGapFiller()
+            gap_filler.binance_base_url = binance_stub_server.url
+            gap_filler.archive_base_url = binance_stub_server.archive_base_url
+            result = gap_filler.process_file(csv_file, "1h")
+
+            assert result["gaps_detected"] == 2
+            assert result["gaps_filled"] == 1
+            assert result["gaps_failed"] == 0
+            assert result["gaps_unfillable"] == 1
+            assert result["success_rate"] == 100.0
+            assert len(pd.read_csv(csv_file)) == 23
+
+            registered = DatasetCatalog(temp_dir).find_unfillable_gaps("ETHUSDT", "1h")
+            assert [(gap.gap_start, gap.gap_end) for gap in registered] == [
+                ("2024-01-01 15:00:00", "2024-01-01 16:00:00")
+            ]
+
+            # The confirmed outage is not refetched on the next run
+            binance_stub_server.requests.clear()
+            binance_stub_server.archive_requests.clear()
+            rerun = gap_filler.process_file(csv_file, "1h")
+
+            assert rerun["gaps_detected"] == 1
+            assert rerun["gaps_unfillable"] == 1
+            assert rerun["gaps_failed"] == 0
+            assert binance_stub_server.requests == []
+            assert binance_stub_server.archive_requests == []
+
+            # Stale confirmations are revalidated and refreshed
+            revalidating_filler = UniversalGapFiller(unfillable_gap_max_age=timedelta(0))
+            revalidating_filler.binance_base_url = binance_stub_server.url
+            revalidating_filler.archive_base_url = binance_stub_server.archive_base_url
+            revalidated = revalidating_filler.process_file(csv_file, "1h")
+
+            assert revalidated["gaps_unfillable"] == 1
+            assert binance_stub_server.archive_requests == ["ETHUSDT-1h-2024-01-01.zip"]
+
+    def test_unconfirmed_empty_gaps_are_not_registered(self, binance_stub_server):
+        """Test that recent gaps and gaps REST still has bars for are retried, not registered."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # A recent gap: Binance may still publish the bar, so it is only retried
+            recent_start = datetime.now().replace(minute=0, second=0, microsecond=0)
+            dates = pd.date_range(recent_start - timedelta(hours=30), periods=24, freq="1h")
+            sample_data = pd.DataFrame(
+                {
+                    "date": dates.strftime("%Y-%m-%d %H:%M:%S"),
+                    "open": [100.0] * 24,
+                    "high": [105.0] * 24,
+                    "low": [95.0] * 24,
+                    "close": [102.0] * 24,
+                    "volume": [1000.0] * 24,
+                }
+            )
+            recent_file = Path(temp_dir) / "BTCUSDT_1h_data.csv"
+            sample_data.drop([10]).to_csv(recent_file, index=False)
+            binance_stub_server.missing_open_times.add(
+                int(dates[10].to_pydatetime().timestamp() * 1000)
+            )
+
+            gap_filler = UniversalGapFiller(use_daily_archives=False)
+            gap_filler.binance_base_url = binance_stub_server.url
+            result = gap_filler.process_file(recent_file, "1h")
+
+            assert result["gaps_failed"] == 1
+            assert result["gaps_unfillable"] == 0
+            assert len(binance_stub_server.requests) == 1
+            assert DatasetCatalog(temp_dir).find_unfillable_gaps() == []
+
+            # An empty archive answer the REST re-query contradicts is not an outage
+            dates = pd.date_range("2024-01-01", periods=24, freq="1h")
+            sample_data["date"] = dates.strftime("%Y-%m-%d %H:%M:%S")
+            archive_file = Path(temp_dir) / "ETHUSDT_1h_data.csv"
+            sample_data.drop([4]).to_csv(archive_file, index=False)
+
+            gap_filler = UniversalGapFiller()
+            gap_filler.binance_base_url = binance_stub_server.url
+            with patch.object(
+                gap_filler, "_download_daily_archives", return_value={dates[4].date(): []}
+            ):
+                result = gap_filler.process_file(archive_file, "1h")
+
+            assert result["gaps_failed"] == 1
+            assert result["gaps_unfillable"] == 0
+            assert DatasetCatalog(temp_dir).find_unfillable_gaps() == []
+
+    def test_process_file_uses_rest_for_unpublished_archive_days(self, binance_stub_server):
+        """Test that only gap days without a daily archive are fetched via REST."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dates = pd.date_range("2025-03-01", periods=72, freq="1h")
+            sample_data = pd.DataFrame(
+                {
+                    "date": dates.strftime("%Y-%m-%d %H:%M:%S"),
+                    "open": [100.0] * 72,
+                    "high": [105.0] * 72,
+                    "low": [95.0] * 72,
+                    "close": [102.0] * 72,
+                    "volume": [1000.0] * 72,
+                }
+            )
+            csv_file = Path(temp_dir) / "SOLUSDT_1h_data.csv"
+            # One gap spanning the 1st/2nd day boundary, one on the 3rd
+            sample_data.drop([22, 23, 24, 25, 60]).to_csv(csv_file, index=False)
+
+            binance_stub_server.unpublished_archive_days.add(datetime(2025, 3, 2).date())
+            gap_filler = UniversalGapFiller()
+            gap_filler.binance_base_url = binance_stub_server.url
+            gap_filler.archive_base_url = binance_stub_server.archive_base_url
+            result = gap_filler.process_file(csv_file, "1h")
+
+            assert result["gaps_filled"] == 2
+            assert sorted(binance_stub_server.archive_requests) == [
+                "SOLUSDT-1h-2025-03-01.zip",
+                "SOLUSDT-1h-2025-03-02.zip",
+                "SOLUSDT-1h-2025-03-03.zip",
+            ]
+            # Only the 2025-03-02 part of the first gap needed the API
+            assert len(binance_stub_server.requests) == 1
+            rest_start = int(binance_stub_server.requests[0]["startTime"])
+            assert rest_start == int(datetime(2025, 3, 2).timestamp() * 1000)
+
+            filled = pd.read_csv(csv_file)
+            assert filled["date"].tolist() == sample_data["date"].tolist()
+
+    def test_process_files_in_parallel(self, binance_stub_server):
+        """Test that files are filled concurrently and results keep input order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_files = []
+            for file_index, symbol in enumerate(["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT"]):
+                dates = pd.date_range("2024-02-01", periods=48, freq="1h")
+                sample_data = pd.DataFrame(
+                    {
+                        "date": dates.strftime("%Y-%m-%d %H:%M:%S"),
+                        "open": [100.0] * 48,
+                        "high": [105.0] * 48,
+                        "low": [95.0] * 48,
+                        "close": [102.0] * 48,
+                        "volume": [1000.0] * 48,
+                    }
+                )
+                csv_file = Path(temp_dir) / f"{symbol}_1h_data.csv"
+                # File i has i + 1 single-bar gaps
+                sample_data.drop([3 + 10 * gap for gap in range(file_index + 1)]).to_csv(
+                    csv_file, index=False
+                )
+                csv_files.append((csv_file, "1h"))
+
+            gap_filler = UniversalGapFiller(use_daily_archives=False)
+            gap_filler.binance_base_url = binance_stub_server.url
+            results = gap_filler.process_files(csv_files, max_workers=4)
+
+            assert [result["gaps_detected"] for result in results] == [1, 2, 3, 4]
+            assert [result["gaps_filled"] for result in results] == [1, 2, 3, 4]
+            assert len(binance_stub_server.requests) == 10
+            for csv_file, _ in csv_files:
+                assert len(pd.read_csv(csv_file)) == 48
+
+    def test_process_files_isolates_file_errors(self, binance_stub_server):
+        """Test that a file that cannot be read does not abort the other files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dates = pd.date_range("2024-02-01", periods=24, freq="1h")
+            sample_data = pd.DataFrame(
+                {
+                    "date": dates.strftime("%Y-%m-%d %H:%M:%S"),
+                    "open": [100.0] * 24,
+                    "high": [105.0] * 24,
+                    "low": [95.0] * 24,
+                    "close": [102.0] * 24,
+                    "volume": [1000.0] * 24,
+                }
+            )
+            good_file = Path(temp_dir) / "BTCUSDT_1h_data.csv"
+            sample_data.drop([5]).to_csv(good_file, index=False)
+            broken_file = Path(temp_dir) / "ETHUSDT_1h_data.csv"
+            broken_file.write_text("timestamp,price\n1,2\n")  # No date column
+
+            gap_filler = UniversalGapFiller(use_daily_archives=False)
+            gap_filler.binance_base_url = binance_stub_server.url
+            results = gap_filler.process_files(
+                [(broken_file, "1h"), (good_file, "1h")], max_workers=2
+            )
+
+            assert "error" in results[0]
+            assert results[0]["gaps_filled"] == 0
+            assert results[1]["gaps_filled"] == 1
+            assert len(pd.read_csv(good_file)) == 24
+
     def test_extract_symbol_from_filename_standard_format(self):
         """Test symbol extraction from standard filename format."""
         gap_filler = UniversalGapFiller()
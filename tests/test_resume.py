@@ -0,0 +1,401 @@
+"""Tests for resumable collection: task staging and checkpoint management."""
+
+import tempfile
+from argparse import Namespace
+from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from gapless_crypto_data.cli import collect_data
+from gapless_crypto_data.collectors.binance_public_data_collector import BinancePublicDataCollector
+from gapless_crypto_data.collectors.concurrent_collection_orchestrator import (
+    ConcurrentCollectionOrchestrator,
+)
+from gapless_crypto_data.collectors.httpx_downloader import DownloadResult
+from gapless_crypto_data.resume import (
+    IntelligentCheckpointManager,
+    TaskStagingArea,
+    period_is_closed,
+)
+
+
+def _raw_month(year_month: str):
+    """Raw Binance 1d archive rows (millisecond timestamps) for one month."""
+    start = pd.Timestamp(f"{year_month}-01")
+    rows = []
+    for i, ts in enumerate(pd.date_range(start, start + pd.offsets.MonthEnd(0), freq="1D")):
+        open_ms = int(ts.timestamp() * 1000)
+        price = 100.0 + i
+        rows.append(
+            [
+                str(open_ms),
+                str(price),
+                str(price + 1),
+                str(price - 1),
+                str(price + 0.5),
+                "10.0",
+                str(open_ms + 86_399_999),
+                "1000.0",
+                "50",
+                "5.0",
+                "500.0",
+                "0",
+            ]
+        )
+    return rows
+
+
+class TestTaskStaging:
+    """Test suite for TaskStagingArea."""
+
+    def test_save_load_roundtrip(self):
+        """Test that staged rows keep their values and types."""
+        rows = [["2024-01-01 00:00:00", 100.5, 101.0, 99.0, 100.25, 10.0, "x", 1.0, 50, 5.0, 6.0]]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            staging = TaskStagingArea(temp_dir)
+            staging.save("BTCUSDT", "1h", "2024-01", rows)
+
+            assert staging.completed_periods("BTCUSDT", "1h") == {"2024-01"}
+            assert staging.completed_periods("BTCUSDT", "4h") == set()
+            assert staging.load("BTCUSDT", "1h", "2024-01") == rows
+            assert staging.load("BTCUSDT", "1h", "2024-02") is None
+            assert not list(Path(temp_dir).rglob("*.tmp"))
+
+    def test_unreadable_task_is_discarded(self):
+        """Test that a corrupt staged file is treated as not staged."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            staging = TaskStagingArea(temp_dir)
+            path = staging.save("BTCUSDT", "1h", "2024-01", [["row"]])
+            path.write_text('{"period": "2024-01", "rows": [[')
+
+            assert staging.load("BTCUSDT", "1h", "2024-01") is None
+            assert staging.completed_periods("BTCUSDT", "1h") == set()
+
+    def test_clear(self):
+        """Test that clearing removes only the given symbol and timeframe."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            staging = TaskStagingArea(temp_dir)
+            staging.save("BTCUSDT", "1h", "2024-01", [["row"]])
+            staging.save("BTCUSDT", "4h", "2024-01", [["row"]])
+
+            staging.clear("BTCUSDT", "1h")
+
+            assert staging.completed_periods("BTCUSDT", "1h") == set()
+            assert staging.completed_periods("BTCUSDT", "4h") == {"2024-01"}
+
+    @pytest.mark.parametrize(
+        "period,expected",
+        [("2024-05", True), ("2024-06", False), ("2024-06-14", True), ("2024-06-15", False)],
+    )
+    def test_period_is_closed(self, period, expected):
+        """Test that only periods ending before today are closed."""
+        assert period_is_closed(period, today=date(2024, 6, 15)) is expected
+
+
+class TestTaskLevelResume:
+    """Test resuming interrupted collections from staged download tasks."""
+
+    def _collector(self, output_dir):
+        return BinancePublicDataCollector(
+            symbol="BTCUSDT",
+            start_date="2023-01-01",
+            end_date="2023-03-31",
+            output_dir=output_dir,
+        )
+
+    def test_collect_timeframe_data_resumes_from_staging(self):
+        """Test that months finished before a crash are not downloaded again."""
+
+        def crash_in_march(url, zip_filename):
+            if "2023-03" in zip_filename:
+                raise KeyboardInterrupt
+            return _raw_month(zip_filename[-11:-4])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector = self._collector(temp_dir)
+            with patch.object(collector, "download_and_extract_month", side_effect=crash_in_march):
+                with pytest.raises(KeyboardInterrupt):
+                    collector.collect_timeframe_data("1d")
+            assert collector.task_staging.completed_periods("BTCUSDT", "1d") == {
+                "2023-01",
+                "2023-02",
+            }
+
+            collector = self._collector(temp_dir)
+            with patch.object(
+                collector, "download_and_extract_month", return_value=_raw_month("2023-03")
+            ) as mock_download:
+                result = collector.collect_timeframe_data("1d")
+
+            assert [call.args[1] for call in mock_download.call_args_list] == [
+                "BTCUSDT-1d-2023-03.zip"
+            ]
+            df = result["dataframe"]
+            assert len(df) == 90
+            assert df["date"].is_monotonic_increasing
+            assert df["open"].iloc[0] == 100.0
+            # Staged months are dropped once the output file is written
+            assert collector.task_staging.completed_periods("BTCUSDT", "1d") == set()
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_resumes_from_staging(self):
+        """Test that the orchestrator downloads only tasks missing from staging."""
+        requested = []
+
+        async def interrupted_download(tasks, progress_callback=None, result_callback=None):
+            requested.append([task.period_identifier for task in tasks])
+            results = []
+            for task in tasks:
+                if task.period_identifier == "2023-03":
+                    raise RuntimeError("connection lost")
+                result = DownloadResult(
+                    task=task, success=True, data=_raw_month(task.period_identifier)
+                )
+                result_callback(result)
+                results.append(result)
+            return results
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            orchestrator = ConcurrentCollectionOrchestrator(
+                symbol="BTCUSDT",
+                start_date=datetime(2023, 1, 1),
+                end_date=datetime(2023, 3, 31),
+                output_dir=temp_dir,
+            )
+            with patch.object(orchestrator, "download_manager") as manager:
+                manager.download_tasks.side_effect = interrupted_download
+                first = await orchestrator.collect_timeframe_concurrent("1d")
+
+                async def remaining_download(tasks, progress_callback=None, result_callback=None):
+                    requested.append([task.period_identifier for task in tasks])
+                    return [
+                        DownloadResult(task=task, success=True, data=_raw_month("2023-03"))
+                        for task in tasks
+                    ]
+
+                manager.download_tasks.side_effect = remaining_download
+                second = await orchestrator.collect_timeframe_concurrent("1d")
+
+        assert not first.success
+        assert requested == [["2023-01", "2023-02", "2023-03"], ["2023-03"]]
+        assert second.success
+        assert second.resumed_tasks == 2
+        assert second.total_bars == 90
+        assert second.processed_data[0][0] == _raw_month("2023-01")[0][0]
+
+
+class TestCheckpointIdentity:
+    """Test that checkpoints are keyed by the collection parameters."""
+
+    PARAMS = {"start_date": "2023-01-01", "end_date": "2023-03-31", "output_dir": "./data"}
+
+    def test_checkpoint_key_is_deterministic(self):
+        """Test that equivalent parameters map to the same key and others do not."""
+        key = IntelligentCheckpointManager.checkpoint_key(
+            ["BTCUSDT", "ETHUSDT"], ["1h", "4h"], self.PARAMS
+        )
+
+        assert key == IntelligentCheckpointManager.checkpoint_key(
+            ["ETHUSDT", "BTCUSDT"],
+            ["4h", "1h"],
+            dict(self.PARAMS, output_dir=str(Path("data").resolve())),
+        )
+        assert key != IntelligentCheckpointManager.checkpoint_key(
+            ["BTCUSDT", "ETHUSDT"], ["1h", "4h"], dict(self.PARAMS, end_date="2023-04-30")
+        )
+        assert key != IntelligentCheckpointManager.checkpoint_key(
+            ["BTCUSDT"], ["1h", "4h"], self.PARAMS
+        )
+
+    def test_new_manager_finds_previous_session(self):
+        """Test that a restarted collection skips completed symbols and timeframes."""
+        symbols, timeframes = ["BTCUSDT", "ETHUSDT"], ["1h", "4h"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = IntelligentCheckpointManager(cache_dir=temp_dir)
+            first.get_resume_plan(symbols, timeframes, self.PARAMS)
+            first.save_checkpoint({"collection_parameters": self.PARAMS})
+            first.mark_symbol_start("BTCUSDT", timeframes)
+            first.mark_timeframe_complete("BTCUSDT", "1h", Path("a.csv"), 1.0)
+            first.mark_timeframe_complete("BTCUSDT", "4h", Path("b.csv"), 1.0)
+            first.mark_symbol_complete("BTCUSDT")
+            first.mark_symbol_start("ETHUSDT", timeframes)
+            first.mark_timeframe_complete("ETHUSDT", "1h", Path("c.csv"), 1.0)
+
+            second = IntelligentCheckpointManager(cache_dir=temp_dir)
+            plan = second.get_resume_plan(symbols, timeframes, self.PARAMS)
+
+            assert second.session_id == first.session_id
+            assert plan["resume_required"]
+            assert plan["remaining_symbols"] == ["ETHUSDT"]
+            assert plan["remaining_timeframes"] == {"ETHUSDT": ["4h"]}
+            assert plan["total_progress"] == 75.0
+
+            # Restarting the symbol keeps its completed timeframes
+            second.mark_symbol_start("ETHUSDT", timeframes)
+            assert second.completed_timeframes("ETHUSDT") == ["1h"]
+
+            # A different collection does not see this state
+            other = IntelligentCheckpointManager(cache_dir=temp_dir)
+            plan = other.get_resume_plan(["SOLUSDT"], timeframes, self.PARAMS)
+            assert not plan["resume_required"]
+
+    def test_cli_resumes_interrupted_collection(self):
+        """Test that rerunning the CLI collects only what the crashed run missed."""
+        calls = []
+
+        class FakeCollector:
+            crash = True
+
+            def __init__(self, symbol, start_date, end_date, output_dir):
+                self.symbol = symbol
+                self.output_dir = Path(output_dir)
+
+            def collect_timeframe_data(self, timeframe):
+                calls.append((self.symbol, timeframe))
+                if FakeCollector.crash and (self.symbol, timeframe) == ("ETHUSDT", "4h"):
+                    raise KeyboardInterrupt
+                filepath = self.output_dir / f"{self.symbol}_{timeframe}.csv"
+                filepath.write_text("date\n")
+                return {"filepath": filepath}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            args = Namespace(
+                symbol="BTCUSDT,ETHUSDT",
+                timeframes="1h,4h",
+                start="2023-01-01",
+                end="2023-03-31",
+                output_dir=temp_dir,
+                resume=True,
+                checkpoint_dir=str(Path(temp_dir) / "checkpoints"),
+                clear_checkpoints=False,
+                streaming=False,
+                update=False,
+            )
+            with patch("gapless_crypto_data.cli.BinancePublicDataCollector", FakeCollector):
+                with pytest.raises(KeyboardInterrupt):
+                    collect_data(args)
+                FakeCollector.crash = False
+                calls.clear()
+                assert collect_data(args) == 0
+
+            assert calls == [("ETHUSDT", "4h")]
+            # A finished collection leaves nothing to resume
+            assert not list((Path(temp_dir) / "checkpoints").glob("session_*.json"))
+
+
+class TestCheckpointJournal:
+    """Test the append-only checkpoint journal and its compaction."""
+
+    PARAMS = {"start_date": "2023-01-01", "end_date": "2023-03-31", "output_dir": "./data"}
+
+    def _manager(self, temp_dir, **kwargs):
+        manager = IntelligentCheckpointManager(cache_dir=temp_dir, **kwargs)
+        manager.get_resume_plan(["BTCUSDT"], ["1h", "4h"], self.PARAMS)
+        return manager
+
+    def _reloaded(self, temp_dir):
+        manager = self._manager(temp_dir)
+        return manager.progress_data
+
+    def test_updates_append_to_journal(self):
+        """Test that each progress update is one appended line, not a snapshot rewrite."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = self._manager(temp_dir)
+            manager.save_checkpoint({"collection_parameters": self.PARAMS})
+            manager.mark_symbol_start("BTCUSDT", ["1h", "4h"])
+            manager.mark_timeframe_complete("BTCUSDT", "1h", Path("a.csv"), 1.5)
+
+            assert not manager.checkpoint_file.exists()
+            assert len(manager.journal_file.read_text().splitlines()) == 3
+
+            state = self._reloaded(temp_dir)
+            assert state["collection_parameters"] == self.PARAMS
+            assert state["total_datasets_collected"] == 1
+            assert (
+                state["symbols_in_progress"]["BTCUSDT"]["completed_timeframes"][0]
+                == (
+                    manager.progress_data["symbols_in_progress"]["BTCUSDT"]["completed_timeframes"][
+                        0
+                    ]
+                )
+            )
+            manager.close()
+
+    def test_compaction_and_replay(self):
+        """Test that compaction writes the snapshot and recovery replays the rest."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = self._manager(temp_dir, compact_every=3)
+            manager.save_checkpoint({"collection_parameters": self.PARAMS})
+            manager.mark_symbol_start("BTCUSDT", ["1h", "4h"])
+            manager.mark_timeframe_complete("BTCUSDT", "1h", Path("a.csv"), 1.0)
+
+            # Third update triggered compaction
+            assert manager.checkpoint_file.exists()
+            assert not manager.journal_file.exists()
+
+            manager.mark_timeframe_complete("BTCUSDT", "4h", Path("b.csv"), 1.0)
+            manager.mark_symbol_complete("BTCUSDT")
+            assert len(manager.journal_file.read_text().splitlines()) == 2
+            manager.close()
+
+            state = self._reloaded(temp_dir)
+            assert state["symbols_completed"] == ["BTCUSDT"]
+            assert state["symbols_in_progress"] == {}
+            assert state["total_datasets_collected"] == 2
+            assert state["journal_seq"] == 5
+
+    def test_crash_between_snapshot_and_truncate(self):
+        """Test that journal lines already in the snapshot are not applied twice."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = self._manager(temp_dir, compact_every=4)
+            manager.save_checkpoint({"collection_parameters": self.PARAMS})
+            manager.mark_symbol_start("BTCUSDT", ["1h", "4h"])
+            manager.mark_timeframe_complete("BTCUSDT", "1h", Path("a.csv"), 1.0)
+            journal = manager.journal_file.read_bytes()
+            manager.mark_timeframe_complete("BTCUSDT", "4h", Path("b.csv"), 1.0)
+            manager.close()
+
+            # The snapshot was replaced but the old journal survived the crash
+            manager.journal_file.write_bytes(journal)
+
+            state = self._reloaded(temp_dir)
+            assert state["total_datasets_collected"] == 2
+            assert len(state["symbols_in_progress"]["BTCUSDT"]["completed_timeframes"]) == 2
+
+    def test_torn_final_line_is_dropped(self):
+        """Test that a partially written last line is cut off before appending."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = self._manager(temp_dir)
+            manager.save_checkpoint({"collection_parameters": self.PARAMS})
+            manager.mark_symbol_start("BTCUSDT", ["1h", "4h"])
+            manager.close()
+            with open(manager.journal_file, "a") as f:
+                f.write('{"op": "timeframe_complete", "seq": 3, "symb')
+
+            resumed = self._manager(temp_dir)
+            assert resumed.progress_data["total_datasets_collected"] == 0
+            resumed.mark_timeframe_complete("BTCUSDT", "1h", Path("a.csv"), 1.0)
+            resumed.close()
+
+            state = self._reloaded(temp_dir)
+            assert state["total_datasets_collected"] == 1
+            assert state["journal_seq"] == 3
+
+    def test_fsync_batching(self):
+        """Test that the journal is fsynced once per batch of updates."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = self._manager(temp_dir, fsync_every=4)
+            with patch("gapless_crypto_data.resume.intelligent_checkpointing.os.fsync") as fsync:
+                for i in range(9):
+                    manager.save_checkpoint({"counter": i})
+                assert fsync.call_count == 2
+                manager.close()
+                assert fsync.call_count == 3
+
+    def test_invalid_batch_sizes(self):
+        """Test that non-positive fsync and compaction intervals are rejected."""
+        with pytest.raises(ValueError):
+            IntelligentCheckpointManager(cache_dir=".", fsync_every=0)
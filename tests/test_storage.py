@@ -0,0 +1,489 @@
+"""Test columnar storage layout, time-range reads and the dataset catalog."""
+
+import json
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import gapless_crypto_data as gcd
+from gapless_crypto_data.storage import (
+    CATALOG_FILENAME,
+    DatasetCatalog,
+    read_arrow_ipc,
+    read_arrow_ipc_table,
+    read_parquet_range,
+    write_arrow_ipc,
+    write_partitioned_parquet,
+)
+
+
+def _ohlcv_frame(start: str, periods: int, freq: str) -> pd.DataFrame:
+    """Build a minimal OHLCV frame with a datetime date column."""
+    prices = np.linspace(100.0, 200.0, periods)
+    return pd.DataFrame(
+        {
+            "date": pd.date_range(start, periods=periods, freq=freq),
+            "open": prices,
+            "high": prices + 1.0,
+            "low": prices - 1.0,
+            "close": prices + 0.5,
+            "volume": np.full(periods, 10.0),
+        }
+    )
+
+
+class TestPartitionedParquet:
+    """Test suite for calendar-aligned Parquet row groups."""
+
+    def test_monthly_row_groups(self):
+        """Test that hourly data gets one row group per calendar month."""
+        df = _ohlcv_frame("2024-01-01", 24 * 91, "1h")  # Jan-Mar 2024
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "hourly.parquet"
+            write_partitioned_parquet(df, path)
+
+            metadata = pq.ParquetFile(path).metadata
+            assert metadata.num_row_groups == 3
+            first_group = metadata.row_group(0).column(0).statistics
+            assert pd.Timestamp(first_group.min) == pd.Timestamp("2024-01-01")
+            assert pd.Timestamp(first_group.max) == pd.Timestamp("2024-01-31 23:00:00")
+
+    def test_daily_row_groups_for_minute_data(self):
+        """Test that 1m data gets one row group per day."""
+        df = _ohlcv_frame("2024-01-01", 1440 * 5, "1min")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "minute.parquet"
+            write_partitioned_parquet(df, path)
+
+            assert pq.ParquetFile(path).metadata.num_row_groups == 5
+
+    def test_unsorted_input_is_sorted(self):
+        """Test that rows are written in date order."""
+        df = _ohlcv_frame("2024-01-01", 100, "1h").sample(frac=1, random_state=7)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "shuffled.parquet"
+            write_partitioned_parquet(df, path)
+
+            loaded = pd.read_parquet(path)
+            assert loaded["date"].is_monotonic_increasing
+            assert len(loaded) == 100
+
+
+class TestReadParquetRange:
+    """Test suite for row-group pruned range reads."""
+
+    def test_range_reads_only_matching_row_groups(self):
+        """Test that a one-week range decodes a single daily row group per day."""
+        df = _ohlcv_frame("2024-01-01", 1440 * 31, "1min")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "minute.parquet"
+            write_partitioned_parquet(df, path)
+
+            with patch.object(
+                pq.ParquetFile,
+                "read_row_groups",
+                autospec=True,
+                side_effect=pq.ParquetFile.read_row_groups,
+            ) as mock_read:
+                week = read_parquet_range(path, start="2024-01-08", end="2024-01-14")
+
+            requested_groups = list(mock_read.call_args[0][1])
+            assert requested_groups == list(range(7, 14))
+            assert len(week) == 1440 * 7
+            assert week["date"].min() == pd.Timestamp("2024-01-08")
+            assert week["date"].max() == pd.Timestamp("2024-01-14 23:59:00")
+
+    def test_column_projection(self):
+        """Test that only requested columns are returned."""
+        df = _ohlcv_frame("2024-01-01", 24 * 60, "1h")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "hourly.parquet"
+            write_partitioned_parquet(df, path)
+
+            result = read_parquet_range(
+                path, start="2024-02-01 06:00:00", end="2024-02-01 08:00:00", columns=["close"]
+            )
+
+            assert list(result.columns) == ["close"]
+            assert len(result) == 3
+
+    def test_empty_range(self):
+        """Test that a range outside the file returns an empty frame."""
+        df = _ohlcv_frame("2024-01-01", 48, "1h")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "hourly.parquet"
+            write_partitioned_parquet(df, path)
+
+            result = read_parquet_range(path, start="2025-01-01")
+
+            assert result.empty
+            assert list(result.columns) == list(df.columns)
+
+    def test_range_requires_date_column(self):
+        """Test that range reads reject files without a date column."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "nodate.parquet"
+            pd.DataFrame({"close": [1.0, 2.0]}).to_parquet(path, index=False)
+
+            with pytest.raises(ValueError):
+                read_parquet_range(path, start="2024-01-01")
+
+    def test_api_round_trip(self):
+        """Test save_parquet/load_parquet with range and columns."""
+        df = _ohlcv_frame("2024-01-01", 24 * 10, "1h")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = str(Path(temp_dir) / "api.parquet")
+            gcd.save_parquet(df, path)
+
+            pd.testing.assert_frame_equal(gcd.load_parquet(path), df)
+
+            day = gcd.load_parquet(
+                path, start="2024-01-05", end="2024-01-05", columns=["date", "open"]
+            )
+            assert len(day) == 24
+            assert list(day.columns) == ["date", "open"]
+
+
+class TestArrowIPC:
+    """Test suite for Arrow IPC output and memory-mapped loading."""
+
+    def test_round_trip_uncompressed(self):
+        """Test that uncompressed files round-trip and load from a memory map."""
+        df = _ohlcv_frame("2024-01-01", 500, "1min")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "minute.arrow"
+            write_arrow_ipc(df, path)
+
+            pd.testing.assert_frame_equal(read_arrow_ipc(path), df)
+
+            # Uncompressed buffers are views over the mapped file, not heap copies
+            allocated_before = pa.total_allocated_bytes()
+            table = read_arrow_ipc_table(path, columns=["close"])
+            assert table.num_rows == 500
+            assert pa.total_allocated_bytes() == allocated_before
+
+    def test_round_trip_lz4(self):
+        """Test LZ4-compressed files with column selection."""
+        df = _ohlcv_frame("2024-01-01", 500, "1min")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "minute_lz4.arrow"
+            write_arrow_ipc(df, path, compression="lz4")
+
+            result = read_arrow_ipc(path, columns=["date", "close"])
+
+            assert list(result.columns) == ["date", "close"]
+            pd.testing.assert_frame_equal(result, df[["date", "close"]])
+
+    def test_read_without_memory_map_closes_file(self):
+        """Test that non-mapped reads release their file handle."""
+        df = _ohlcv_frame("2024-01-01", 100, "1h")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "hourly.arrow"
+            write_arrow_ipc(df, path)
+
+            opened = []
+            real_os_file = pa.OSFile
+
+            def tracking_os_file(*args, **kwargs):
+                handle = real_os_file(*args, **kwargs)
+                opened.append(handle)
+                return handle
+
+            with patch.object(pa, "OSFile", side_effect=tracking_os_file):
+                result = read_arrow_ipc(path, memory_map=False)
+
+            pd.testing.assert_frame_equal(result, df)
+            assert len(opened) == 1
+            assert opened[0].closed
+
+    def test_unsupported_compression(self):
+        """Test that unsupported codecs are rejected."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(ValueError):
+                write_arrow_ipc(
+                    _ohlcv_frame("2024-01-01", 10, "1h"), Path(temp_dir) / "x.arrow", "gzip"
+                )
+
+    def test_api_round_trip(self):
+        """Test save_arrow/load_arrow."""
+        df = _ohlcv_frame("2024-01-01", 48, "1h")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = str(Path(temp_dir) / "api.arrow")
+            gcd.save_arrow(df, path)
+
+            pd.testing.assert_frame_equal(gcd.load_arrow(path), df)
+
+
+class TestDatasetCatalog:
+    """Test suite for the SQLite dataset catalog."""
+
+    def _write_dataset(self, directory: Path, filename: str, rows: int = 24) -> Path:
+        """Write a minimal standard-named CSV dataset."""
+        path = directory / filename
+        _ohlcv_frame("2024-01-01", rows, "1h").to_csv(path, index=False)
+        return path
+
+    def test_record_and_find(self):
+        """Test recording datasets and index-backed lookups."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            path = self._write_dataset(
+                directory, "binance_spot_BTCUSDT-1h_20240101-20240101_v2.10.0.csv"
+            )
+
+            catalog = DatasetCatalog(directory)
+            catalog.record_dataset(
+                path, "BTCUSDT", "1h", "2024-01-01 00:00:00", "2024-01-01 23:00:00", 24, "abc"
+            )
+
+            assert (directory / CATALOG_FILENAME).exists()
+            records = catalog.find(symbol="BTCUSDT", format="csv")
+            assert len(records) == 1
+            assert records[0].path == path
+            assert records[0].timeframe == "1h"
+            assert records[0].row_count == 24
+            assert catalog.find(symbol="ETHUSDT") == []
+            assert catalog.get(path).content_hash == "abc"
+
+    def test_replaces_in_same_transaction(self):
+        """Test that a renamed dataset replaces its previous entry."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            old_path = self._write_dataset(
+                directory, "binance_spot_BTCUSDT-1h_20240101-20240101_v2.10.0.csv"
+            )
+            catalog = DatasetCatalog(directory)
+            catalog.record_dataset(
+                old_path, "BTCUSDT", "1h", "2024-01-01 00:00:00", "2024-01-01 23:00:00", 24, None
+            )
+
+            new_path = old_path.rename(
+                directory / "binance_spot_BTCUSDT-1h_20240101-20240102_v2.10.0.csv"
+            )
+            catalog.record_dataset(
+                new_path,
+                "BTCUSDT",
+                "1h",
+                "2024-01-01 00:00:00",
+                "2024-01-02 23:00:00",
+                48,
+                None,
+                replaces=old_path,
+            )
+
+            assert catalog.get(old_path) is None
+            assert [record.path for record in catalog.find()] == [new_path]
+
+    def test_bootstrap_from_existing_files(self):
+        """Test that an existing directory is indexed from filenames and metadata once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            path = self._write_dataset(
+                directory, "binance_spot_ETHUSDT-4h_20240101-20240131_v2.10.0.csv"
+            )
+            path.with_suffix(".metadata.json").write_text(
+                json.dumps(
+                    {
+                        "date_range": {
+                            "start": "2024-01-01 00:00:00",
+                            "end": "2024-01-31 20:00:00",
+                        },
+                        "actual_bars": 186,
+                        "data_integrity": {"data_hash": "feed"},
+                    }
+                )
+            )
+            self._write_dataset(directory, "notes.csv")
+            self._write_dataset(directory, "ADAUSDT_1d_export.csv")
+
+            catalog = DatasetCatalog.for_directory(directory)
+
+            records = catalog.find(symbol="ETHUSDT")
+            assert len(records) == 1
+            assert records[0].timeframe == "4h"
+            assert records[0].end_time == "2024-01-31 20:00:00"
+            assert records[0].row_count == 186
+
+            # Loose CSV names are indexed when they carry a timeframe; others are skipped
+            exported = catalog.find(symbol="ADAUSDT")
+            assert [(record.symbol, record.timeframe) for record in exported] == [("ADAUSDT", "1d")]
+            assert catalog.find(symbol="NOTES") == []
+            assert catalog.get(directory / "notes.csv") is None
+
+    def test_lookup_reconciles_with_directory(self):
+        """Test that lookups pick up files added or changed after the catalog was created."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            first = self._write_dataset(
+                directory, "binance_spot_BTCUSDT-1h_20240101-20240101_v2.10.0.csv"
+            )
+            catalog = DatasetCatalog.for_directory(directory)
+            assert catalog.record_validation(first, "PERFECT")
+
+            second = self._write_dataset(
+                directory, "binance_spot_ETHUSDT-1h_20240101-20240101_v2.10.0.csv"
+            )
+            loose = self._write_dataset(directory, "SOLUSDT-15m.csv")
+            self._write_dataset(directory, "SOLUSDT-15m.backup_20240101_000000.csv")
+
+            records = DatasetCatalog.for_directory(directory).find(format="csv")
+            assert sorted(record.path for record in records) == sorted([first, second, loose])
+            assert catalog.get(loose).timeframe == "15m"
+            # Unchanged entries keep their validation result
+            assert catalog.get(first).validation_status == "PERFECT"
+
+            # Lookups skip the directory scan while the listing is unchanged
+            with patch.object(catalog, "reconcile") as mock_reconcile:
+                catalog.find()
+                catalog.find_missing(["BTCUSDT"], ["1h"], "2024-01-01", "2024-01-01")
+            mock_reconcile.assert_not_called()
+
+            # A file rewritten in place is re-indexed by an explicit reconcile
+            self._write_dataset(directory, first.name, rows=48)
+            assert catalog.reconcile() == 1
+            assert catalog.get(first).validation_status is None
+            assert catalog.get(first).file_size == first.stat().st_size
+
+            first.unlink()
+            assert first not in [record.path for record in catalog.find()]
+
+    def test_find_missing(self):
+        """Test coverage queries for requested symbol/timeframe ranges."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            path = self._write_dataset(
+                directory, "binance_spot_BTCUSDT-1h_20240101-20240131_v2.10.0.csv"
+            )
+            catalog = DatasetCatalog(directory)
+            catalog.record_dataset(
+                path, "BTCUSDT", "1h", "2024-01-01 00:00:00", "2024-01-31 23:00:00", 744, None
+            )
+
+            assert catalog.find_missing(["BTCUSDT"], ["1h"], "2024-01-01", "2024-01-31") == []
+
+            missing = catalog.find_missing(
+                ["BTCUSDT", "ETHUSDT"], ["1h"], "2024-01-01", "2024-02-29"
+            )
+            assert missing == [
+                {
+                    "symbol": "BTCUSDT",
+                    "timeframe": "1h",
+                    "missing_start": "2024-01-31 23:00:00",
+                    "missing_end": "2024-02-29 23:59:59",
+                    "reason": "ends_early",
+                },
+                {
+                    "symbol": "ETHUSDT",
+                    "timeframe": "1h",
+                    "missing_start": "2024-01-01 00:00:00",
+                    "missing_end": "2024-02-29 23:59:59",
+                    "reason": "not_collected",
+                },
+            ]
+
+    def test_record_validation(self):
+        """Test storing the last validation result."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            path = self._write_dataset(
+                directory, "binance_spot_BTCUSDT-1h_20240101-20240101_v2.10.0.csv"
+            )
+            catalog = DatasetCatalog(directory)
+            catalog.record_dataset(
+                path, "BTCUSDT", "1h", "2024-01-01 00:00:00", "2024-01-01 23:00:00", 24, None
+            )
+
+            assert catalog.record_validation(path, "PERFECT", {"total_errors": 0})
+
+            record = catalog.get(path)
+            assert record.validation_status == "PERFECT"
+            assert record.validation_summary == {"total_errors": 0}
+
+    def test_unfillable_gap_registry(self):
+        """Test registering, matching, aging out and removing unfillable gaps."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            catalog = DatasetCatalog(temp_dir)
+            catalog.record_unfillable_gap(
+                "BTCUSDT",
+                "1m",
+                pd.Timestamp("2024-03-01 10:00:00"),
+                "2024-03-01 10:30:00",
+                reason="No bars returned by Binance",
+            )
+            # Re-confirming refreshes the entry instead of duplicating it
+            catalog.record_unfillable_gap(
+                "BTCUSDT", "1m", "2024-03-01 10:00:00", "2024-03-01 10:30:00"
+            )
+
+            gaps = catalog.find_unfillable_gaps("BTCUSDT", "1m")
+            assert len(gaps) == 1
+            assert gaps[0].gap_start == "2024-03-01 10:00:00"
+            assert gaps[0].gap_end == "2024-03-01 10:30:00"
+
+            assert catalog.is_unfillable_gap(
+                "BTCUSDT", "1m", "2024-03-01 10:05:00", "2024-03-01 10:30:00"
+            )
+            assert not catalog.is_unfillable_gap(
+                "BTCUSDT", "1m", "2024-03-01 09:59:00", "2024-03-01 10:30:00"
+            )
+            assert not catalog.is_unfillable_gap(
+                "BTCUSDT", "5m", "2024-03-01 10:00:00", "2024-03-01 10:30:00"
+            )
+            assert catalog.find_unfillable_gaps("BTCUSDT", "1m", max_age=timedelta(days=1))
+            assert not catalog.is_unfillable_gap(
+                "BTCUSDT", "1m", "2024-03-01 10:00:00", "2024-03-01 10:30:00", max_age=timedelta(0)
+            )
+
+            catalog.remove_unfillable_gap(
+                "BTCUSDT", "1m", "2024-03-01 10:00:00", "2024-03-01 10:30:00"
+            )
+            assert catalog.find_unfillable_gaps() == []
+
+    def test_fill_gaps_uses_catalog(self):
+        """Test that api.fill_gaps processes cataloged files with their cataloged timeframe."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            path = self._write_dataset(
+                directory, "binance_spot_SOLUSDT-15m_20240101-20240101_v2.10.0.csv"
+            )
+            loose = self._write_dataset(directory, "ETHUSDT_4h_data.csv")
+            self._write_dataset(directory, "scratch.csv")
+
+            with patch.object(gcd.UniversalGapFiller, "process_file") as mock_process:
+                mock_process.return_value = {"gaps_detected": 0, "gaps_filled": 0}
+                results = gcd.fill_gaps(directory)
+
+            # Loose names with a timeframe are processed; names without one are skipped
+            assert sorted(call.args for call in mock_process.call_args_list) == sorted(
+                [(path, "15m"), (loose, "4h")]
+            )
+            assert results["files_processed"] == 2
+
+    def test_symbol_lookup_uses_catalog(self):
+        """Test that gap filling resolves symbols from the catalog before filename heuristics."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            path = self._write_dataset(directory, "custom_export.csv")
+            DatasetCatalog(directory).record_dataset(
+                path, "DOGEUSDT", "1h", "2024-01-01 00:00:00", "2024-01-01 23:00:00", 24, None
+            )
+
+            assert gcd.UniversalGapFiller().extract_symbol_from_filename(path) == "DOGEUSDT"
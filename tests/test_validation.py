@@ -0,0 +1,602 @@
+"""Test the fused OHLCV validation kernel and the streaming validator."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import gapless_crypto_data as gcd
+from gapless_crypto_data.collectors.binance_public_data_collector import BinancePublicDataCollector
+from gapless_crypto_data.storage import DatasetCatalog
+from gapless_crypto_data.validation import (
+    AnomalySketches,
+    CrossTimeframeValidator,
+    HeavyHitterSketch,
+    KLLSketch,
+    OHLCVValidationKernel,
+    StreamingOHLCVValidator,
+)
+
+
+def _ohlcv_frame(periods: int, freq: str = "1h") -> pd.DataFrame:
+    """Build a consistent OHLCV frame with text dates, as read from CSV."""
+    dates = pd.date_range("2024-01-01", periods=periods, freq=freq)
+    prices = np.linspace(100.0, 200.0, periods)
+    return pd.DataFrame(
+        {
+            "date": dates.strftime("%Y-%m-%d %H:%M:%S"),
+            "open": prices,
+            "high": prices + 2.0,
+            "low": prices - 2.0,
+            "close": prices + 1.0,
+            "volume": np.linspace(10.0, 20.0, periods),
+        }
+    )
+
+
+class TestOHLCVValidationKernel:
+    """Test suite for OHLCVValidationKernel."""
+
+    def test_gap_details(self):
+        """Test that every gap is found with the same details as the row-by-row check."""
+        df = _ohlcv_frame(24).drop([3, 4, 10]).reset_index(drop=True)
+
+        result = OHLCVValidationKernel(df, "1h").datetime_sequence()
+
+        assert result["gaps_found"] == 2
+        assert result["gap_details"] == [
+            {
+                "position": 3,
+                "expected_time": "2024-01-01T03:00:00",
+                "actual_time": "2024-01-01T05:00:00",
+                "gap_duration": "0 days 02:00:00",
+            },
+            {
+                "position": 8,
+                "expected_time": "2024-01-01T10:00:00",
+                "actual_time": "2024-01-01T11:00:00",
+                "gap_duration": "0 days 01:00:00",
+            },
+        ]
+        assert result["warnings"][0] == (
+            "Gap at position 3: expected 0 days 01:00:00, got 0 days 03:00:00"
+        )
+        assert result["warnings"][-1] == "2 timestamp gaps found (market closures or data issues)"
+        assert result["chronological_order"]
+        assert result["date_range"] == {
+            "start": "2024-01-01T00:00:00",
+            "end": "2024-01-01T23:00:00",
+        }
+
+    def test_unparseable_dates(self):
+        """Test that a date column that cannot be parsed is reported, not raised."""
+        df = _ohlcv_frame(3)
+        df["date"] = ["2024-01-01 00:00:00", "not a date", "2024-01-01 02:00:00"]
+
+        result = OHLCVValidationKernel(df, "1h").datetime_sequence()
+
+        assert result["status"] == "INVALID"
+        assert result["errors"][0].startswith("Failed to parse dates")
+
+    def test_quality_skips_missing_values(self):
+        """Test that statistics skip NaN like pandas reductions do."""
+        df = _ohlcv_frame(10)
+        df.loc[2, "high"] = np.nan
+        df.loc[4, "low"] = -1.0
+        df.loc[5, "volume"] = 0.0
+
+        result = OHLCVValidationKernel(df).ohlcv_quality()
+
+        assert result["status"] == "INVALID"
+        assert result["negative_zero_values"] == 1
+        assert result["price_range"] == {"min": -1.0, "max": df["high"].max()}
+        assert result["volume_stats"]["mean"] == df["volume"].mean()
+        assert "Found 1 zero volume bars" in result["warnings"]
+
+    def test_statistical_anomalies(self):
+        """Test IQR outliers and repeated-value detection."""
+        df = _ohlcv_frame(100)
+        df["open"] = 150.0
+        df.loc[0, "volume"] = 10_000.0
+
+        result = OHLCVValidationKernel(df).statistical_anomalies()
+
+        assert result["suspicious_patterns"] == 1
+        assert result["volume_outliers"] == 1
+        assert "Suspicious: open has 100 repeated values" in result["warnings"]
+
+    def test_statistical_anomalies_exact_at_scale(self):
+        """Test that in-memory outlier counts are exact beyond the sketch sizes."""
+        rng = np.random.default_rng(11)
+        rows = 400_000
+        prices = 100.0 + rng.normal(size=rows)
+        volume = rng.lognormal(size=rows)
+        df = pd.DataFrame(
+            {
+                "open": prices,
+                "high": prices + 1,
+                "low": prices - 1,
+                "close": prices,
+                "volume": volume,
+            }
+        )
+
+        result = OHLCVValidationKernel(df).statistical_anomalies()
+
+        q1, q3 = np.percentile(volume, [25, 75])
+        assert result["volume_outliers"] == np.count_nonzero(volume > q3 + 1.5 * (q3 - q1))
+
+    def test_validate_csv_file_parses_dates_once(self):
+        """Test that the full report is built from a single date parse."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "binance_spot_BTCUSDT-1h_20240101-20240102_v2.10.0.csv"
+            _ohlcv_frame(48).drop([20]).to_csv(csv_path, index=False)
+
+            collector = BinancePublicDataCollector(output_dir=temp_dir)
+            with patch("pandas.to_datetime", side_effect=pd.to_datetime) as to_datetime:
+                results = collector.validate_csv_file(csv_path, "1h")
+
+            assert to_datetime.call_count == 1
+            assert results["datetime_validation"]["gaps_found"] == 1
+            assert results["coverage_validation"]["actual_bars"] == 47
+            assert results["total_errors"] == 0
+            assert results["validation_summary"].startswith("GOOD")
+
+
+def _chunks(df: pd.DataFrame, chunk_rows: int):
+    return (df.iloc[start : start + chunk_rows] for start in range(0, len(df), chunk_rows))
+
+
+class TestStreamingOHLCVValidator:
+    """Test suite for StreamingOHLCVValidator."""
+
+    @pytest.mark.parametrize("chunk_rows", [1, 7, 50, 1000])
+    def test_matches_in_memory_report(self, chunk_rows):
+        """Test that chunked validation gives the in-memory report, gaps at chunk edges included."""
+        df = _ohlcv_frame(200).drop([6, 7, 49, 120]).reset_index(drop=True)
+        df.loc[10, "high"] = np.nan
+        df.loc[11, "low"] = 500.0
+        df.loc[30:60, "open"] = 150.0
+        df.loc[90, "volume"] = 0.0
+        df.loc[91, "volume"] = 10_000.0
+
+        validator = StreamingOHLCVValidator("1h")
+        validator.update_all(_chunks(df, chunk_rows))
+
+        expected = OHLCVValidationKernel(df, "1h").validate_all()
+        streamed = validator.validate_all()
+        # The running mean sums chunk by chunk, so it may differ in the last bits
+        assert streamed["ohlcv_validation"]["volume_stats"].pop("mean") == pytest.approx(
+            expected["ohlcv_validation"]["volume_stats"].pop("mean")
+        )
+        assert streamed == expected
+
+    def test_order_checked_across_chunks(self):
+        """Test that a timestamp going backwards at a chunk boundary is an error."""
+        df = _ohlcv_frame(10)
+        df = pd.concat([df.iloc[5:], df.iloc[:5]], ignore_index=True)
+
+        validator = StreamingOHLCVValidator("1h")
+        validator.update_all(_chunks(df, 5))
+
+        result = validator.datetime_sequence()
+        assert not result["chronological_order"]
+        assert "Timestamps are not in chronological order" in result["errors"]
+
+    def test_validate_csv_file_streams_chunks(self):
+        """Test that validate_csv_file never loads the whole file when streaming."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "binance_spot_BTCUSDT-1h_20240101-20240105_v2.10.0.csv"
+            df = _ohlcv_frame(96).drop([40])
+            with open(csv_path, "w") as f:
+                f.write("# header comment\n")
+                df.to_csv(f, index=False)
+
+            collector = BinancePublicDataCollector(output_dir=temp_dir)
+            with patch("pandas.read_csv", side_effect=pd.read_csv) as read_csv:
+                results = collector.validate_csv_file(csv_path, "1h", chunk_rows=10)
+
+            assert read_csv.call_args.kwargs["chunksize"] == 10
+            assert results["total_bars"] == 95
+            assert results["datetime_validation"]["gap_details"][0]["position"] == 40
+            assert results["coverage_validation"]["actual_bars"] == 95
+            assert results["validation_summary"].startswith("GOOD")
+
+
+class TestKLLSketch:
+    """Test suite for KLLSketch."""
+
+    def test_rank_error_bounded(self):
+        """Test that ranks and quartiles of a long stream stay within the error bound."""
+        rng = np.random.default_rng(7)
+        values = rng.lognormal(size=1_000_000)
+        sketch = KLLSketch(k=1024, seed=1)
+        for chunk in np.array_split(values, 37):
+            sketch.update(chunk)
+
+        assert sketch.count == len(values)
+        assert sum(len(level) for level in sketch._levels) < 4 * 1024
+        for fraction, estimate in zip([0.25, 0.75], sketch.quantiles([0.25, 0.75])):
+            assert np.mean(values < estimate) == pytest.approx(fraction, abs=0.005)
+        threshold = np.quantile(values, 0.99)
+        assert sketch.rank(threshold) == pytest.approx(np.sum(values < threshold), abs=5000)
+
+    def test_merge_matches_single_stream(self):
+        """Test that merged sketches answer like one sketch of the combined stream."""
+        rng = np.random.default_rng(3)
+        left, right = rng.normal(size=200_000), rng.normal(loc=5.0, size=100_000)
+        merged = KLLSketch(k=1024, seed=1)
+        merged.update(left)
+        other = KLLSketch(k=1024, seed=2)
+        other.update(right)
+        merged.merge(other)
+
+        combined = np.concatenate([left, right])
+        assert merged.count == len(combined)
+        assert merged.min_value == combined.min()
+        assert merged.rank(2.5) == pytest.approx(np.sum(combined < 2.5), abs=1500)
+
+
+class TestHeavyHitterSketch:
+    """Test suite for HeavyHitterSketch."""
+
+    def test_frequent_values_within_bound(self):
+        """Test that counts undercount by at most count / (capacity + 1)."""
+        rng = np.random.default_rng(5)
+        values = np.concatenate([rng.normal(size=300_000), np.full(40_000, 42.0)])
+        rng.shuffle(values)
+        sketch = HeavyHitterSketch(capacity=99)
+        for chunk in np.array_split(values, 13):
+            sketch.update(chunk)
+
+        assert sketch.error <= len(values) / 100
+        assert 40_000 - sketch.error <= sketch.estimate(42.0) <= 40_000
+        assert sketch.max_count() == sketch.estimate(42.0)
+        assert len(sketch._counters) <= 99
+
+    def test_merge_across_files(self):
+        """Test that merged summaries keep the bound over the combined stream."""
+        left, right = HeavyHitterSketch(capacity=9), HeavyHitterSketch(capacity=9)
+        left.update(np.concatenate([np.full(500, 1.0), np.arange(2.0, 300.0)]))
+        right.update(np.concatenate([np.full(400, 1.0), np.arange(300.0, 700.0)]))
+        left.merge(right)
+
+        assert left.count == 1598
+        assert left.error <= left.count / 10
+        assert 900 - left.error <= left.estimate(1.0) <= 900
+
+
+class TestAnomalySketches:
+    """Test suite for AnomalySketches."""
+
+    def test_thresholds_at_scale(self):
+        """Test that sketch-based outlier counts land close to the exact counts."""
+        rng = np.random.default_rng(11)
+        rows = 400_000
+        prices = 100.0 + rng.normal(size=rows)
+        volume = rng.lognormal(size=rows)
+        arrays = {"open": prices, "high": prices + 1, "low": prices - 1, "close": prices}
+        arrays["volume"] = volume
+
+        sketches = AnomalySketches()
+        sketches.update(arrays)
+        report = sketches.report()
+
+        q1, q3 = np.percentile(volume, [25, 75])
+        exact_volume_outliers = np.count_nonzero(volume > q3 + 1.5 * (q3 - q1))
+        assert report["volume_outliers"] == pytest.approx(exact_volume_outliers, abs=0.001 * rows)
+        assert report["volume_outliers"] > 0.02 * rows
+        assert any("volume outliers" in warning for warning in report["warnings"])
+        assert report["suspicious_patterns"] == 0
+
+    def test_merge_matches_concatenated_frames(self):
+        """Test that sketches of two files merge into the report of both together."""
+        first, second = _ohlcv_frame(60), _ohlcv_frame(40)
+        second["open"] = 150.0
+        second.loc[0, "volume"] = 10_000.0
+
+        sketches = OHLCVValidationKernel(first).anomaly_sketches()
+        sketches.merge(OHLCVValidationKernel(second).anomaly_sketches())
+
+        combined = pd.concat([first, second], ignore_index=True)
+        assert sketches.report() == OHLCVValidationKernel(combined).statistical_anomalies()
+        assert sketches.report()["suspicious_patterns"] == 1
+
+
+def _microstructure_frame(periods: int, freq: str, start: str = "2024-01-01") -> pd.DataFrame:
+    """Build an 11-column frame with irregular prices and volumes."""
+    rng = np.random.default_rng(17)
+    dates = pd.date_range(start, periods=periods, freq=freq)
+    opens = np.round(100.0 + np.cumsum(rng.normal(size=periods)), 2)
+    closes = np.round(opens + rng.normal(size=periods), 2)
+    volume = np.round(rng.lognormal(size=periods), 8)
+    return pd.DataFrame(
+        {
+            "date": dates.strftime("%Y-%m-%d %H:%M:%S"),
+            "open": opens,
+            "high": np.maximum(opens, closes) + 0.5,
+            "low": np.minimum(opens, closes) - 0.5,
+            "close": closes,
+            "volume": volume,
+            "close_time": (dates + pd.Timedelta(freq) - pd.Timedelta("1s")).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            ),
+            "quote_asset_volume": np.round(volume * closes, 8),
+            "number_of_trades": rng.integers(1, 500, size=periods),
+            "taker_buy_base_asset_volume": np.round(volume / 2, 8),
+            "taker_buy_quote_asset_volume": np.round(volume * closes / 2, 8),
+        }
+    )
+
+
+def _resample(fine: pd.DataFrame, freq: str) -> pd.DataFrame:
+    """Aggregate a fine frame the way Binance builds coarser klines."""
+    indexed = fine.assign(date=pd.to_datetime(fine["date"])).set_index("date")
+    coarse = indexed.resample(freq).agg(
+        {
+            "open": "first",
+            "high": "max",
+            "low": "min",
+            "close": "last",
+            "volume": "sum",
+            "close_time": "last",
+            "quote_asset_volume": "sum",
+            "number_of_trades": "sum",
+            "taker_buy_base_asset_volume": "sum",
+            "taker_buy_quote_asset_volume": "sum",
+        }
+    )
+    coarse = coarse.reset_index()
+    coarse["date"] = coarse["date"].dt.strftime("%Y-%m-%d %H:%M:%S")
+    return coarse
+
+
+class TestCrossTimeframeValidator:
+    """Test suite for CrossTimeframeValidator."""
+
+    @pytest.mark.parametrize("chunk_rows", [50, 500, 100_000])
+    def test_consistent_files(self, chunk_rows):
+        """Test that a finer file and its own aggregate agree, whatever the chunking."""
+        fine = _microstructure_frame(3 * 24 * 60, "1min")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fine_csv, coarse_csv = Path(temp_dir) / "1m.csv", Path(temp_dir) / "1h.csv"
+            fine.to_csv(fine_csv, index=False)
+            _resample(fine, "1h").to_csv(coarse_csv, index=False)
+
+            result = CrossTimeframeValidator("1m", "1h", chunk_rows).validate(fine_csv, coarse_csv)
+
+        assert result["status"] == "VALID", result["errors"]
+        assert result["bars_compared"] == 72
+
+    @pytest.mark.parametrize("chunk_rows", [50, 100_000])
+    def test_flags_discrepancies(self, chunk_rows):
+        """Test that a missing minute, a wrong high and a missing hour are each reported."""
+        fine = _microstructure_frame(3 * 24 * 60, "1min")
+        coarse = _resample(fine, "1h")
+        coarse.loc[5, "high"] += 1.0
+        coarse = coarse.drop([40]).reset_index(drop=True)
+        fine = fine.drop([10 * 60 + 17]).reset_index(drop=True)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fine_csv, coarse_csv = Path(temp_dir) / "1m.csv", Path(temp_dir) / "1h.csv"
+            fine.to_csv(fine_csv, index=False)
+            coarse.to_csv(coarse_csv, index=False)
+
+            result = CrossTimeframeValidator("1m", "1h", chunk_rows).validate(fine_csv, coarse_csv)
+
+        assert result["status"] == "INVALID"
+        assert result["bars_compared"] == 71
+        assert result["incomplete_bars"] == 1
+        assert result["missing_in_coarse"] == 1
+        assert result["missing_in_fine"] == 0
+        assert result["column_mismatches"]["high"] == 1
+        assert result["column_mismatches"]["volume"] == 1
+        details = {discrepancy["date"]: discrepancy for discrepancy in result["discrepancies"]}
+        assert details["2024-01-01T05:00:00"]["columns"]["high"]["coarse"] == (
+            details["2024-01-01T05:00:00"]["columns"]["high"]["fine"] + 1.0
+        )
+        assert details["2024-01-01T10:00:00"]["fine_bars"] == 59
+        assert details["2024-01-02T16:00:00"] == {
+            "date": "2024-01-02T16:00:00",
+            "missing_from": "1h",
+        }
+
+    def test_edges_outside_overlap_are_skipped(self):
+        """Test that partial buckets at file edges and non-overlapping bars are not errors."""
+        fine = _microstructure_frame(48 * 3600, "1s", start="2024-01-01 12:00:00")
+        coarse = _resample(_microstructure_frame(4 * 24 * 3600, "1s"), "1D")
+        coarse.loc[1, ["open", "high", "low", "close"]] = (
+            _resample(fine, "1D").loc[1, ["open", "high", "low", "close"]].to_numpy()
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fine_csv, coarse_csv = Path(temp_dir) / "1s.csv", Path(temp_dir) / "1d.csv"
+            fine.to_csv(fine_csv, index=False)
+            coarse.to_csv(coarse_csv, index=False)
+
+            result = CrossTimeframeValidator("1s", "1d", 50_000).validate(fine_csv, coarse_csv)
+
+        # Only 2024-01-02 is fully inside the 1s file
+        assert result["bars_compared"] == 1
+        assert result["missing_in_fine"] == result["missing_in_coarse"] == 0
+        assert set(result["column_mismatches"]) >= {"volume", "number_of_trades"}
+        assert "open" not in result["column_mismatches"]
+
+    @pytest.mark.parametrize("dropped_row", [5, 65, 175])
+    def test_missing_bar_in_edge_bucket(self, dropped_row):
+        """Test that a bar missing inside the first or last bucket is reported."""
+        fine = _microstructure_frame(3 * 60, "1min")
+        coarse = _resample(fine, "1h")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fine_csv, coarse_csv = Path(temp_dir) / "1m.csv", Path(temp_dir) / "1h.csv"
+            fine.drop([dropped_row]).to_csv(fine_csv, index=False)
+            coarse.to_csv(coarse_csv, index=False)
+
+            result = CrossTimeframeValidator("1m", "1h").validate(fine_csv, coarse_csv)
+
+        assert result["status"] == "INVALID"
+        assert result["bars_compared"] == 3
+        assert result["incomplete_bars"] == 1
+
+    def test_rejects_incompatible_timeframes(self):
+        """Test that timeframes that do not nest are rejected."""
+        with pytest.raises(ValueError):
+            CrossTimeframeValidator("1h", "1m")
+        with pytest.raises(ValueError):
+            CrossTimeframeValidator("3m", "5m")
+
+
+class TestValidationCache:
+    """Test suite for reusing stored validation results."""
+
+    def _validated_file(self, temp_dir):
+        csv_path = Path(temp_dir) / "binance_spot_BTCUSDT-1h_20240101-20240102_v2.10.0.csv"
+        _ohlcv_frame(48).to_csv(csv_path, index=False)
+        # Older than the racy window, as an archived file would be
+        os.utime(csv_path, ns=(1_700_000_000 * 10**9,) * 2)
+
+        collector = BinancePublicDataCollector(output_dir=temp_dir)
+        results = collector.validate_csv_file(csv_path, "1h")
+        collector.update_metadata_with_validation(csv_path, results)
+        return collector, csv_path, results
+
+    def test_unchanged_file_is_not_read(self):
+        """Test that a stored report is returned without reading or hashing the file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector, csv_path, results = self._validated_file(temp_dir)
+
+            with (
+                patch("pandas.read_csv") as read_csv,
+                patch("gapless_crypto_data.validation.cache.file_sha256") as file_sha256,
+            ):
+                cached = collector.validate_csv_file(csv_path, "1h")
+
+            read_csv.assert_not_called()
+            file_sha256.assert_not_called()
+            assert cached["validation_timestamp"] == results["validation_timestamp"]
+            assert cached["validation_summary"] == results["validation_summary"]
+
+    def test_touched_file_is_rehashed(self):
+        """Test that a new timestamp on the same bytes costs a hash, not a validation."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector, csv_path, results = self._validated_file(temp_dir)
+            os.utime(csv_path, ns=(1_700_000_100 * 10**9,) * 2)
+
+            with patch("pandas.read_csv") as read_csv:
+                cached = collector.validate_csv_file(csv_path, "1h")
+
+            read_csv.assert_not_called()
+            assert cached["cache_key"]["mtime_ns"] == 1_700_000_100 * 10**9
+
+    def test_changes_invalidate(self):
+        """Test that new content, another timeframe or use_cache=False revalidate."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector, csv_path, results = self._validated_file(temp_dir)
+
+            for kwargs in ({"expected_timeframe": "2h"}, {"use_cache": False}):
+                fresh = collector.validate_csv_file(
+                    csv_path, **{"expected_timeframe": "1h", **kwargs}
+                )
+                assert fresh["validation_timestamp"] != results["validation_timestamp"]
+
+            _ohlcv_frame(48).drop([10]).to_csv(csv_path, index=False)
+            os.utime(csv_path, ns=(1_700_000_000 * 10**9,) * 2)
+            fresh = collector.validate_csv_file(csv_path, "1h")
+            assert fresh["datetime_validation"]["gaps_found"] == 1
+
+
+class TestValidateDirectory:
+    """Test suite for directory-wide validation."""
+
+    def _write_archive(self, temp_dir):
+        for symbol in ["BTCUSDT", "ETHUSDT"]:
+            csv_path = Path(temp_dir) / f"binance_spot_{symbol}-1h_20240101-20240102_v2.10.0.csv"
+            _ohlcv_frame(48).to_csv(csv_path, index=False)
+        broken = _ohlcv_frame(48)
+        broken.loc[5, "high"] = 0.0
+        broken.to_csv(
+            Path(temp_dir) / "binance_spot_SOLUSDT-1h_20240101-20240102_v2.10.0.csv", index=False
+        )
+        for csv_path in Path(temp_dir).glob("*.csv"):
+            os.utime(csv_path, ns=(1_700_000_000 * 10**9,) * 2)
+
+    def test_validates_in_process_pool_and_saves_results(self):
+        """Test that files are validated by workers and results land in metadata."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._write_archive(temp_dir)
+
+            results = gcd.validate_directory(temp_dir, max_workers=2)
+
+            assert results["files_validated"] == 3
+            assert results["files_cached"] == 0
+            assert results["files_passed"] == 2
+            assert results["files_failed"] == 1
+            failed = results["file_results"][
+                "binance_spot_SOLUSDT-1h_20240101-20240102_v2.10.0.csv"
+            ]
+            assert failed["validation_summary"].startswith("FAILED")
+            for csv_path in Path(temp_dir).glob("*.csv"):
+                metadata = json.loads(csv_path.with_suffix(".metadata.json").read_text())
+                assert metadata["validation"]["cache_key"]["file_size"] == csv_path.stat().st_size
+
+    def test_stable_archive_answered_from_metadata(self):
+        """Test that a second run over unchanged files starts no workers."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._write_archive(temp_dir)
+            gcd.validate_directory(temp_dir, max_workers=1)
+
+            with (
+                patch("gapless_crypto_data.api.ProcessPoolExecutor") as pool,
+                patch("gapless_crypto_data.api._validate_file") as validate_file,
+            ):
+                results = gcd.validate_directory(temp_dir)
+
+            pool.assert_not_called()
+            validate_file.assert_not_called()
+            assert results["files_cached"] == 3
+            assert results["files_failed"] == 1
+
+    def test_files_added_after_catalog_are_validated(self):
+        """Test that CSVs unknown to an existing catalog are still validated."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._write_archive(temp_dir)
+            gcd.validate_directory(temp_dir, max_workers=1)
+
+            _ohlcv_frame(48).to_csv(
+                Path(temp_dir) / "binance_spot_BNBUSDT-1h_20240101-20240102_v2.10.0.csv",
+                index=False,
+            )
+            _ohlcv_frame(48).to_csv(Path(temp_dir) / "XRPUSDT_1h_export.csv", index=False)
+
+            results = gcd.validate_directory(temp_dir, max_workers=1)
+
+            assert results["files_cached"] == 3
+            assert results["files_validated"] == 5
+            assert "XRPUSDT_1h_export.csv" in results["file_results"]
+
+    def test_errored_results_are_saved_but_not_cached(self):
+        """Test that a validation that raised replaces the stored status and is retried."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._write_archive(temp_dir)
+            gcd.validate_directory(temp_dir, max_workers=1)
+            csv_path = Path(temp_dir) / "binance_spot_BTCUSDT-1h_20240101-20240102_v2.10.0.csv"
+
+            with patch(
+                "gapless_crypto_data.api._validate_file", side_effect=RuntimeError("disk error")
+            ):
+                results = gcd.validate_directory(temp_dir, max_workers=1, use_cache=False)
+
+            assert results["files_failed"] == 3
+            metadata = json.loads(csv_path.with_suffix(".metadata.json").read_text())
+            assert metadata["validation"]["validation_summary"] == "ERROR - disk error"
+            assert DatasetCatalog(temp_dir).get(csv_path).validation_status == "ERROR"
+
+            # Without a cache_key the errors are not reused on the next run
+            results = gcd.validate_directory(temp_dir, max_workers=1)
+
+            assert results["files_cached"] == 0
+            assert DatasetCatalog(temp_dir).get(csv_path).validation_status == "PERFECT"